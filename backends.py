@@ -0,0 +1,329 @@
+import ast
+import hashlib
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+from PIL import Image
+
+try:
+    import cv2
+except ImportError:  # opencv 가 없으면 PIL 로 리사이즈
+    cv2 = None
+
+
+# -----------------------------
+# 추론 백엔드 (설정으로 선택)
+#   - torch: ultralytics YOLO (PyTorch 그래프 그대로)
+#   - onnx : export 한 .onnx 모델을 ONNX Runtime(CPU)으로 실행
+#            전처리(letterbox) / 후처리(NMS)는 여기서 NumPy 로 직접 구현
+#   - onnx-int8: tools/quantize.py 로 만든 INT8 모델 (정확도 게이트 통과한 것만 로딩)
+# 두 백엔드 모두 이미지 리스트 → Detections 리스트 (같은 순서)를 돌려줌
+# set_filter(classes, conf) 로 필요한 클래스 / 신뢰도 기준을 모델 호출 안으로 넘김
+#   → 관계없는 클래스(사람, 의자 등)는 NMS 전에 빠짐
+# 입력 numpy 배열의 채널 순서는 ultralytics 규칙을 그대로 따름 (BGR 로 간주)
+# thread_safe: 인스턴스 하나를 여러 스레드에서 동시에 호출해도 되는지
+#   - onnx / onnx-int8: ONNX Runtime InferenceSession.run 은 동시 호출 가능 → 추론 워커 여러 개가 공유
+#   - torch: ultralytics YOLO 는 predictor 상태를 들고 있어서 동시 호출 불가 → 추론 워커 1개만
+# -----------------------------
+Detections = namedtuple("Detections", ["xyxy", "conf", "cls"])
+# xyxy: (N, 4) float32 원본 이미지 좌표, conf: (N,) float32, cls: (N,) int64
+
+
+def empty_detections() -> Detections:
+    return Detections(
+        np.zeros((0, 4), dtype=np.float32),
+        np.zeros(0, dtype=np.float32),
+        np.zeros(0, dtype=np.int64),
+    )
+
+
+class TorchBackend:
+    name = "torch"
+    thread_safe = False
+
+    def __init__(self, model_path, imgsz=640, conf=0.25, iou=0.7, max_det=300, threads=None):
+        import torch
+        from ultralytics import YOLO
+
+        if threads:
+            torch.set_num_threads(threads)
+
+        self.model = YOLO(model_path)
+        self.names = self.model.names
+        self.imgsz = imgsz
+        self.conf = conf
+        self.iou = iou
+        self.max_det = max_det
+        self.classes = None  # None 이면 전체 클래스
+
+    def set_filter(self, classes=None, conf=None):
+        self.classes = None if classes is None else sorted(int(c) for c in classes)
+        if conf is not None:
+            self.conf = conf
+
+    def __call__(self, images):
+        results = self.model(
+            images,
+            imgsz=self.imgsz,
+            conf=self.conf,
+            iou=self.iou,
+            max_det=self.max_det,
+            classes=self.classes,
+            verbose=False,
+        )
+        out = []
+        for r in results:
+            if r.boxes is None:
+                out.append(empty_detections())
+                continue
+            out.append(
+                Detections(
+                    r.boxes.xyxy.cpu().numpy().astype(np.float32),
+                    r.boxes.conf.cpu().numpy().astype(np.float32),
+                    r.boxes.cls.cpu().numpy().astype(np.int64),
+                )
+            )
+        return out
+
+
+class OnnxBackend:
+    name = "onnx"
+    thread_safe = True
+
+    def __init__(self, model_path, imgsz=640, conf=0.25, iou=0.7, max_det=300, threads=None):
+        import onnxruntime as ort
+
+        opts = ort.SessionOptions()
+        if threads:
+            opts.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(model_path, opts, providers=["CPUExecutionProvider"])
+
+        # ultralytics export 는 클래스 이름 / imgsz 를 메타데이터에 넣어둠
+        meta = self.session.get_modelmeta().custom_metadata_map
+        self.names = ast.literal_eval(meta["names"]) if "names" in meta else {}
+
+        inp = self.session.get_inputs()[0]
+        self.input_name = inp.name
+        batch_dim, _, h, _ = inp.shape
+        self.imgsz = h if isinstance(h, int) else imgsz
+        # batch 차원이 고정(1)이면 한 장씩 돌림 (dynamic=True 로 export 하면 진짜 배치)
+        self.fixed_batch = batch_dim if isinstance(batch_dim, int) else None
+        # 입력 크기가 가변이면 ultralytics 처럼 stride 배수까지만 패딩 (정사각형 대신 직사각형)
+        self.dynamic_hw = not isinstance(h, int)
+
+        self.conf = conf
+        self.iou = iou
+        self.max_det = max_det
+        self.classes = None
+        self.class_mask = None  # (nc,) bool, True 인 클래스만 NMS 로 넘김
+
+    def set_filter(self, classes=None, conf=None):
+        if classes is None:
+            self.classes = self.class_mask = None
+        else:
+            self.classes = sorted(int(c) for c in classes)
+            num_classes = max([len(self.names), *(c + 1 for c in self.classes)])
+            mask = np.zeros(num_classes, dtype=bool)
+            mask[self.classes] = True
+            self.class_mask = mask
+        if conf is not None:
+            self.conf = conf
+
+    def __call__(self, images):
+        if not images:
+            return []
+        same_shape = all(img.shape == images[0].shape for img in images)
+        batch, metas = letterbox_batch(images, self.imgsz, auto=self.dynamic_hw and same_shape)
+
+        if self.fixed_batch == 1:
+            preds = [self.session.run(None, {self.input_name: batch[i:i + 1]})[0][0] for i in range(len(images))]
+        else:
+            preds = self.session.run(None, {self.input_name: batch})[0]
+
+        return [
+            postprocess(preds[i], metas[i], self.conf, self.iou, self.max_det, self.class_mask)
+            for i in range(len(images))
+        ]
+
+
+class Int8OnnxBackend(OnnxBackend):
+    name = "onnx-int8"
+
+    def __init__(self, model_path, **kwargs):
+        # 양자화 도구가 남긴 리포트에서 promoted=true 이고, 승격한 파일과 해시가 같은 모델만 허용
+        report = load_quant_report(model_path)
+        if not report.get("promoted"):
+            raise RuntimeError(
+                f"{model_path} 는 정확도 게이트를 통과하지 않았습니다 "
+                f"({quant_report_path(model_path)} 없음 또는 promoted=false)"
+            )
+        if report.get("modelSha256") != model_file_hash(model_path):
+            raise RuntimeError(
+                f"{model_path} 가 승격된 모델과 다릅니다 "
+                f"({quant_report_path(model_path)} 의 modelSha256 불일치, python -m tools.quantize 로 다시 만들어 주세요)"
+            )
+        super().__init__(model_path, **kwargs)
+        self.quant_report = {k: report.get(k) for k in ("map50", "top1ClassAgreement", "minMap")}
+
+
+BACKENDS = {"torch": TorchBackend, "onnx": OnnxBackend, "onnx-int8": Int8OnnxBackend}
+DEFAULT_MODEL_PATHS = {"torch": "yolov8n.pt", "onnx": "yolov8n.onnx", "onnx-int8": "yolov8n.int8.onnx"}
+
+
+def backend_class(kind):
+    try:
+        return BACKENDS[kind]
+    except KeyError:
+        raise ValueError(f"알 수 없는 백엔드: {kind} (가능: {', '.join(BACKENDS)})") from None
+
+
+def load_backend(kind, model_path, **kwargs):
+    return backend_class(kind)(model_path, **kwargs)
+
+
+def quant_report_path(model_path):
+    return os.path.splitext(model_path)[0] + ".report.json"
+
+
+def model_file_hash(path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_quant_report(model_path) -> dict:
+    try:
+        with open(quant_report_path(model_path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def export_onnx(pt_path, imgsz=640, dynamic=True):
+    """PyTorch 가중치 → ONNX (dynamic=True 면 배치 크기 가변)"""
+    from ultralytics import YOLO
+
+    return YOLO(pt_path).export(format="onnx", imgsz=imgsz, dynamic=dynamic, simplify=True)
+
+
+# -----------------------------
+# 전처리: letterbox (ultralytics LetterBox 와 같은 규칙)
+#   - 긴 변 기준으로 비율 유지 리사이즈 → 114 회색으로 패딩
+#     (auto=True 면 정사각형 대신 stride 배수까지만 패딩)
+#   - BGR → RGB, HWC → CHW, 0~1 float32
+# -----------------------------
+LetterboxMeta = namedtuple("LetterboxMeta", ["gain", "pad_x", "pad_y", "width", "height"])
+
+
+def letterbox_batch(images, imgsz, auto=False, stride=32):
+    out_h = out_w = imgsz
+    if auto:
+        # 모든 이미지가 같은 크기일 때만 사용 → 출력 크기도 하나
+        h, w = images[0].shape[:2]
+        gain = min(imgsz / h, imgsz / w)
+        new_w, new_h = int(round(w * gain)), int(round(h * gain))
+        out_w = new_w + (imgsz - new_w) % stride
+        out_h = new_h + (imgsz - new_h) % stride
+
+    batch = np.full((len(images), out_h, out_w, 3), 114, dtype=np.uint8)
+    metas = []
+    for i, img in enumerate(images):
+        h, w = img.shape[:2]
+        gain = min(imgsz / h, imgsz / w)
+        new_w, new_h = int(round(w * gain)), int(round(h * gain))
+        pad_x = int(round((out_w - new_w) / 2 - 0.1))
+        pad_y = int(round((out_h - new_h) / 2 - 0.1))
+
+        if (new_w, new_h) != (w, h):
+            if cv2 is not None:
+                resized = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+            else:
+                resized = np.asarray(Image.fromarray(img).resize((new_w, new_h), Image.BILINEAR))
+        else:
+            resized = img
+
+        batch[i, pad_y:pad_y + new_h, pad_x:pad_x + new_w] = resized
+        metas.append(LetterboxMeta(gain, pad_x, pad_y, w, h))
+
+    # (B, H, W, 3) BGR uint8 → (B, 3, H, W) RGB float32
+    x = batch[..., ::-1].transpose(0, 3, 1, 2)
+    x = np.ascontiguousarray(x, dtype=np.float32)
+    x *= 1.0 / 255.0
+    return x, metas
+
+
+# -----------------------------
+# 후처리: YOLOv8 출력 (4 + nc, N) → 클래스별 NMS → 원본 좌표
+# -----------------------------
+MAX_WH = 7680  # 클래스별 NMS 를 한 번에 하기 위한 좌표 오프셋 (ultralytics 와 동일)
+
+
+def postprocess(pred, meta, conf_thres=0.25, iou_thres=0.7, max_det=300, class_mask=None):
+    pred = pred.T  # (N, 4 + nc)
+    scores = pred[:, 4:]
+
+    cls = scores.argmax(axis=1)
+    conf = scores[np.arange(len(scores)), cls]
+    keep = conf > conf_thres
+    if class_mask is not None:
+        # ultralytics classes= 와 같은 규칙: 최고 점수 클래스가 목록에 있는 후보만 NMS 로
+        if len(class_mask) < scores.shape[1]:
+            class_mask = np.pad(class_mask, (0, scores.shape[1] - len(class_mask)))
+        keep &= class_mask[cls]
+    if not keep.any():
+        return empty_detections()
+
+    boxes = pred[keep, :4]
+    conf = conf[keep]
+    cls = cls[keep]
+
+    # cx, cy, w, h → x1, y1, x2, y2
+    xyxy = np.empty_like(boxes)
+    half_w = boxes[:, 2] / 2
+    half_h = boxes[:, 3] / 2
+    xyxy[:, 0] = boxes[:, 0] - half_w
+    xyxy[:, 1] = boxes[:, 1] - half_h
+    xyxy[:, 2] = boxes[:, 0] + half_w
+    xyxy[:, 3] = boxes[:, 1] + half_h
+
+    keep = nms(xyxy + (cls[:, None] * MAX_WH), conf, iou_thres, max_det)
+    xyxy, conf, cls = xyxy[keep], conf[keep], cls[keep]
+
+    # letterbox 좌표 → 원본 이미지 좌표
+    xyxy[:, [0, 2]] -= meta.pad_x
+    xyxy[:, [1, 3]] -= meta.pad_y
+    xyxy /= meta.gain
+    xyxy[:, [0, 2]] = xyxy[:, [0, 2]].clip(0, meta.width)
+    xyxy[:, [1, 3]] = xyxy[:, [1, 3]].clip(0, meta.height)
+
+    return Detections(xyxy.astype(np.float32), conf.astype(np.float32), cls.astype(np.int64))
+
+
+def box_iou(box, boxes):
+    """박스 1개와 여러 박스의 IoU (벡터화)"""
+    x1 = np.maximum(box[0], boxes[:, 0])
+    y1 = np.maximum(box[1], boxes[:, 1])
+    x2 = np.minimum(box[2], boxes[:, 2])
+    y2 = np.minimum(box[3], boxes[:, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area = (box[2] - box[0]) * (box[3] - box[1])
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    return inter / (area + areas - inter + 1e-9)
+
+
+def nms(boxes, scores, iou_thres, max_det=300):
+    """그리디 NMS → 남길 인덱스 (점수 내림차순, max_det 개 채우면 바로 종료)"""
+    order = scores.argsort()[::-1]
+    keep = []
+    while order.size:
+        i = order[0]
+        keep.append(i)
+        if order.size == 1 or len(keep) >= max_det:
+            break
+        ious = box_iou(boxes[i], boxes[order[1:]])
+        order = order[1:][ious <= iou_thres]
+    return np.array(keep, dtype=np.int64)
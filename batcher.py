@@ -0,0 +1,173 @@
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+
+
+# -----------------------------
+# 동적 마이크로 배칭 스케줄러
+#   - 동시에 들어온 /predict 요청들을 모아서 YOLO 를 한 번에 호출
+#   - max_batch_size 만큼 모이거나 max_wait_ms 가 지나면 바로 실행
+#   - 각 요청은 Future 로 자기 결과(Results)만 돌려받음
+#   - executor 를 넘기면 배치 실행은 그 풀에서 (동시에 max_inflight 개까지)
+# -----------------------------
+class QueueFullError(RuntimeError):
+    """대기열이 가득 차서 요청을 받을 수 없을 때"""
+
+
+class InferenceBatcher:
+    def __init__(
+        self,
+        infer_fn,
+        max_batch_size=8,
+        max_wait_ms=10.0,
+        queue_depth=64,
+        executor=None,
+        max_inflight=1,
+    ):
+        # infer_fn: 이미지 리스트 → 결과 리스트 (같은 순서)
+        self._infer_fn = infer_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_ms = max(0.0, float(max_wait_ms))
+        self.queue_depth = max(1, int(queue_depth))
+
+        # 추론 전용 풀 (없으면 수집 스레드에서 바로 실행)
+        self._executor = executor
+        self.max_inflight = max(1, int(max_inflight)) if executor is not None else 1
+        self._slots = threading.BoundedSemaphore(self.max_inflight)
+
+        self._queue = queue.Queue(maxsize=self.queue_depth)
+        self._stop = threading.Event()
+
+        # 지표 (metrics)
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._images = 0
+        self._rejected = 0
+        self._errors = 0
+        self._batch_sizes = Counter()
+        self._infer_ms_total = 0.0
+        self._latencies_ms = deque(maxlen=2048)  # 대기 + 추론 시간 (최근 N개)
+
+        self._thread = threading.Thread(target=self._run, name="yolo-batcher", daemon=True)
+        self._thread.start()
+
+    # -----------------------------
+    # 요청 제출
+    # -----------------------------
+    def submit(self, img) -> Future:
+        fut = Future()
+        try:
+            self._queue.put_nowait((img, fut, time.perf_counter()))
+        except queue.Full:
+            with self._lock:
+                self._rejected += 1
+            raise QueueFullError(f"추론 대기열이 가득 찼습니다 (queue_depth={self.queue_depth})")
+        return fut
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+
+    # -----------------------------
+    # 배치 수집 루프 (전용 스레드)
+    # -----------------------------
+    def _run(self):
+        while not self._stop.is_set():
+            # 추론 슬롯이 빌 때까지 기다리는 동안 요청은 대기열에 쌓여서 더 큰 배치가 됨
+            if not self._slots.acquire(timeout=0.1):
+                continue
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                self._slots.release()
+                continue
+
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            if self._executor is None:
+                self._run_batch(batch)
+            else:
+                try:
+                    self._executor.submit(self._run_batch, batch)
+                except RuntimeError as e:  # 풀이 이미 종료됨
+                    self._slots.release()
+                    for _, fut, _ in batch:
+                        if fut.set_running_or_notify_cancel():
+                            fut.set_exception(e)
+
+    def _run_batch(self, batch):
+        try:
+            self._run_batch_inner(batch)
+        finally:
+            self._slots.release()
+
+    def _run_batch_inner(self, batch):
+        # 이미 취소된 요청은 빼고 실행
+        batch = [entry for entry in batch if entry[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        imgs = [img for img, _, _ in batch]
+        t0 = time.perf_counter()
+        try:
+            results = self._infer_fn(imgs)
+        except BaseException as e:
+            with self._lock:
+                self._errors += 1
+            for _, fut, _ in batch:
+                fut.set_exception(e)
+            return
+        t1 = time.perf_counter()
+
+        for (_, fut, _), res in zip(batch, results):
+            fut.set_result(res)
+
+        with self._lock:
+            self._batches += 1
+            self._images += len(batch)
+            self._batch_sizes[len(batch)] += 1
+            self._infer_ms_total += (t1 - t0) * 1000.0
+            for _, _, enqueued in batch:
+                self._latencies_ms.append((t1 - enqueued) * 1000.0)
+
+    # -----------------------------
+    # 지표 (/metrics 에서 사용)
+    # -----------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            lat = sorted(self._latencies_ms)
+            batches = self._batches
+
+            def pct(p):
+                if not lat:
+                    return 0.0
+                return round(lat[min(len(lat) - 1, int(p * len(lat)))], 2)
+
+            return {
+                "config": {
+                    "maxBatchSize": self.max_batch_size,
+                    "maxWaitMs": self.max_wait_ms,
+                    "queueDepth": self.queue_depth,
+                    "maxInflightBatches": self.max_inflight,
+                },
+                "queued": self._queue.qsize(),
+                "batches": batches,
+                "images": self._images,
+                "rejected": self._rejected,
+                "errors": self._errors,
+                "avgBatchSize": round(self._images / batches, 2) if batches else 0.0,
+                "batchSizeHistogram": dict(sorted(self._batch_sizes.items())),
+                "avgInferMs": round(self._infer_ms_total / batches, 2) if batches else 0.0,
+                "latencyMs": {"p50": pct(0.50), "p90": pct(0.90), "p99": pct(0.99)},
+            }
@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+
+# -----------------------------
+# 실시간 카메라 (WebSocket) 보조
+#   - LatestFrame: 연결 하나의 대기 프레임 1칸
+#       추론 중에 들어온 프레임은 이 칸에 덮어씀 → 추론이 끝나면 가장 최근 프레임 하나만 처리
+#       (밀린 프레임을 차례로 처리하지 않음, 덮어쓴 프레임 수는 dropped)
+#   - CameraLimiter: 서버 전체 동시 연결 수 상한 + 연결당 초당 추론 횟수(fps) 상한 + 통계
+#       연결당 추론은 항상 1개씩만 진행되므로, 동시 추론 수는 최대 연결 수를 넘지 않음
+# -----------------------------
+class LatestFrame:
+    def __init__(self):
+        self._frame = None
+        self._seq = 0
+        self._event = asyncio.Event()
+        self._closed = False
+        self.received = 0
+        self.dropped = 0
+
+    def put(self, frame: bytes) -> int:
+        """새 프레임 넣기 (처리 안 된 이전 프레임은 버림) → 프레임 번호"""
+        self.received += 1
+        if self._frame is not None:
+            self.dropped += 1
+        self._frame = frame
+        self._seq = self.received
+        self._event.set()
+        return self._seq
+
+    async def get(self):
+        """다음 프레임 (번호, 데이터). 연결이 닫혔으면 None"""
+        while self._frame is None:
+            if self._closed:
+                return None
+            await self._event.wait()
+            self._event.clear()
+        frame, self._frame = self._frame, None
+        return self._seq, frame
+
+    def close(self):
+        self._closed = True
+        self._event.set()
+
+
+class CameraLimiter:
+    def __init__(self, max_connections: int = 8, max_fps: float = 5.0):
+        self.max_connections = max_connections
+        self.max_fps = max_fps
+        self._open = set()
+        self.accepted = 0
+        self.rejected = 0
+        self.frames_processed = 0
+        self.frames_tracked = 0  # 추적 모드에서 YOLO 없이 박스만 옮겨서 응답한 프레임
+        # 끝난 연결의 프레임 수 (진행 중인 연결은 stats() 에서 더함)
+        self._closed_received = 0
+        self._closed_dropped = 0
+
+    def open(self):
+        """새 연결의 프레임 칸 (동시 연결 수 상한이면 None)
+        이벤트 루프 안에서만 호출 (await 없음 → 락 필요 없음)"""
+        if len(self._open) >= self.max_connections:
+            self.rejected += 1
+            return None
+        frames = LatestFrame()
+        self._open.add(frames)
+        self.accepted += 1
+        return frames
+
+    def close(self, frames: LatestFrame):
+        frames.close()
+        if frames in self._open:
+            self._open.discard(frames)
+            self._closed_received += frames.received
+            self._closed_dropped += frames.dropped
+
+    async def pace(self, last_start: float) -> float:
+        """직전 추론 시작 시각 기준으로 fps 상한까지 기다림 → 이번 추론 시작 시각"""
+        if self.max_fps > 0:
+            wait = last_start + 1.0 / self.max_fps - time.perf_counter()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        return time.perf_counter()
+
+    def stats(self) -> dict:
+        open_frames = tuple(self._open)  # /metrics 는 다른 스레드에서 호출됨
+        return {
+            "config": {"maxConnections": self.max_connections, "maxFps": self.max_fps},
+            "active": len(self._open),
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "framesReceived": self._closed_received + sum(f.received for f in open_frames),
+            "framesDropped": self._closed_dropped + sum(f.dropped for f in open_frames),
+            "framesProcessed": self.frames_processed,
+            "framesTracked": self.frames_tracked,
+        }
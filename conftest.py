@@ -0,0 +1 @@
+# 저장소 루트를 sys.path 에 넣어서 tests/ 에서 최상위 모듈(food_index 등)을 바로 import
@@ -0,0 +1,50 @@
+import numpy as np
+
+
+# -----------------------------
+# 클래스가 다른 중복 검출 제거 (합계 내기 전에)
+#   - 모델의 NMS 는 클래스별이라 같은 음식이 두 클래스로 남을 수 있음
+#     (예: 빵 하나가 cake 0.6 / donut 0.5 로 거의 같은 박스)
+#   - 남은 음식 박스끼리 IoU 를 한 번에 (K, K) 행렬로 계산하고,
+#     IoU >= iou_thres 이면서 같은 그룹(테이블 category 가 같음 = 한 접시에 겹쳐 있을 수 없는 관계)인 쌍은
+#     신뢰도 높은 쪽만 남김 (그리디, NMS 와 같은 순서)
+#   - 그룹이 다르면 겹쳐도 둘 다 남김 (밥 위의 반찬, 케이크 옆 음료 등)
+# -----------------------------
+def iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """박스 (N, 4) x (M, 4) → IoU 행렬 (N, M)"""
+    a = np.asarray(a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(b, dtype=np.float64).reshape(-1, 4)
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    return inter / (area_a[:, None] + area_b[None, :] - inter + 1e-9)
+
+
+def pairwise_iou(boxes: np.ndarray) -> np.ndarray:
+    """박스 (K, 4) → IoU 행렬 (K, K)"""
+    return iou_matrix(boxes, boxes)
+
+
+def suppress_cross_class(xyxy, conf, groups, iou_thres: float) -> np.ndarray:
+    """음식 박스 (K,) → 남길 박스 마스크 (K,). groups: 박스별 그룹 ID (-1 이면 비교 안 함)"""
+    conf = np.asarray(conf)
+    groups = np.asarray(groups)
+    keep = np.ones(len(conf), dtype=bool)
+    if len(conf) < 2:
+        return keep
+
+    conflict = (pairwise_iou(xyxy) >= iou_thres) & (groups[:, None] == groups[None, :]) & (groups[:, None] >= 0)
+    np.fill_diagonal(conflict, False)
+    if not conflict.any():
+        return keep
+
+    for i in np.argsort(-conf, kind="stable").tolist():
+        if keep[i]:
+            # i 보다 신뢰도 낮은 충돌 박스 제거 (높은 쪽은 이미 i 를 지웠을 것이므로 남아 있지 않음)
+            keep &= ~conflict[i]
+            keep[i] = True
+    return keep
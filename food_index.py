@@ -0,0 +1,201 @@
+import json
+from collections import namedtuple
+from types import MappingProxyType
+
+import numpy as np
+
+
+# -----------------------------
+# 검출 결과 → 칼로리 테이블 매핑 (벡터화)
+#   - 시작할 때 한 번: 모델 클래스 ID → 미리 만들어 둔 읽기 전용 item 레코드 (없으면 None)
+#   - 요청마다: cls / conf 배열에 마스크 + 칼로리 열 gather 한 번으로 끝
+#     (names.get → in CALORIE_TABLE → CALORIE_TABLE[...] 세 번 조회 없음)
+#   - 모델 라벨이 테이블 key 와 다르면(COCO "pizza" 등) 별칭 테이블로 연결
+# -----------------------------
+ITEM_FIELDS = ("foodName", "calories", "cuisine", "category", "portion")
+
+# fields: 응답 item 에 그대로 들어갈 필드 (읽기 전용)
+# note_head / note_tail: 안내 메시지 한 줄을 칼로리 / 신뢰도 자리 앞뒤로 미리 잘라 둔 문자열
+# alias: 별칭으로 연결된 경우 그 라벨 (직접 일치면 None)
+# meta: score / risk / recommend (FoodMeta 가 없으면 None)
+ItemRecord = namedtuple("ItemRecord", ["key", "fields", "note_head", "note_tail", "alias", "meta"])
+
+# 별칭 하나: 테이블 key + (선택) 기준량 표시 / 칼로리 배율
+Alias = namedtuple("Alias", ["key", "portion", "scale"])
+
+
+def load_aliases(path: str, table: dict, data: bytes = None) -> dict:
+    """별칭 JSON → {라벨: Alias} (테이블에 없는 key 는 경고하고 제외)
+    data: 이미 읽어 둔 파일 내용 (있으면 파일을 다시 열지 않음)"""
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+    raw = json.loads(data.decode("utf-8")).get("aliases", {})
+
+    aliases = {}
+    for label, spec in raw.items():
+        if isinstance(spec, str):
+            spec = {"key": spec}
+        alias = Alias(spec["key"], spec.get("portion"), float(spec.get("scale", 1.0)))
+        if alias.key not in table:
+            print(f"[경고] 별칭 '{label}' → '{alias.key}' : 칼로리 테이블에 없는 key 라서 무시합니다.")
+            continue
+        aliases[label] = alias
+    return aliases
+
+
+def make_item_record(key: str, info, alias_label=None, alias=None, meta=None) -> ItemRecord:
+    """info: 테이블 항목 (FoodRecord)"""
+    fields = {f: getattr(info, f) for f in ITEM_FIELDS}
+    if alias is not None:
+        if alias.portion:
+            fields["portion"] = alias.portion
+        if alias.scale != 1.0:
+            fields["calories"] = int(round(info.calories * alias.scale))
+    return ItemRecord(
+        key=key,
+        fields=MappingProxyType(fields),
+        note_head=f"• {fields['foodName']} ≈ ",
+        note_tail=f", 분류: {fields['cuisine']} / {fields['category']}, 기준량: {fields['portion']})",
+        alias=alias_label,
+        meta=MappingProxyType(meta) if meta is not None else None,
+    )
+
+
+def round_confidences(conf: np.ndarray, ndigits: int = 3) -> list:
+    """신뢰도 배열 → 응답용 float 리스트 (예전 round(float(conf), 3) 과 같은 값)
+    float32 그대로 반올림하면 tolist() 에서 0.8999999761581421 처럼 늘어나서 float64 로 바꾼 뒤 반올림"""
+    return np.round(np.asarray(conf, dtype=np.float64), ndigits).tolist()
+
+
+class ClassIndex:
+    def __init__(self, names: dict, table: dict, aliases: dict = None, meta=None, nutrition=None):
+        self.names = dict(names)
+        aliases = aliases or {}
+
+        def meta_for(key):
+            return meta.for_key(key) if meta is not None else None
+
+        num_classes = max(self.names, default=-1) + 1
+        records = [None] * num_classes
+        self.class_calories = np.zeros(num_classes, dtype=np.int64)
+        class_scale = np.ones(num_classes)
+        for cls_id, cls_name in self.names.items():
+            # 1) 라벨이 테이블 key 와 같으면 그대로, 2) 아니면 별칭으로 연결
+            if cls_name in table:
+                record = make_item_record(cls_name, table[cls_name], meta=meta_for(cls_name))
+            elif cls_name in aliases:
+                alias = aliases[cls_name]
+                record = make_item_record(alias.key, table[alias.key], cls_name, alias, meta_for(alias.key))
+                class_scale[cls_id] = alias.scale
+            else:
+                continue
+            records[cls_id] = record
+            self.class_calories[cls_id] = record.fields["calories"]
+
+        self.records = tuple(records)  # 클래스 ID → ItemRecord | None
+        self.has_record = np.array([r is not None for r in records], dtype=bool)
+
+        # 클래스 ID → 중복 판정 그룹 (테이블 category 번호, 없으면 -1)
+        #   같은 그룹끼리 거의 같은 박스면 같은 음식을 두 번 검출한 것으로 봄 (dedupe.py)
+        categories = sorted({r.fields["category"] for r in records if r is not None})
+        category_ids = {c: i for i, c in enumerate(categories)}
+        self.class_group = np.array(
+            [category_ids[r.fields["category"]] if r is not None else -1 for r in records], dtype=np.int64
+        )
+
+        # 클래스 ID 로 다시 색인한 영양 성분 (별칭 배율 반영, 칼로리는 item 에 표시되는 값과 같게)
+        self.nutrition = None
+        if nutrition is not None:
+            rows = [nutrition.row_of(r.key) if r is not None else -1 for r in records]
+            self.nutrition = nutrition.take(rows, class_scale)
+            self.nutrition.values[:, 0] = self.class_calories
+
+        # 커버리지: 테이블에 없는 모델 클래스 / 모델이 절대 못 내는 테이블 key
+        self.unmapped_classes = {c: n for c, n in sorted(self.names.items()) if records[c] is None}
+        self.unreachable_keys = sorted(set(table) - {r.key for r in records if r is not None})
+
+    @property
+    def food_class_ids(self) -> list:
+        return np.flatnonzero(self.has_record).tolist()
+
+    def food_mask(self, cls: np.ndarray, conf: np.ndarray, conf_threshold: float = 0.0) -> np.ndarray:
+        """검출마다 테이블에 있는 음식인지 (신뢰도 기준 포함)"""
+        cls = np.asarray(cls, dtype=np.int64)
+        conf = np.asarray(conf, dtype=np.float32)
+        in_range = (cls >= 0) & (cls < len(self.records))
+        mask = in_range & (conf >= conf_threshold)
+        mask[in_range] &= self.has_record[cls[in_range]]
+        return mask
+
+    def total_calories(self, cls_ids: np.ndarray, weights=None) -> int:
+        kcal = self.class_calories[cls_ids]
+        return int(round(float((kcal * weights).sum()))) if weights is not None else int(kcal.sum())
+
+    def plate_totals(self, cls_ids: np.ndarray, weights=None) -> dict:
+        """검출된 클래스들 (+ 양 배율) → 칼로리 + 성분 합계 (nutrition 이 없으면 칼로리만)"""
+        if self.nutrition is None:
+            return {"calories": float(self.total_calories(cls_ids, weights))}
+        return self.nutrition.totals(cls_ids, weights)
+
+    def coverage_report(self) -> dict:
+        return {
+            "modelClasses": len(self.names),
+            "mappedClasses": {
+                c: {"label": self.names[c], "key": self.records[c].key, "alias": self.records[c].alias}
+                for c in self.food_class_ids
+            },
+            "unmappedClasses": self.unmapped_classes,
+            "unreachableKeys": self.unreachable_keys,
+        }
+
+    def coverage_summary(self, limit=20) -> str:
+        mapped = self.food_class_ids
+        unmapped = list(self.unmapped_classes.values())
+        lines = [
+            f"모델 클래스 {len(self.names)}개 중 {len(mapped)}개가 칼로리 테이블에 연결됨",
+            f"테이블에 없는 모델 클래스 {len(unmapped)}개: {', '.join(unmapped[:limit])}"
+            + (" ..." if len(unmapped) > limit else ""),
+            f"모델이 찾을 수 없는 테이블 key {len(self.unreachable_keys)}개: {', '.join(self.unreachable_keys[:limit])}"
+            + (" ..." if len(self.unreachable_keys) > limit else ""),
+        ]
+        return "\n".join(lines)
+
+
+# -----------------------------
+# 별칭 적중률 (실제 트래픽 기준)
+#   - 클래스 ID 별 검출 수 / 그 클래스가 나온 요청 수를 배열로 누적
+# -----------------------------
+class AliasStats:
+    def __init__(self, class_index: ClassIndex):
+        self.class_index = class_index
+        num_classes = len(class_index.records)
+        self.detections = np.zeros(num_classes, dtype=np.int64)
+        self.requests_with_hit = np.zeros(num_classes, dtype=np.int64)
+        self.total_requests = 0
+
+    def record(self, cls_ids: np.ndarray):
+        self.total_requests += 1
+        if len(cls_ids):
+            np.add.at(self.detections, cls_ids, 1)
+            self.requests_with_hit[np.unique(cls_ids)] += 1
+
+    def report(self) -> dict:
+        total = self.total_requests
+        rows = []
+        for cls_id in self.class_index.food_class_ids:
+            rec = self.class_index.records[cls_id]
+            if rec.alias is None:
+                continue
+            hits = int(self.requests_with_hit[cls_id])
+            rows.append(
+                {
+                    "label": rec.alias,
+                    "key": rec.key,
+                    "detections": int(self.detections[cls_id]),
+                    "requests": hits,
+                    "hitRate": round(hits / total, 4) if total else 0.0,
+                }
+            )
+        rows.sort(key=lambda r: -r["detections"])
+        return {"totalRequests": total, "aliases": rows}
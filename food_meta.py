@@ -0,0 +1,127 @@
+import numpy as np
+
+
+# -----------------------------
+# 점수 / 위험 / 추천 (예전 JS buildMetaForFood 규칙)
+#   - 시작할 때 테이블 전체에 한 번만 계산 (칼로리 / 카테고리 / 태그 열에 벡터 연산)
+#   - 결과는 행 번호별 작은 정수 열(라벨 번호)로 저장 → 요청마다 계산 없음
+#   - 규칙 순서: 칼로리 구간 → 다이어트 가산점 → 야식/세트 위험 상향 → 과일/자연식 안정
+# -----------------------------
+META_FIELDS = ("score", "risk", "recommend")
+
+# 칼로리 구간: 150 이하 / 300 이하 / 500 이하 / 800 이하 / 그 이상
+KCAL_BANDS = np.array([150, 300, 500, 800])
+BAND_SCORE = np.array([95, 90, 75, 60, 45])
+
+RISK_LEVELS = ("LOW", "MID", "HIGH")
+LOW, MID, HIGH = range(3)
+BAND_RISK_LEVEL = np.array([LOW, LOW, MID, MID, HIGH])
+
+SCORE_LABELS = ("초저칼로리", "가벼운 한 끼", "평균적인 한 끼", "조금 높은 칼로리", "고칼로리 폭탄", "다이어트 친화 메뉴")
+SCORE_DIET = 5
+
+RISK_LABELS = ("안심 메뉴", "부담 적음", "적당한 칼로리", "양·소스 주의", "체중·혈당 주의", "야식·고칼로리 주의", "자연식 위주")
+RISK_NIGHT, RISK_NATURAL = 5, 6
+
+RECOMMENDS = (
+    ("다이어트·간식용으로 아주 좋음", "배가 많이 고프지 않을 때 간단히 먹기 좋아요."),
+    ("자주 먹어도 큰 부담 없음", "샐러드·과일과 같이 먹으면 더 좋습니다."),
+    ("하루 1~2번 정도 무난", "야식보다는 점심·저녁 메인 메뉴로 추천."),
+    ("일주일에 2~3회 이내로", "국·소스·치즈 양을 줄이면 체감 칼로리를 줄일 수 있어요."),
+    ("가끔 특별한 날에만", "야채·샐러드와 같이 먹고, 다른 끼니는 가볍게 조절하는 것을 추천."),
+    ("다이어트·체중관리용으로 적합", "단백질·섬유질 위주 식단에 잘 어울립니다."),
+    ("아주 가끔, 특별한 날에만", "취침 4시간 전에는 피하는 것을 강력 추천합니다."),
+    ("주 1~2회 이하 권장", "가능하면 점심에 먹고, 저녁은 가볍게 맞춰 주세요."),
+    ("간식·후식으로 좋음", "단, 당 조절이 필요하다면 하루 총 과일 양을 함께 관리해 주세요."),
+)
+REC_DIET, REC_NIGHT_HEAVY, REC_NIGHT, REC_NATURAL = 5, 6, 7, 8
+
+DIET_TAGS = ("다이어트", "헬스", "저칼로리")
+DIET_CATEGORY_WORDS = ("샐러드", "과일")
+NIGHT_TAGS = ("야식폭탄", "위험한칼로리", "야식", "술안주")
+NIGHT_HEAVY_KCAL = 900
+
+
+def _matching_sids(table, sids: np.ndarray, predicate) -> np.ndarray:
+    # 문자열 풀 id 중 조건에 맞는 것 (고유값만 한 번씩 디코딩)
+    uniq = np.unique(sids)
+    return uniq[np.array([bool(predicate(table.string(s))) for s in uniq], dtype=bool)]
+
+
+def _rows_with_tag(table, names) -> np.ndarray:
+    """태그 목록 중 하나라도 가진 행 → (n,) bool"""
+    n = len(table)
+    counts = table.column("tag_count").astype(np.int64)
+    starts = table.column("tag_start").astype(np.int64)
+    rows = np.repeat(np.arange(n), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    tag_sids = table.column("tags")[np.repeat(starts, counts) + offsets]
+
+    hit = np.isin(tag_sids, _matching_sids(table, tag_sids, lambda t: t in names))
+    out = np.zeros(n, dtype=bool)
+    out[rows[hit]] = True
+    return out
+
+
+def _rows_with_category(table, predicate) -> np.ndarray:
+    cats = table.column("category")
+    return np.isin(cats, _matching_sids(table, cats, predicate))
+
+
+class FoodMeta:
+    """FoodTable 행 번호 → score / risk / recommend"""
+
+    def __init__(self, table):
+        self.table = table
+        kcal = table.column("calories").astype(np.int64)
+
+        # 1) 칼로리 구간
+        band = np.searchsorted(KCAL_BANDS, kcal, side="left")
+        score = BAND_SCORE[band]
+        score_label = band.copy()
+        risk_level = BAND_RISK_LEVEL[band]
+        risk_label = band.copy()
+        recommend = band.copy()
+
+        # 2) 다이어트 / 샐러드 / 과일 → 가산점
+        diet = _rows_with_tag(table, DIET_TAGS) | _rows_with_category(
+            table, lambda c: any(w in c for w in DIET_CATEGORY_WORDS)
+        )
+        score = np.where(diet, np.minimum(100, score + 10), score)
+        risk_level = np.where(diet & (risk_level == MID), LOW, risk_level)
+        score_label[diet] = SCORE_DIET
+        recommend[diet] = REC_DIET
+
+        # 3) 야식 / 폭탄 태그, 세트 메뉴 → 위험도 상향
+        night = _rows_with_tag(table, NIGHT_TAGS) | _rows_with_category(table, lambda c: c == "세트")
+        risk_level[night] = HIGH
+        risk_label[night] = RISK_NIGHT
+        score = np.where(night, np.minimum(score, 55), score)
+        recommend[night] = np.where(kcal[night] >= NIGHT_HEAVY_KCAL, REC_NIGHT_HEAVY, REC_NIGHT)
+
+        # 4) 과일 / 자연식 → 안정성 상향
+        natural = _rows_with_category(table, lambda c: c == "과일") | _rows_with_tag(table, ("자연식",))
+        risk_level[natural] = LOW
+        risk_label[natural] = RISK_NATURAL
+        score = np.where(natural, np.maximum(score, 85), score)
+        recommend[natural] = REC_NATURAL
+
+        self.score = score.astype(np.int16)
+        self.score_label = score_label.astype(np.uint8)
+        self.risk_level = risk_level.astype(np.uint8)
+        self.risk_label = risk_label.astype(np.uint8)
+        self.recommend = recommend.astype(np.uint8)
+
+    def for_row(self, row: int) -> dict:
+        summary, detail = RECOMMENDS[self.recommend[row]]
+        return {
+            "score": {"value": int(self.score[row]), "label": SCORE_LABELS[self.score_label[row]]},
+            "risk": {"level": RISK_LEVELS[self.risk_level[row]], "label": RISK_LABELS[self.risk_label[row]]},
+            "recommend": {"summary": summary, "detail": detail},
+        }
+
+    def for_key(self, key: str) -> dict:
+        row = self.table.index_of(key)
+        if row < 0:
+            raise KeyError(key)
+        return self.for_row(row)
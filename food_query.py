@@ -0,0 +1,101 @@
+import numpy as np
+
+
+# -----------------------------
+# cuisine / category / tags 역색인 (비트맵)
+#   - 시작할 때 값마다 "그 값을 가진 행" 비트맵을 만들어 둠 (np.packbits, 8행 = 1바이트)
+#   - 같은 필드 안의 여러 값은 OR, 필드끼리는 AND (tags 는 tagMode=all|any)
+#   - 칼로리 범위는 calories 열 비교 한 번으로 비트맵을 만들어서 같이 AND
+#   - 결과 비트맵 → 행 번호 → 페이지 잘라서 반환 (전체 항목을 dict 로 훑지 않음)
+# -----------------------------
+INDEXED_FIELDS = ("cuisine", "category", "tags")
+
+
+def normalize(value: str) -> str:
+    return value.strip().casefold()
+
+
+def pack_rows(rows: np.ndarray, n: int) -> np.ndarray:
+    mask = np.zeros(n, dtype=bool)
+    mask[rows] = True
+    return np.packbits(mask, bitorder="little")
+
+
+def unpack_rows(bitmap: np.ndarray, n: int) -> np.ndarray:
+    return np.flatnonzero(np.unpackbits(bitmap, count=n, bitorder="little"))
+
+
+class FoodIndex:
+    def __init__(self, table):
+        self.table = table
+        self.n = len(table)
+        self.calories = table.column("calories")
+        self._nbytes = (self.n + 7) // 8
+        self._all = np.packbits(np.ones(self.n, dtype=bool), bitorder="little")
+        self._empty = np.zeros(self._nbytes, dtype=np.uint8)
+
+        self.bitmaps = {}  # 필드 → {정규화한 값: 비트맵}
+        self.labels = {}   # 필드 → {정규화한 값: 테이블에 적힌 원래 값}
+        for field in ("cuisine", "category"):
+            self._build(field, table.column(field), np.arange(self.n))
+
+        # tags: 행마다 개수가 달라서 (행 번호, 태그 id) 쌍으로 펼친 뒤 같은 방식으로
+        counts = table.column("tag_count").astype(np.int64)
+        starts = table.column("tag_start").astype(np.int64)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        tag_sids = table.column("tags")[np.repeat(starts, counts) + offsets]
+        self._build("tags", tag_sids, np.repeat(np.arange(self.n), counts))
+
+    def _build(self, field: str, sids: np.ndarray, rows: np.ndarray):
+        bitmaps, labels = {}, {}
+        order = np.argsort(sids, kind="stable")
+        sids, rows = sids[order], rows[order]
+        uniq, first = np.unique(sids, return_index=True)
+        for sid, group in zip(uniq, np.split(rows, first[1:])):
+            value = self.table.string(sid)
+            key = normalize(value)
+            bitmap = pack_rows(group, self.n)
+            # 대소문자만 다른 값은 하나로 합침
+            bitmaps[key] = bitmaps[key] | bitmap if key in bitmaps else bitmap
+            labels.setdefault(key, value)
+        self.bitmaps[field] = bitmaps
+        self.labels[field] = labels
+
+    def values(self, field: str) -> dict:
+        """필드 값 → 항목 수, 많은 순 (/foods 필터 선택지용)"""
+        counts = {
+            self.labels[field][key]: int(np.unpackbits(bitmap).sum()) for key, bitmap in self.bitmaps[field].items()
+        }
+        return dict(sorted(counts.items(), key=lambda kv: -kv[1]))
+
+    def _any_of(self, field: str, values) -> np.ndarray:
+        out = self._empty
+        for v in values:
+            bitmap = self.bitmaps[field].get(normalize(v))
+            if bitmap is not None:
+                out = out | bitmap
+        return out
+
+    def _all_of(self, field: str, values) -> np.ndarray:
+        out = self._all
+        for v in values:
+            out = out & self.bitmaps[field].get(normalize(v), self._empty)
+        return out
+
+    def query(self, cuisine=(), category=(), tags=(), tag_mode="all", min_calories=None, max_calories=None):
+        """조건에 맞는 행 번호 (행 순서대로)"""
+        bitmap = self._all
+        if cuisine:
+            bitmap = bitmap & self._any_of("cuisine", cuisine)
+        if category:
+            bitmap = bitmap & self._any_of("category", category)
+        if tags:
+            bitmap = bitmap & (self._any_of("tags", tags) if tag_mode == "any" else self._all_of("tags", tags))
+        if min_calories is not None or max_calories is not None:
+            in_range = np.ones(self.n, dtype=bool)
+            if min_calories is not None:
+                in_range &= self.calories >= min_calories
+            if max_calories is not None:
+                in_range &= self.calories <= max_calories
+            bitmap = bitmap & np.packbits(in_range, bitorder="little")
+        return unpack_rows(bitmap, self.n)
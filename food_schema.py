@@ -0,0 +1,163 @@
+import math
+import sys
+from collections import namedtuple
+
+
+# -----------------------------
+# 칼로리 테이블 항목 스키마 / 검증
+#   - 빌드할 때(JSON → .bin) 모든 항목을 타입 검사
+#       error  : 필수 필드 없음 / 타입 틀림 / 음수 칼로리 → 그 항목은 빼고 빌드
+#       warning: tags 없음(빈 목록으로), 모르는 필드(무시), 중복 key(뒤의 값 사용)
+#   - strict=True 면 error 또는 중복 key 가 하나라도 있으면 빌드 거부 (FoodTableError)
+#   - 통과한 항목은 FoodRecord (읽기 전용 namedtuple, 인스턴스 dict 없음)
+#     cuisine / category / portion / tags 같은 반복 문자열은 sys.intern 으로 공유
+# -----------------------------
+STRING_FIELDS = ("foodName", "cuisine", "category", "portion")
+NUTRIENT_FIELDS = ("carbs", "protein", "fat", "sugar", "sodium")
+KNOWN_FIELDS = frozenset(("key", "calories", "tags") + STRING_FIELDS + NUTRIENT_FIELDS)
+
+FoodRecord = namedtuple(
+    "FoodRecord",
+    ["key", "foodName", "calories", "cuisine", "category", "portion", "tags", *NUTRIENT_FIELDS],
+    defaults=(None,) * len(NUTRIENT_FIELDS),
+)
+# tags: 문자열 tuple, 성분(carbs 등): float 또는 None(정보 없음)
+
+
+class FoodTableError(ValueError):
+    def __init__(self, message, report=None):
+        super().__init__(message)
+        self.report = report or {}
+
+
+def record_to_dict(rec: FoodRecord) -> dict:
+    """응답용 dict (key 제외, 값 없는 성분은 생략, tags 는 list)"""
+    out = {
+        "foodName": rec.foodName,
+        "calories": rec.calories,
+        "cuisine": rec.cuisine,
+        "category": rec.category,
+        "portion": rec.portion,
+        "tags": list(rec.tags),
+    }
+    for field in NUTRIENT_FIELDS:
+        value = getattr(rec, field)
+        if value is not None:
+            out[field] = value
+    return out
+
+
+def _check_entry(food, where, issues):
+    """항목 하나 검사 → FoodRecord (error 가 있으면 None)"""
+    errors = []
+    if not isinstance(food, dict):
+        issues.append(("error", where, None, "항목이 객체(JSON object)가 아닙니다"))
+        return None
+
+    key = food.get("key")
+    if not isinstance(key, str) or not key.strip():
+        errors.append("key 가 없거나 빈 문자열입니다")
+        key = None
+
+    for field in STRING_FIELDS:
+        value = food.get(field)
+        if field not in food:
+            errors.append(f"필수 필드 {field} 가 없습니다")
+        elif not isinstance(value, str) or not value.strip():
+            errors.append(f"{field} 는 빈 문자열이 아닌 문자열이어야 합니다 ({value!r})")
+
+    calories = food.get("calories")
+    if "calories" not in food:
+        errors.append("필수 필드 calories 가 없습니다")
+    elif isinstance(calories, bool) or not isinstance(calories, int):
+        errors.append(f"calories 는 정수여야 합니다 ({calories!r})")
+    elif calories < 0:
+        errors.append(f"calories 가 음수입니다 ({calories})")
+
+    tags = food.get("tags")
+    if "tags" not in food:
+        issues.append(("warning", where, key, "tags 가 없어서 빈 목록으로 둡니다"))
+        tags = []
+    elif not isinstance(tags, list) or not all(isinstance(t, str) and t.strip() for t in tags):
+        errors.append(f"tags 는 문자열 목록이어야 합니다 ({tags!r})")
+
+    nutrients = {}
+    for field in NUTRIENT_FIELDS:
+        if field not in food:
+            continue
+        value = food[field]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0:
+            errors.append(f"{field} 는 0 이상의 숫자여야 합니다 ({value!r})")
+        else:
+            nutrients[field] = float(value)
+
+    unknown = sorted(set(food) - KNOWN_FIELDS)
+    if unknown:
+        issues.append(("warning", where, key, f"모르는 필드 무시: {', '.join(unknown)}"))
+
+    if errors:
+        for message in errors:
+            issues.append(("error", where, key, message))
+        return None
+
+    return FoodRecord(
+        key=sys.intern(key),
+        foodName=food["foodName"],
+        calories=calories,
+        cuisine=sys.intern(food["cuisine"]),
+        category=sys.intern(food["category"]),
+        portion=sys.intern(food["portion"]),
+        tags=tuple(sys.intern(t) for t in tags),
+        **nutrients,
+    )
+
+
+def validate_foods(foods: list, strict: bool = False):
+    """원본 항목 목록 → (key 순서대로 FoodRecord 목록, 검증 리포트)
+
+    중복 key 는 예전 dict 리터럴처럼 처음 자리에 뒤의 값이 들어감"""
+    issues = []  # (severity, 항목 번호, key, 메시지)
+    records = {}
+    seen_at = {}
+    for i, food in enumerate(foods):
+        rec = _check_entry(food, i, issues)
+        if rec is None:
+            continue
+        if rec.key in records:
+            issues.append(
+                ("warning", i, rec.key, f"중복 key: {seen_at[rec.key][0]}번 항목을 덮어씁니다")
+            )
+        seen_at.setdefault(rec.key, []).append(i)
+        records[rec.key] = rec
+
+    report = {
+        "entries": len(foods),
+        "accepted": len(records),
+        "errors": [_issue_dict(x) for x in issues if x[0] == "error"],
+        "warnings": [_issue_dict(x) for x in issues if x[0] == "warning"],
+        "duplicates": {k: v for k, v in seen_at.items() if len(v) > 1},
+    }
+    if strict and (report["errors"] or report["duplicates"]):
+        raise FoodTableError(
+            f"칼로리 테이블 검증 실패: error {len(report['errors'])}개, 중복 key {len(report['duplicates'])}개",
+            report,
+        )
+    return list(records.values()), report
+
+
+def _issue_dict(issue) -> dict:
+    severity, index, key, message = issue
+    return {"index": index, "key": key, "message": message}
+
+
+def report_summary(report: dict, limit: int = 10) -> str:
+    lines = [
+        f"항목 {report['entries']}개 중 {report['accepted']}개 사용, "
+        f"error {len(report['errors'])}개 / warning {len(report['warnings'])}개 / 중복 key {len(report['duplicates'])}개"
+    ]
+    for severity in ("errors", "warnings"):
+        for issue in report[severity][:limit]:
+            lines.append(f"  [{severity[:-1]}] #{issue['index']} {issue['key'] or '-'}: {issue['message']}")
+        if len(report[severity]) > limit:
+            lines.append(f"  ... {severity} {len(report[severity]) - limit}개 더")
+    return "\n".join(lines)
@@ -0,0 +1,182 @@
+import bisect
+import re
+from collections import namedtuple
+
+import numpy as np
+
+
+# -----------------------------
+# 음식 이름 검색 (자동완성 / "혹시 김치찌개?")
+#   - 시작할 때 foodName / key 로 색인을 한 번 만들어 둠
+#       1) 접두어: 정규화한 이름 / 단어 / key 조각을 정렬해 두고 이진 탐색
+#       2) 초성: "ㄱㅊㅉㄱ" 또는 "김치ㅉ" 처럼 초성이 섞인 검색어
+#          (음절 → 초성 = CHOSEONG[(code - 0xAC00) // 588])
+#       3) 오타 허용: 2-gram 역색인으로 검색어 2-gram 을 얼마나 포함하는지 계산
+#   - 점수: 완전 일치 > 이름 접두어 > 단어 접두어 > 초성 > 부분 문자열 > 2-gram 유사도
+#   - 테이블을 다시 읽으면(rebuild) 이름이 바뀐 항목만 다시 분석하고 나머지는 재사용
+# -----------------------------
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+JAMO = frozenset(CHOSEONG)
+
+SCORE_EXACT = 5.0
+SCORE_NAME_PREFIX = 4.0
+SCORE_TOKEN_PREFIX = 3.0
+SCORE_CHOSEONG_PREFIX = 2.5
+SCORE_CHOSEONG = 2.0
+SCORE_SUBSTRING = 1.5
+FUZZY_MIN_COVERAGE = 0.5  # 검색어 2-gram 중 이 비율 이상이 이름에 있어야 후보
+
+_SPLIT = re.compile(r"[^0-9a-z가-힣ㄱ-ㅎ]+")
+
+
+def normalize(text: str) -> str:
+    """소문자 + 공백 / 기호 제거 ("김밥(1줄)" → "김밥1줄")"""
+    return "".join(_SPLIT.split(text.casefold()))
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절은 초성으로, 나머지 글자는 그대로 (길이 유지)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_FIRST <= code <= HANGUL_LAST:
+            out.append(CHOSEONG[(code - HANGUL_FIRST) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+# 항목 하나를 분석한 결과 (key + 이름이 같으면 다시 만들지 않음)
+SearchEntry = namedtuple("SearchEntry", ["key", "name", "norm", "norm_key", "choseong", "terms", "grams"])
+
+
+def make_entry(key: str, name: str) -> SearchEntry:
+    norm = normalize(name)
+    norm_key = normalize(key)
+    # 접두어 검색 대상: (문자열, 점수) — 이름 전체 / 이름 단어 / key / key 조각
+    terms = {norm: SCORE_NAME_PREFIX, norm_key: SCORE_NAME_PREFIX}
+    for token in _SPLIT.split(name.casefold()) + key.casefold().split("_"):
+        if token and token not in terms:
+            terms[token] = SCORE_TOKEN_PREFIX
+    grams = bigrams(norm) | bigrams(key.casefold().replace("_", " "))
+    return SearchEntry(key, name, norm, norm_key, to_choseong(norm), tuple(terms.items()), frozenset(grams))
+
+
+class FoodSearchIndex:
+    def __init__(self, table=None, previous=None):
+        # previous: 이전 버전 색인 (분석 결과만 빌려 쓰고 이전 색인 자체는 건드리지 않음)
+        self.table = None
+        self.entries = list(previous.entries) if previous is not None else []
+        self.last_rebuild = {"built": 0, "reused": 0}
+        if table is not None:
+            self.rebuild(table)
+
+    def rebuild(self, table) -> dict:
+        """테이블(FoodTable)로 색인 다시 만들기. 바뀌지 않은 항목의 분석 결과는 재사용"""
+        old = {(e.key, e.name): e for e in self.entries}
+        entries = []
+        built = 0
+        for row in range(len(table)):
+            rec = table.record(row)
+            key, name = rec.key, rec.foodName
+            entry = old.get((key, name))
+            if entry is None:
+                entry = make_entry(key, name)
+                built += 1
+            entries.append(entry)
+
+        # 1) 접두어: (문자열, 행) 을 정렬한 배열
+        terms = sorted((term, row, score) for row, e in enumerate(entries) for term, score in e.terms)
+        self._terms = [t[0] for t in terms]
+        self._term_rows = [t[1] for t in terms]
+        self._term_scores = [t[2] for t in terms]
+
+        # 2) 초성: 전부 이어 붙인 문자열에서 str.find (행 경계는 시작 위치 배열로 bisect)
+        self._cho_blob = "\n".join(e.choseong for e in entries)
+        starts, pos = [], 0
+        for e in entries:
+            starts.append(pos)
+            pos += len(e.choseong) + 1
+        self._cho_starts = starts
+
+        # 3) 2-gram 역색인: gram → 행 번호 배열
+        postings = {}
+        for row, e in enumerate(entries):
+            for g in e.grams:
+                postings.setdefault(g, []).append(row)
+        self._postings = {g: np.array(rows, dtype=np.int32) for g, rows in postings.items()}
+
+        self.table = table
+        self.entries = entries
+        self.last_rebuild = {"built": built, "reused": len(entries) - built}
+        return self.last_rebuild
+
+    def search(self, query: str, limit: int = 10) -> list:
+        q = normalize(query)
+        if not q or not self.entries:
+            return []
+        best = {}  # 행 → (점수, 일치 방식)
+
+        def hit(row, score, match):
+            if score > best.get(row, (0.0, None))[0]:
+                best[row] = (score, match)
+
+        # 1) 접두어 / 완전 일치
+        i = bisect.bisect_left(self._terms, q)
+        while i < len(self._terms) and self._terms[i].startswith(q):
+            row = self._term_rows[i]
+            if self._terms[i] == q and self._term_scores[i] == SCORE_NAME_PREFIX:
+                hit(row, SCORE_EXACT, "exact")
+            else:
+                hit(row, self._term_scores[i], "prefix")
+            i += 1
+
+        # 2) 초성 (검색어에 자음만 있는 글자가 있을 때)
+        if any(ch in JAMO for ch in q):
+            self._search_choseong(q, hit)
+
+        # 3) 부분 문자열 / 2-gram 유사도
+        q_grams = bigrams(q)
+        lists = [self._postings[g] for g in q_grams if g in self._postings]
+        if lists:
+            common = np.bincount(np.concatenate(lists), minlength=len(self.entries))
+            coverage = common / len(q_grams)
+            for row in np.flatnonzero(coverage >= FUZZY_MIN_COVERAGE).tolist():
+                e = self.entries[row]
+                if q in e.norm or q in e.norm_key:
+                    hit(row, SCORE_SUBSTRING, "substring")
+                else:
+                    hit(row, float(coverage[row]), "fuzzy")
+
+        ranked = sorted(best.items(), key=lambda kv: (-kv[1][0], len(self.entries[kv[0]].norm), kv[0]))
+        out = []
+        for row, (score, match) in ranked[:limit]:
+            e = self.entries[row]
+            out.append(
+                {
+                    "key": e.key,
+                    "foodName": e.name,
+                    "calories": self.table.record(row).calories,
+                    "score": round(score, 3),
+                    "match": match,
+                }
+            )
+        return out
+
+    def _search_choseong(self, q: str, hit):
+        q_cho = to_choseong(q)
+        blob = self._cho_blob
+        pos = blob.find(q_cho)
+        while pos != -1:
+            row = bisect.bisect_right(self._cho_starts, pos) - 1
+            offset = pos - self._cho_starts[row]
+            norm = self.entries[row].norm
+            # 초성 자리는 초성끼리, 완성된 음절 자리는 음절끼리 같아야 함
+            if all(ch in JAMO or norm[offset + k] == ch for k, ch in enumerate(q)):
+                hit(row, SCORE_CHOSEONG_PREFIX if offset == 0 else SCORE_CHOSEONG, "choseong")
+            pos = blob.find(q_cho, pos + 1)
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+
+from food_index import AliasStats, ClassIndex, load_aliases
+from food_meta import FoodMeta
+from food_query import FoodIndex
+from food_search import FoodSearchIndex
+from food_table import compile_food_table, load_food_table, needs_build
+from nutrition import NutritionStore
+
+
+# -----------------------------
+# 칼로리 테이블 + 파생 색인 묶음 (서버 재시작 없이 교체)
+#   - FoodState: 테이블 한 버전에서 만든 것 전부 (읽기 전용 namedtuple)
+#   - 다시 읽을 때는 새 FoodState 를 옆에서 다 만든 다음 참조 하나만 바꿔 끼움
+#     → 읽는 쪽은 락 없이 요청 시작할 때 reloader.state 를 한 번 잡아서 끝까지 사용
+#       (처리 중이던 요청은 이전 버전으로 끝남)
+#   - 빌드가 실패하면 이전 버전을 그대로 유지
+#   - version: 빌드된 테이블 + 별칭 파일 내용의 해시 (별칭만 바뀌어도 버전이 바뀜 → 캐시 비움)
+# -----------------------------
+FoodState = namedtuple(
+    "FoodState",
+    ["version", "table", "meta", "nutrition", "index", "search", "aliases", "class_index", "alias_stats", "loaded_at"],
+)
+
+
+def state_version(table_version: str, aliases_bytes) -> str:
+    if aliases_bytes is None:
+        return table_version
+    h = hashlib.blake2b(table_version.encode("ascii"), digest_size=6)
+    h.update(aliases_bytes)
+    return h.hexdigest()
+
+
+def read_aliases_bytes(path):
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def build_food_state(
+    names, source_path, compiled_path, aliases_path=None, strict=False, previous=None, force=False
+) -> FoodState:
+    if force or needs_build(source_path, compiled_path):
+        # 같은 경로로 원자적 교체 → 이전 버전이 mmap 으로 열고 있던 파일 내용은 그대로 유지됨
+        compile_food_table(source_path, compiled_path, strict=strict)
+    table = load_food_table(source_path, compiled_path, strict=strict)
+
+    meta = FoodMeta(table)
+    nutrition = NutritionStore.from_table(table)
+    aliases_bytes = read_aliases_bytes(aliases_path)
+    aliases = load_aliases(aliases_path, table, aliases_bytes) if aliases_bytes is not None else {}
+    class_index = ClassIndex(names, table, aliases, meta, nutrition)
+    return FoodState(
+        version=state_version(table.version, aliases_bytes),
+        table=table,
+        meta=meta,
+        nutrition=nutrition,
+        index=FoodIndex(table),
+        search=FoodSearchIndex(table, previous=previous.search if previous is not None else None),
+        aliases=aliases,
+        class_index=class_index,
+        alias_stats=AliasStats(class_index),
+        loaded_at=time.time(),
+    )
+
+
+class FoodStateReloader:
+    """현재 FoodState 보관 + 다시 읽기 (관리자 요청 / 파일 변경 감시)"""
+
+    def __init__(self, build_fn, on_swap=None, watch_paths=(), watch_interval_sec=0.0):
+        # build_fn(previous, force) → FoodState, on_swap(old, new) 은 교체 직후 호출
+        self._build_fn = build_fn
+        self._on_swap = on_swap
+        self._reload_lock = threading.Lock()  # 다시 읽기끼리만 직렬화 (읽는 쪽은 락 없음)
+        self.watch_paths = tuple(p for p in watch_paths if p)
+        self.watch_interval_sec = float(watch_interval_sec)
+
+        self.reloads = 0
+        self.failures = 0
+        self.last_error = None
+        self.last_build_ms = None
+
+        self.state = self._timed_build(None, False)
+        if self._on_swap is not None:
+            self._on_swap(None, self.state)
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._signature = self._watch_signature()
+        if self.watch_interval_sec > 0 and self.watch_paths:
+            self._thread = threading.Thread(target=self._watch, name="food-table-watch", daemon=True)
+            self._thread.start()
+
+    def _timed_build(self, previous, force):
+        t0 = time.perf_counter()
+        state = self._build_fn(previous, force)
+        self.last_build_ms = round((time.perf_counter() - t0) * 1000.0, 1)
+        return state
+
+    def reload(self, force=True) -> dict:
+        """새 버전을 만들어서 교체. 실패하면 이전 버전 유지하고 오류를 돌려줌"""
+        with self._reload_lock:
+            old = self.state
+            try:
+                new = self._timed_build(old, force)
+            except Exception as e:
+                self.failures += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+                print(f"[칼로리 테이블] 다시 읽기 실패, 버전 {old.version} 유지: {self.last_error}")
+                return {"success": False, "error": f"칼로리 테이블 다시 읽기 실패 (이전 버전 유지): {e}"}
+
+            self.state = new  # 참조 교체 한 번 = 원자적
+            self.reloads += 1
+            self.last_error = None
+            if self._on_swap is not None:
+                self._on_swap(old, new)
+            return {
+                "success": True,
+                "tableVersion": new.version,
+                "previousVersion": old.version,
+                "changed": new.version != old.version,
+                "foods": len(new.table),
+                "buildMs": self.last_build_ms,
+                "search": new.search.last_rebuild,
+            }
+
+    def _watch_signature(self):
+        sig = []
+        for path in self.watch_paths:
+            try:
+                st = os.stat(path)
+                sig.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def _watch(self):
+        while not self._stop.wait(self.watch_interval_sec):
+            sig = self._watch_signature()
+            if sig == self._signature:
+                continue
+            self._signature = sig
+            result = self.reload(force=False)
+            if result["success"]:
+                print(f"[칼로리 테이블] 파일 변경 감지 → 버전 {result['previousVersion']} → {result['tableVersion']}")
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+    def stats(self) -> dict:
+        state = self.state
+        return {
+            "tableVersion": state.version,
+            "foods": len(state.table),
+            "loadedAt": round(state.loaded_at, 3),
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "lastError": self.last_error,
+            "lastBuildMs": self.last_build_ms,
+            "watchIntervalSec": self.watch_interval_sec if self._thread is not None else 0,
+        }
@@ -0,0 +1,277 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Mapping
+
+import numpy as np
+
+from food_schema import NUTRIENT_FIELDS, STRING_FIELDS, FoodRecord, FoodTableError, report_summary, validate_foods
+
+
+# -----------------------------
+# 칼로리 테이블 저장소
+#   - 원본: data/food_table.json (사람이 편집하는 파일)
+#   - 빌드: python -m food_table build  →  data/food_table.bin
+#       문자열 풀(중복 제거) + 고정 폭 숫자 열(column)로 된 바이너리
+#       빌드 전에 모든 항목을 스키마 검증 (food_schema.py), 검증 리포트도 바이너리에 같이 저장
+#   - 서버: 바이너리를 읽기 전용 mmap 으로 열어서 모든 워커가 페이지 캐시를 공유
+#       FoodTable[key] → FoodRecord (처음 조회할 때 만들어서 재사용, 문자열은 intern)
+# -----------------------------
+MAGIC = b"SCFT"
+FORMAT_VERSION = 2
+
+# 헤더: magic, version, 항목 수, 열 수
+HEADER = struct.Struct("<4sIII")
+# 열 목록: 이름, dtype, 파일 내 offset, 원소 수
+COLUMN_ENTRY = struct.Struct("<16s4sQQ")
+ALIGN = 8
+
+
+# -----------------------------
+# 빌드: JSON → 바이너리
+# -----------------------------
+def read_source(source_path: str) -> list:
+    """원본 JSON → [(key, entry)] (파일 순서 그대로, 중복 포함, 검증 없음)"""
+    with open(source_path, encoding="utf-8") as f:
+        doc = json.load(f)
+    return [(food["key"], {k: v for k, v in food.items() if k != "key"}) for food in doc["foods"]]
+
+
+def load_source(source_path: str, strict: bool = False):
+    """원본 JSON → 검증된 (FoodRecord 목록, 검증 리포트)"""
+    try:
+        with open(source_path, encoding="utf-8") as f:
+            doc = json.load(f)
+    except ValueError as e:
+        raise FoodTableError(f"{source_path}: JSON 파싱 실패: {e}") from None
+    if not isinstance(doc, dict) or not isinstance(doc.get("foods"), list):
+        raise FoodTableError(f"{source_path}: 최상위에 \"foods\" 목록이 없습니다")
+    return validate_foods(doc["foods"], strict=strict)
+
+
+def compile_food_table(source_path: str, out_path: str, strict: bool = False) -> dict:
+    """원본 JSON 검증 + 바이너리 빌드 → 검증 리포트"""
+    records, report = load_source(source_path, strict=strict)
+    table = {r.key: r for r in records}
+    keys = list(table)
+
+    strings = {}
+
+    def sid(s: str) -> int:
+        if s not in strings:
+            strings[s] = len(strings)
+        return strings[s]
+
+    n = len(keys)
+    cols = {
+        "key": np.array([sid(k) for k in keys], dtype="<u4"),
+        "calories": np.array([table[k].calories for k in keys], dtype="<i4"),
+    }
+    for field in STRING_FIELDS:
+        cols[field] = np.array([sid(getattr(table[k], field)) for k in keys], dtype="<u4")
+
+    tag_ids, tag_start, tag_count = [], [], []
+    for k in keys:
+        tags = table[k].tags
+        tag_start.append(len(tag_ids))
+        tag_count.append(len(tags))
+        tag_ids.extend(sid(t) for t in tags)
+    cols["tag_start"] = np.array(tag_start, dtype="<u4")
+    cols["tag_count"] = np.array(tag_count, dtype="<u4")
+    cols["tags"] = np.array(tag_ids, dtype="<u4")
+
+    for field in NUTRIENT_FIELDS:
+        cols[field] = np.array(
+            [np.nan if getattr(table[k], field) is None else getattr(table[k], field) for k in keys], dtype="<f8"
+        )
+
+    # key 정렬 순서 (이진 탐색용)
+    cols["key_order"] = np.array(sorted(range(n), key=lambda i: keys[i].encode("utf-8")), dtype="<u4")
+
+    # 문자열 풀
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    cols["str_offsets"] = offsets
+    cols["str_blob"] = np.frombuffer(b"".join(encoded), dtype="u1")
+    cols["report"] = np.frombuffer(json.dumps(report, ensure_ascii=False).encode("utf-8"), dtype="u1")
+
+    # 레이아웃 계산 후 기록 (임시 파일 → 원자적 교체: 여러 워커가 동시에 빌드해도 안전)
+    pos = HEADER.size + COLUMN_ENTRY.size * len(cols)
+    layout = []
+    for name, arr in cols.items():
+        pos = (pos + ALIGN - 1) // ALIGN * ALIGN
+        layout.append((name, arr, pos))
+        pos += arr.nbytes
+
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, n, len(cols)))
+        for name, arr, offset in layout:
+            f.write(COLUMN_ENTRY.pack(name.encode(), arr.dtype.str.encode(), offset, arr.size))
+        for _, arr, offset in layout:
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(arr.tobytes())
+    os.replace(tmp_path, out_path)
+    return report
+
+
+def needs_build(source_path: str, compiled_path: str) -> bool:
+    if not os.path.exists(compiled_path):
+        return True
+    if os.path.exists(source_path) and os.path.getmtime(source_path) > os.path.getmtime(compiled_path):
+        return True
+    with open(compiled_path, "rb") as f:
+        magic, version, _, _ = HEADER.unpack(f.read(HEADER.size))
+    return magic != MAGIC or version != FORMAT_VERSION
+
+
+def load_food_table(source_path: str, compiled_path: str, strict: bool = False) -> "FoodTable":
+    """바이너리가 없거나 원본보다 오래됐으면 빌드하고 mmap 으로 열기"""
+    if needs_build(source_path, compiled_path):
+        compile_food_table(source_path, compiled_path, strict=strict)
+    table = FoodTable(compiled_path)
+    report = table.validation_report
+    if strict and (report.get("errors") or report.get("duplicates")):
+        # strict 아닐 때 빌드된 바이너리를 strict 로 여는 경우
+        raise FoodTableError(f"{compiled_path}: 검증 error / 중복 key 가 있는 테이블입니다", report)
+    return table
+
+
+# -----------------------------
+# 읽기: mmap 위의 뷰
+# -----------------------------
+class FoodTable(Mapping):
+    """key → FoodRecord (내용은 mmap 에서 읽고, 한 번 만든 레코드 / 문자열은 재사용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, ncols = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path}: 칼로리 테이블 형식이 아닙니다 (magic={magic!r}, version={version})")
+        self._count = count
+
+        self._cols = {}
+        for i in range(ncols):
+            name, dtype, offset, size = COLUMN_ENTRY.unpack_from(self._mm, HEADER.size + i * COLUMN_ENTRY.size)
+            name = name.rstrip(b"\0").decode()
+            self._cols[name] = np.frombuffer(self._mm, dtype=dtype.rstrip(b"\0").decode(), count=size, offset=offset)
+
+        self._str_offsets = self._cols["str_offsets"]
+        self._str_blob = self._cols["str_blob"]
+        self._strings = [None] * (len(self._str_offsets) - 1)
+        self._records = [None] * count
+        # 내용 해시 (같은 내용이면 같은 버전, 응답의 tableVersion)
+        self.version = hashlib.blake2b(self._mm, digest_size=6).hexdigest()
+
+    # --- 문자열 풀 ---
+    def _string_bytes(self, sid: int) -> bytes:
+        return self._str_blob[self._str_offsets[sid]:self._str_offsets[sid + 1]].tobytes()
+
+    def string(self, sid: int) -> str:
+        # 같은 id 는 같은 str 객체 (cuisine / category 등 반복 문자열이 메모리를 공유)
+        s = self._strings[sid]
+        if s is None:
+            s = self._strings[sid] = sys.intern(self._string_bytes(sid).decode("utf-8"))
+        return s
+
+    @property
+    def validation_report(self) -> dict:
+        blob = self._cols.get("report")
+        return json.loads(blob.tobytes().decode("utf-8")) if blob is not None and len(blob) else {}
+
+    # --- 열(column) 접근 ---
+    def column(self, name: str) -> np.ndarray:
+        """읽기 전용 numpy 열 (예: column("calories"))"""
+        return self._cols[name]
+
+    # --- key 탐색 ---
+    def index_of(self, key: str) -> int:
+        """key → 행 번호 (없으면 -1), 정렬된 key 순서로 이진 탐색"""
+        target = key.encode("utf-8")
+        order = self._cols["key_order"]
+        key_sids = self._cols["key"]
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            cur = self._string_bytes(key_sids[order[mid]])
+            if cur < target:
+                lo = mid + 1
+            elif cur > target:
+                hi = mid
+            else:
+                return int(order[mid])
+        return -1
+
+    def key_at(self, row: int) -> str:
+        return self.string(self._cols["key"][row])
+
+    def record(self, row: int) -> FoodRecord:
+        rec = self._records[row]
+        if rec is None:
+            rec = self._records[row] = self._make_record(row)
+        return rec
+
+    def _make_record(self, row: int) -> FoodRecord:
+        c = self._cols
+        start, count = int(c["tag_start"][row]), int(c["tag_count"][row])
+        nutrients = {}
+        for field in NUTRIENT_FIELDS:
+            value = float(c[field][row])
+            if value == value:  # NaN = 값 없음
+                nutrients[field] = value
+        return FoodRecord(
+            key=self.key_at(row),
+            foodName=self.string(c["foodName"][row]),
+            calories=int(c["calories"][row]),
+            cuisine=self.string(c["cuisine"][row]),
+            category=self.string(c["category"][row]),
+            portion=self.string(c["portion"][row]),
+            tags=tuple(self.string(sid) for sid in c["tags"][start:start + count]),
+            **nutrients,
+        )
+
+    # --- Mapping ---
+    def __getitem__(self, key: str) -> FoodRecord:
+        row = self.index_of(key)
+        if row < 0:
+            raise KeyError(key)
+        return self.record(row)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self.index_of(key) >= 0
+
+    def __iter__(self):
+        for row in range(self._count):
+            yield self.key_at(row)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def main(argv):
+    strict = "--strict" in argv
+    args = [a for a in argv if a != "--strict"]
+    here = os.path.dirname(os.path.abspath(__file__))
+    source = args[1] if len(args) > 1 else os.path.join(here, "data", "food_table.json")
+    out = args[2] if len(args) > 2 else os.path.splitext(source)[0] + ".bin"
+    try:
+        report = compile_food_table(source, out, strict=strict)
+    except FoodTableError as e:
+        if e.report:
+            print(report_summary(e.report))
+        sys.exit(str(e))
+    print(report_summary(report))
+    print(f"built {out}: {report['accepted']} foods, {os.path.getsize(out)} bytes")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "build":
+        sys.exit("usage: python -m food_table build [source.json] [out.bin] [--strict]")
+    main(sys.argv[1:])
@@ -0,0 +1,58 @@
+import io
+
+import numpy as np
+from PIL import Image
+
+
+# -----------------------------
+# 모델 입력 크기에 맞춘 빠른 이미지 디코딩
+#   - JPEG 은 디코더의 축소(draft) 모드로 1/2, 1/4, 1/8 스케일에서 바로 디코딩
+#     → 12MP 사진을 전부 풀지 않고 imgsz 바로 위 크기로만 디코딩
+#   - PIL → numpy 변환은 복사 한 번으로 끝냄 (np.array 의 이중 복사 제거)
+# -----------------------------
+def draft_request_size(width: int, height: int, target_size: int):
+    """긴 변이 target_size 가 되도록 줄인 크기 (draft 는 이 크기 이상으로만 줄여줌)"""
+    long_side = max(width, height)
+    if not target_size or long_side <= target_size:
+        return None
+    scale = target_size / long_side
+    return (max(1, int(width * scale + 0.999)), max(1, int(height * scale + 0.999)))
+
+
+def open_image_for_model(img_bytes: bytes, target_size: int = 640) -> Image.Image:
+    """바이트 → RGB PIL.Image (JPEG 이면 target_size 기준 draft 디코딩)"""
+    img = Image.open(io.BytesIO(img_bytes))
+
+    if img.format == "JPEG":
+        request = draft_request_size(img.width, img.height, target_size)
+        if request is not None:
+            img.draft("RGB", request)
+
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    img.load()
+    return img
+
+
+def image_to_array(img: Image.Image) -> np.ndarray:
+    """PIL.Image → (H, W, 3) uint8 연속 배열 (읽기 전용, 복사 1회)"""
+    arr = np.asarray(img)
+    if not arr.flags.c_contiguous:
+        arr = np.ascontiguousarray(arr)
+    return arr
+
+
+# -----------------------------
+# 근접 중복(연속 촬영) 판별용 perceptual hash
+#   - dHash: 9x8 흑백 축소 이미지에서 가로 방향 밝기 차이 부호 64비트
+#   - 몇 픽셀 흔들린 사진은 해밍 거리가 작게 나옴
+# -----------------------------
+DHASH_BITS = np.left_shift(np.uint64(1), np.arange(64, dtype=np.uint64))
+
+
+def dhash64(arr: np.ndarray) -> int:
+    """(H, W, 3) uint8 배열 → 64비트 dHash"""
+    small = Image.fromarray(arr).convert("L").resize((9, 8), Image.BOX)
+    px = np.asarray(small, dtype=np.int16)
+    diff = (px[:, 1:] > px[:, :-1]).ravel()
+    return int(DHASH_BITS[diff].sum())
@@ -1,14 +1,36 @@
+import asyncio
 import base64
-import io
+import hmac
+import itertools
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import numpy as np
 from PIL import Image
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from starlette.formparsers import MultiPartException, MultiPartParser
+from pydantic import BaseModel, ValidationError
 
-from ultralytics import YOLO
+from backends import DEFAULT_MODEL_PATHS, backend_class, load_backend
+from batcher import InferenceBatcher, QueueFullError
+from camera import CameraLimiter
+from dedupe import suppress_cross_class
+from food_index import round_confidences
+from food_meta import META_FIELDS
+from food_query import INDEXED_FIELDS
+from food_schema import record_to_dict, report_summary
+from food_state import FoodStateReloader, build_food_state
+from imaging import dhash64, image_to_array, open_image_for_model
+from nutrition import totals_dict, zero_totals
+from portion import PortionEstimator
+from result_cache import NearDuplicateCache, ResultCache
+from tracking import FrameTracker, frame_signature
 
 # -----------------------------
 # 1. FastAPI 기본 설정
@@ -29,18 +51,110 @@ app.add_middleware(
 # -----------------------------
 class ImageData(BaseModel):
     image: str   # base64 문자열
+    nearDuplicate: bool = True   # 연속 촬영 근접 중복 캐시 사용 여부 (False 면 항상 새로 추론, X-Client-Id 헤더가 있어야 사용)
+    includeMeta: bool = False    # True 면 item 마다 score / risk / recommend 포함
+    includeMacros: bool = False  # True 면 탄수화물 / 단백질 / 지방 / 당 / 나트륨 합계(macros) 포함
+
+
+class BatchImageData(BaseModel):
+    images: List[str]   # base64 문자열 목록 (하루치 식사 사진 등)
+    nearDuplicate: bool = True
+    includeMeta: bool = False
+    includeMacros: bool = False
 
 
 # -----------------------------
 # 3. YOLO 모델 로딩
+#    - SMARTCAL_BACKEND=torch : ultralytics(PyTorch) 로 .pt 실행 (기본)
+#    - SMARTCAL_BACKEND=onnx  : export 한 .onnx 를 ONNX Runtime(CPU) 으로 실행
+#      (python -m tools.export_onnx yolov8n.pt 로 만들 수 있음)
+#    - SMARTCAL_BACKEND=onnx-int8 : INT8 양자화 모델 (python -m tools.quantize 로 만들고,
+#      정확도 게이트를 통과해서 .report.json 에 promoted=true + 같은 파일 해시가 있는 모델만 로딩)
 # -----------------------------
-MODEL_PATH = "yolov8n.pt"  # 나중에 yolov8m.pt 등으로 변경 가능
-model = YOLO(MODEL_PATH)
+BACKEND = os.getenv("SMARTCAL_BACKEND", "torch")
+MODEL_PATH = os.getenv("SMARTCAL_MODEL_PATH", DEFAULT_MODEL_PATHS.get(BACKEND, "yolov8n.pt"))  # 나중에 yolov8m 등으로 변경 가능
+
+# YOLO 입력 해상도 (JPEG 은 이 크기 바로 위 스케일로만 디코딩)
+IMGSZ = int(os.getenv("SMARTCAL_IMGSZ", "640"))
+
+# 이 신뢰도 미만 박스는 모델 안(NMS 전)에서 버림
+CONF_THRESHOLD = float(os.getenv("SMARTCAL_CONF_THRESHOLD", "0.35"))
+
+# 동시 요청을 모아서 한 번에 추론 (마이크로 배칭)
+#   - 환경변수로 배치 크기 / 대기 시간 / 대기열 길이 조절 가능
+BATCH_MAX_SIZE = int(os.getenv("SMARTCAL_BATCH_MAX_SIZE", "8"))
+BATCH_MAX_WAIT_MS = float(os.getenv("SMARTCAL_BATCH_MAX_WAIT_MS", "10"))
+BATCH_QUEUE_DEPTH = int(os.getenv("SMARTCAL_BATCH_QUEUE_DEPTH", "64"))
+
+# 작업 풀 크기 / 동시 처리 상한
+#   - 디코딩(base64, JPEG)은 디코딩 전용 스레드 풀
+#   - YOLO 추론은 별도의 추론 풀 (워커 하나당 연산 스레드 수를 나눠서 코어 과다 사용 방지)
+#   - 동시에 처리 중인 /predict 요청 수는 MAX_CONCURRENCY 로 제한 (나머지는 대기)
+#   - 추론 워커들은 모델 인스턴스 하나를 같이 씀 → 동시 호출이 안전한 onnx / onnx-int8 만 여러 개 가능
+#     (torch 는 SMARTCAL_INFER_WORKERS 를 무시하고 1개)
+CPU_COUNT = os.cpu_count() or 1
+DECODE_WORKERS = int(os.getenv("SMARTCAL_DECODE_WORKERS", str(min(4, CPU_COUNT))))
+INFER_WORKERS = max(1, int(os.getenv("SMARTCAL_INFER_WORKERS", "1")))
+if INFER_WORKERS > 1 and not backend_class(BACKEND).thread_safe:
+    print(f"[경고] {BACKEND} 백엔드는 동시 호출이 안전하지 않아서 추론 워커를 1개로 줄입니다 (SMARTCAL_INFER_WORKERS={INFER_WORKERS}).")
+    INFER_WORKERS = 1
+INFER_THREADS = int(
+    os.getenv("SMARTCAL_INFER_THREADS", str(max(1, CPU_COUNT // max(1, INFER_WORKERS))))
+)
+MAX_CONCURRENCY = int(os.getenv("SMARTCAL_MAX_CONCURRENCY", str(BATCH_QUEUE_DEPTH)))
+
+model = load_backend(BACKEND, MODEL_PATH, imgsz=IMGSZ, threads=INFER_THREADS)
 names = model.names  # 클래스 이름 딕셔너리 (id → name)
 
+DECODE_EXECUTOR = ThreadPoolExecutor(max_workers=DECODE_WORKERS, thread_name_prefix="decode")
+INFER_EXECUTOR = ThreadPoolExecutor(max_workers=INFER_WORKERS, thread_name_prefix="infer")
+PREDICT_SLOTS = asyncio.Semaphore(MAX_CONCURRENCY)
+
+batcher = InferenceBatcher(
+    model,
+    max_batch_size=BATCH_MAX_SIZE,
+    max_wait_ms=BATCH_MAX_WAIT_MS,
+    queue_depth=BATCH_QUEUE_DEPTH,
+    executor=INFER_EXECUTOR,
+    max_inflight=INFER_WORKERS,
+)
+
+
+# 같은 사진 재전송 시 추론 없이 바로 응답 (0 이면 끔)
+result_cache = ResultCache(
+    max_entries=int(os.getenv("SMARTCAL_CACHE_MAX_ENTRIES", "1024")),
+    max_bytes=int(float(os.getenv("SMARTCAL_CACHE_MAX_MB", "16")) * 1024 * 1024),
+    ttl_sec=float(os.getenv("SMARTCAL_CACHE_TTL_SEC", "600")),
+)
+
+# 몇 픽셀만 다른 연속 촬영 사진은 perceptual hash 로 찾아서 이전 결과 재사용
+#   - threshold: 64비트 해시 중 다른 비트 수 허용치 (-1 이면 끔)
+#   - 같은 클라이언트 / 같은 카메라 연결이 보낸 사진끼리만 재사용
+#       클라이언트 = X-Client-Id 헤더 (앱 설치마다 만든 임의 ID 등), 없으면 근접 중복 캐시를 쓰지 않음
+#       SMARTCAL_NEARDUP_SCOPE=ip 면 헤더가 없을 때 접속 주소로 대신함
+#       (같은 NAT / 프록시 뒤 사용자끼리 결과가 섞일 수 있어서 기본은 끔)
+#   - 근접 중복으로 찾은 응답은 같은 사진 캐시(result_cache)에 넣지 않음
+#     (nearDuplicate=false 로 같은 바이트를 다시 보내면 새로 추론해야 하므로)
+near_dup_cache = NearDuplicateCache(
+    capacity=int(os.getenv("SMARTCAL_NEARDUP_CAPACITY", "512")),
+    threshold=int(os.getenv("SMARTCAL_NEARDUP_THRESHOLD", "4")),
+    ttl_sec=float(os.getenv("SMARTCAL_NEARDUP_TTL_SEC", "60")),
+)
+NEARDUP_SCOPE = os.getenv("SMARTCAL_NEARDUP_SCOPE", "client")
+
+
+@app.on_event("shutdown")
+def shutdown_workers():
+    foods.close()
+    batcher.close()
+    INFER_EXECUTOR.shutdown(wait=False)
+    DECODE_EXECUTOR.shutdown(wait=False)
+
 
 # -----------------------------
 # 4. 확장된 칼로리/정보 테이블
+#    - 내용은 data/food_table.json (한 줄에 음식 하나), 서버는 빌드된 .bin 을 mmap 으로 사용
+#      (python -m food_table build 로 미리 빌드 가능)
 #    - key: YOLO 클래스 이름 또는 커스텀 클래스 이름
 #    - foodName: 한국어 표시 이름
 #    - calories: 대략적인 1인분 칼로리
@@ -49,3803 +163,106 @@ names = model.names  # 클래스 이름 딕셔너리 (id → name)
 #    - portion: 기준량 설명
 #    - tags: 추가 태그(선택)
 # -----------------------------
-const CALORIE_TABLE_RAW = {
-    # =============================
-    # 🍚 한식 - 밥/비빔밥
-    # =============================
-       "k_rice_basic": {
-        "foodName": "쌀밥(1공기)",
-        "calories": 300,
-        "cuisine": "Korean",
-        "category": "밥",
-        "portion": "1공기",
-        "tags": ["기본", "집밥"],
-    },
-    "k_rice_brown": {
-        "foodName": "현미밥(1공기)",
-        "calories": 330,
-        "cuisine": "Korean",
-        "category": "밥",
-        "portion": "1공기",
-        "tags": ["건강식"],
-    },
-    "k_japgokbab": {
-        "foodName": "잡곡밥(1공기)",
-        "calories": 350,
-        "cuisine": "Korean",
-        "category": "밥",
-        "portion": "1공기",
-        "tags": ["건강식"],
-    },
-    "k_kimchi_fried_rice": {
-        "foodName": "김치볶음밥",
-        "calories": 680,
-        "cuisine": "Korean",
-        "category": "볶음밥",
-        "portion": "1접시",
-        "tags": ["매운", "분식"],
-    },
-    "k_shrimp_fried_rice": {
-        "foodName": "새우볶음밥",
-        "calories": 610,
-        "cuisine": "Korean",
-        "category": "볶음밥",
-        "portion": "1접시",
-        "tags": ["해산물"],
-    },
-    "k_omurice": {
-        "foodName": "오므라이스",
-        "calories": 700,
-        "cuisine": "Korean",
-        "category": "볶음밥",
-        "portion": "1접시",
-        "tags": ["어린이", "분식"],
-    },
-    "k_bibimbap": {
-        "foodName": "비빔밥",
-        "calories": 550,
-        "cuisine": "Korean",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["야채", "정식"],
-    },
-    "k_bulgogi_rice": {
-        "foodName": "불고기덮밥",
-        "calories": 750,
-        "cuisine": "Korean",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["고기"],
-    },
-    "k_dakgalbi_rice": {
-        "foodName": "닭갈비밥",
-        "calories": 780,
-        "cuisine": "Korean",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["매운", "고기"],
-    },
-    "k_gomtang_rice": {
-        "foodName": "곰탕밥",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "국밥",
-        "portion": "1그릇",
-        "tags": ["국물"],
-    },
-    "k_ramen": {
-        "foodName": "라면",
-        "calories": 500,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1봉지",
-        "tags": ["간편", "분식"],
-    },
-    "k_udon": {
-        "foodName": "우동",
-        "calories": 420,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["국물"],
-    },
-    "k_jjolmyeon": {
-        "foodName": "쫄면",
-        "calories": 720,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["매운"],
-    },
-    "k_plain_naeng": {
-        "foodName": "물냉면",
-        "calories": 460,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["여름"],
-    },
-    "k_bibim_naeng": {
-        "foodName": "비빔냉면",
-        "calories": 540,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["매운", "여름"],
-    },
-    "k_tteokbokki_basic": {
-        "foodName": "기본 떡볶이",
-        "calories": 550,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1인분",
-        "tags": ["분식"],
-    },
-    "k_tteokbokki_cheese": {
-        "foodName": "치즈 떡볶이",
-        "calories": 680,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1인분",
-        "tags": ["떡볶이", "치즈"],
-    },
-    "k_fishcake": {
-        "foodName": "오뎅",
-        "calories": 240,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "3개",
-        "tags": ["국물"],
-    },
-    "k_sundae": {
-        "foodName": "순대",
-        "calories": 450,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1인분",
-        "tags": ["분식"],
-    },
-    "k_hotdog": {
-        "foodName": "핫도그",
-        "calories": 420,
-        "cuisine": "Korean",
-        "category": "간식",
-        "portion": "1개",
-        "tags": ["분식"],
-    },
-    "k_samgyeopsal": {
-        "foodName": "삼겹살(200g)",
-        "calories": 780,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "200g",
-        "tags": ["구이"],
-    },
-    "k_galbi": {
-        "foodName": "양념갈비(200g)",
-        "calories": 890,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "200g",
-        "tags": ["단짠"],
-    },
-    "k_bulgogi": {
-        "foodName": "불고기",
-        "calories": 510,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "1인분",
-        "tags": ["정식"],
-    },
-    "k_jeyuk": {
-        "foodName": "제육볶음",
-        "calories": 650,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "1인분",
-        "tags": ["매운"],
-    },
-    "k_makchang": {
-        "foodName": "막창구이",
-        "calories": 540,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "1인분",
-        "tags": ["야식"],
-    },
-    "k_kimchi_stew": {
-        "foodName": "김치찌개",
-        "calories": 450,
-        "cuisine": "Korean",
-        "category": "찌개",
-        "portion": "1인분",
-        "tags": ["찌개"],
-    },
-    "k_soybean_paste": {
-        "foodName": "된장찌개",
-        "calories": 350,
-        "cuisine": "Korean",
-        "category": "찌개",
-        "portion": "1인분",
-        "tags": ["찌개"],
-    },
-    "k_seolleong": {
-        "foodName": "설렁탕",
-        "calories": 540,
-        "cuisine": "Korean",
-        "category": "국",
-        "portion": "1그릇",
-        "tags": ["국물"],
-    },
-    "k_gamjatang": {
-        "foodName": "감자탕",
-        "calories": 700,
-        "cuisine": "Korean",
-        "category": "탕",
-        "portion": "1인분",
-        "tags": ["해장"],
-    },
-    "k_sundae_soup": {
-        "foodName": "순대국밥",
-        "calories": 630,
-        "cuisine": "Korean",
-        "category": "국밥",
-        "portion": "1그릇",
-        "tags": ["국밥"],
-    },
-    # =============================
-    # 🍰 디저트 / 베이커리 (Dessert 10종)
-    # =============================
-    "d_cake_strawberry": {
-        "foodName": "딸기 생크림 케이크(1조각)",
-        "calories": 360,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1조각",
-        "tags": ["케이크", "카페"],
-    },
-    "d_cheesecake": {
-        "foodName": "뉴욕 치즈케이크(1조각)",
-        "calories": 420,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1조각",
-        "tags": ["케이크", "진한맛"],
-    },
-    "d_tiramisu": {
-        "foodName": "티라미수(1조각)",
-        "calories": 380,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1조각",
-        "tags": ["커피", "디저트"],
-    },
-    "d_macaron": {
-        "foodName": "마카롱(1개)",
-        "calories": 90,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["달콤", "간식"],
-    },
-    "d_brownie": {
-        "foodName": "초코 브라우니(1조각)",
-        "calories": 320,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1조각",
-        "tags": ["초코", "디저트"],
-    },
-    "d_croissant": {
-        "foodName": "크루아상(1개)",
-        "calories": 260,
-        "cuisine": "Dessert",
-        "category": "빵",
-        "portion": "1개",
-        "tags": ["버터", "베이커리"],
-    },
-    "d_donut_choco": {
-        "foodName": "초코 도넛(1개)",
-        "calories": 320,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["도넛", "초코"],
-    },
-    "d_bungeoppang": {
-        "foodName": "붕어빵(1개)",
-        "calories": 170,
-        "cuisine": "Dessert",
-        "category": "간식",
-        "portion": "1개",
-        "tags": ["겨울간식", "빵"],
-    },
-    "d_hotteok": {
-        "foodName": "씨앗 호떡(1개)",
-        "calories": 280,
-        "cuisine": "Dessert",
-        "category": "간식",
-        "portion": "1개",
-        "tags": ["길거리음식", "겨울"],
-    },
-    "d_icecream_cone": {
-        "foodName": "소프트 아이스크림(1콘)",
-        "calories": 230,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1콘",
-        "tags": ["아이스크림", "간식"],
-    },
-
-    # =============================
-    # 🧃 음료 (Drinks 10종)
-    # =============================
-    "dr_americano_hot": {
-        "foodName": "아메리카노(핫)",
-        "calories": 5,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["저칼로리", "커피"],
-    },
-    "dr_americano_iced": {
-        "foodName": "아이스 아메리카노",
-        "calories": 5,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["저칼로리", "커피"],
-    },
-    "dr_caffe_latte": {
-        "foodName": "카페라떼",
-        "calories": 180,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["우유", "커피"],
-    },
-    "dr_vanilla_latte": {
-        "foodName": "바닐라라떼",
-        "calories": 260,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["단맛", "커피"],
-    },
-    "dr_milk_tea": {
-        "foodName": "버블 밀크티",
-        "calories": 320,
-        "cuisine": "Drink",
-        "category": "티",
-        "portion": "1잔",
-        "tags": ["버블티", "디저트"],
-    },
-    "dr_orange_juice": {
-        "foodName": "오렌지 주스",
-        "calories": 110,
-        "cuisine": "Drink",
-        "category": "주스",
-        "portion": "1잔(200ml)",
-        "tags": ["과일주스"],
-    },
-    "dr_cola_can": {
-        "foodName": "콜라(캔)",
-        "calories": 140,
-        "cuisine": "Drink",
-        "category": "탄산음료",
-        "portion": "1캔(355ml)",
-        "tags": ["탄산", "음료"],
-    },
-    "dr_cider_can": {
-        "foodName": "사이다(캔)",
-        "calories": 140,
-        "cuisine": "Drink",
-        "category": "탄산음료",
-        "portion": "1캔(355ml)",
-        "tags": ["탄산", "음료"],
-    },
-    "dr_sports_drink": {
-        "foodName": "이온음료",
-        "calories": 90,
-        "cuisine": "Drink",
-        "category": "음료",
-        "portion": "1병(240ml)",
-        "tags": ["운동", "수분보충"],
-    },
-    "dr_smoothie_strawberry": {
-        "foodName": "딸기 스무디",
-        "calories": 250,
-        "cuisine": "Drink",
-        "category": "스무디",
-        "portion": "1잔",
-        "tags": ["과일", "디저트"],
-    },
-
-    # =============================
-    # 🍗 치킨 / 안주류 (Chicken & Anju 10종)
-    # =============================
-    "ch_fried": {
-        "foodName": "후라이드 치킨(1인분)",
-        "calories": 750,
-        "cuisine": "Korean",
-        "category": "치킨",
-        "portion": "닭 1/2마리",
-        "tags": ["치킨", "안주"],
-    },
-    "ch_spicy": {
-        "foodName": "양념 치킨(1인분)",
-        "calories": 820,
-        "cuisine": "Korean",
-        "category": "치킨",
-        "portion": "닭 1/2마리",
-        "tags": ["매운", "단짠"],
-    },
-    "ch_soy_garlic": {
-        "foodName": "간장마늘 치킨(1인분)",
-        "calories": 790,
-        "cuisine": "Korean",
-        "category": "치킨",
-        "portion": "닭 1/2마리",
-        "tags": ["간장", "안주"],
-    },
-    "ch_boneless": {
-        "foodName": "순살 치킨(1인분)",
-        "calories": 780,
-        "cuisine": "Korean",
-        "category": "치킨",
-        "portion": "1접시",
-        "tags": ["치킨", "야식"],
-    },
-    "ch_ganjang_dakgangjeong": {
-        "foodName": "간장 닭강정(1인분)",
-        "calories": 680,
-        "cuisine": "Korean",
-        "category": "안주",
-        "portion": "1접시",
-        "tags": ["단짠", "분식"],
-    },
-    "ch_chicken_mayo": {
-        "foodName": "치킨마요 덮밥",
-        "calories": 790,
-        "cuisine": "Korean",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["덮밥", "치킨"],
-    },
-    "ch_samgyetang": {
-        "foodName": "삼계탕",
-        "calories": 750,
-        "cuisine": "Korean",
-        "category": "탕",
-        "portion": "1그릇",
-        "tags": ["보양식"],
-    },
-    "ch_dakgalbi_pan": {
-        "foodName": "철판 닭갈비(1인분)",
-        "calories": 690,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "1인분",
-        "tags": ["매운", "안주"],
-    },
-    "an_jjajang_tteokbokki": {
-        "foodName": "짜장 떡볶이",
-        "calories": 650,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1인분",
-        "tags": ["분식", "퓨전"],
-    },
-    "an_cheese_french_fries": {
-        "foodName": "치즈 감자튀김",
-        "calories": 520,
-        "cuisine": "Western",
-        "category": "안주",
-        "portion": "1접시",
-        "tags": ["술안주", "간식"],
-    },
-
-    # =============================
-    # 🍣 일식 (Japanese 10종)
-    # =============================
-    "jp_sushi_set": {
-        "foodName": "모둠 스시(1인 세트)",
-        "calories": 520,
-        "cuisine": "Japanese",
-        "category": "밥",
-        "portion": "1인분",
-        "tags": ["회", "일식"],
-    },
-    "jp_salmon_sushi": {
-        "foodName": "연어 스시(2개)",
-        "calories": 160,
-        "cuisine": "Japanese",
-        "category": "밥",
-        "portion": "2개",
-        "tags": ["연어", "일식"],
-    },
-    "jp_tuna_sushi": {
-        "foodName": "참치 스시(2개)",
-        "calories": 150,
-        "cuisine": "Japanese",
-        "category": "밥",
-        "portion": "2개",
-        "tags": ["참치", "일식"],
-    },
-    "jp_ramen": {
-        "foodName": "일본식 라멘",
-        "calories": 550,
-        "cuisine": "Japanese",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["국물", "면"],
-    },
-    "jp_udon": {
-        "foodName": "일식 우동",
-        "calories": 500,
-        "cuisine": "Japanese",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["국물", "일식"],
-    },
-    "jp_katsudon": {
-        "foodName": "가츠동",
-        "calories": 900,
-        "cuisine": "Japanese",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["돈가스", "덮밥"],
-    },
-    "jp_oyakodon": {
-        "foodName": "오야코동",
-        "calories": 780,
-        "cuisine": "Japanese",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["닭고기", "덮밥"],
-    },
-    "jp_curry_rice": {
-        "foodName": "일식 카레라이스",
-        "calories": 820,
-        "cuisine": "Japanese",
-        "category": "밥",
-        "portion": "1접시",
-        "tags": ["카레", "일식"],
-    },
-    "jp_takoyaki": {
-        "foodName": "타코야키(6개)",
-        "calories": 350,
-        "cuisine": "Japanese",
-        "category": "간식",
-        "portion": "6개",
-        "tags": ["길거리음식"],
-    },
-    "jp_tempura_set": {
-        "foodName": "모둠 텐동(튀김 덮밥)",
-        "calories": 880,
-        "cuisine": "Japanese",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["튀김", "일식"],
-    },
-
-    # =============================
-    # 🥡 중식 (Chinese 10종)
-    # =============================
-    "cn_jajangmyeon": {
-        "foodName": "짜장면",
-        "calories": 800,
-        "cuisine": "Chinese",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["중식"],
-    },
-    "cn_jjamppong": {
-        "foodName": "짬뽕",
-        "calories": 750,
-        "cuisine": "Chinese",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["중식", "매운"],
-    },
-    "cn_tangsuyuk": {
-        "foodName": "탕수육(1인분)",
-        "calories": 900,
-        "cuisine": "Chinese",
-        "category": "튀김",
-        "portion": "1인분",
-        "tags": ["중식", "안주"],
-    },
-    "cn_fried_rice": {
-        "foodName": "중식 볶음밥",
-        "calories": 720,
-        "cuisine": "Chinese",
-        "category": "볶음밥",
-        "portion": "1그릇",
-        "tags": ["중식"],
-    },
-    "cn_kkanpunggi": {
-        "foodName": "깐풍기(1인분)",
-        "calories": 780,
-        "cuisine": "Chinese",
-        "category": "고기",
-        "portion": "1인분",
-        "tags": ["매운", "튀김"],
-    },
-    "cn_malatang": {
-        "foodName": "마라탕(1그릇)",
-        "calories": 650,
-        "cuisine": "Chinese",
-        "category": "탕",
-        "portion": "1그릇",
-        "tags": ["마라", "매운"],
-    },
-    "cn_mapo_tofu": {
-        "foodName": "마파두부(1인분)",
-        "calories": 650,
-        "cuisine": "Chinese",
-        "category": "반찬",
-        "portion": "1접시",
-        "tags": ["두부", "매운"],
-    },
-    "cn_sweet_sour_chicken": {
-        "foodName": "꿔바로우(1인분)",
-        "calories": 880,
-        "cuisine": "Chinese",
-        "category": "튀김",
-        "portion": "1인분",
-        "tags": ["중식", "단짠"],
-    },
-    "cn_dumpling_steam": {
-        "foodName": "찐만두(6개)",
-        "calories": 360,
-        "cuisine": "Chinese",
-        "category": "간식",
-        "portion": "6개",
-        "tags": ["만두"],
-    },
-    "cn_dumpling_fried": {
-        "foodName": "군만두(6개)",
-        "calories": 420,
-        "cuisine": "Chinese",
-        "category": "간식",
-        "portion": "6개",
-        "tags": ["만두", "튀김"],
-    },
-    # =============================
-    # 🥗 샐러드 / 다이어트 (Salad & Diet 10종)
-    # =============================
-    "sd_chicken_salad": {
-        "foodName": "닭가슴살 샐러드",
-        "calories": 280,
-        "cuisine": "Western",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["다이어트", "저지방"],
-    },
-    "sd_cobb_salad": {
-        "foodName": "콥 샐러드",
-        "calories": 420,
-        "cuisine": "Western",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["샐러드", "치즈"],
-    },
-    "sd_caesar_salad": {
-        "foodName": "시저 샐러드",
-        "calories": 360,
-        "cuisine": "Western",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["샐러드"],
-    },
-    "sd_fruit_salad": {
-        "foodName": "과일 샐러드",
-        "calories": 220,
-        "cuisine": "Western",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["과일", "가벼운식사"],
-    },
-    "sd_greek_yogurt": {
-        "foodName": "그릭 요거트(토핑 포함)",
-        "calories": 280,
-        "cuisine": "Western",
-        "category": "간식",
-        "portion": "1컵",
-        "tags": ["요거트", "다이어트"],
-    },
-    "sd_smoked_chicken": {
-        "foodName": "훈제 닭가슴살(1팩)",
-        "calories": 190,
-        "cuisine": "Korean",
-        "category": "단백질",
-        "portion": "100g",
-        "tags": ["닭가슴살", "다이어트"],
-    },
-    "sd_protein_bar": {
-        "foodName": "프로틴 바(1개)",
-        "calories": 200,
-        "cuisine": "Snack",
-        "category": "간식",
-        "portion": "1개",
-        "tags": ["단백질", "간편"],
-    },
-    "sd_avocado_toast": {
-        "foodName": "아보카도 토스트",
-        "calories": 320,
-        "cuisine": "Western",
-        "category": "브런치",
-        "portion": "1조각",
-        "tags": ["브런치", "다이어트"],
-    },
-    "sd_boiled_egg2": {
-        "foodName": "삶은 계란(2개)",
-        "calories": 150,
-        "cuisine": "Global",
-        "category": "간식",
-        "portion": "2개",
-        "tags": ["단백질"],
-    },
-    "sd_salmon_salad": {
-        "foodName": "연어 샐러드",
-        "calories": 340,
-        "cuisine": "Western",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["연어", "건강식"],
-    },
-
-    # =============================
-    # 🍕 피자 / 버거 / 파스타 (Pizza & Burger & Pasta 12종)
-    # =============================
-    "fb_pizza_cheese": {
-        "foodName": "치즈 피자(1조각)",
-        "calories": 280,
-        "cuisine": "Western",
-        "category": "피자",
-        "portion": "1조각",
-        "tags": ["패스트푸드"],
-    },
-    "fb_pizza_pepperoni": {
-        "foodName": "페퍼로니 피자(1조각)",
-        "calories": 310,
-        "cuisine": "Western",
-        "category": "피자",
-        "portion": "1조각",
-        "tags": ["패스트푸드"],
-    },
-    "fb_pizza_bulgogi": {
-        "foodName": "불고기 피자(1조각)",
-        "calories": 320,
-        "cuisine": "Fusion",
-        "category": "피자",
-        "portion": "1조각",
-        "tags": ["불고기", "퓨전"],
-    },
-    "fb_burger_beef": {
-        "foodName": "불고기 버거",
-        "calories": 520,
-        "cuisine": "Western",
-        "category": "버거",
-        "portion": "1개",
-        "tags": ["패스트푸드"],
-    },
-    "fb_burger_cheese": {
-        "foodName": "치즈버거",
-        "calories": 550,
-        "cuisine": "Western",
-        "category": "버거",
-        "portion": "1개",
-        "tags": ["패스트푸드"],
-    },
-    "fb_burger_chicken": {
-        "foodName": "치킨버거",
-        "calories": 580,
-        "cuisine": "Western",
-        "category": "버거",
-        "portion": "1개",
-        "tags": ["치킨", "버거"],
-    },
-    "fb_pasta_cream": {
-        "foodName": "크림 파스타",
-        "calories": 780,
-        "cuisine": "Western",
-        "category": "파스타",
-        "portion": "1접시",
-        "tags": ["크림", "면"],
-    },
-    "fb_pasta_tomato": {
-        "foodName": "토마토 파스타",
-        "calories": 650,
-        "cuisine": "Western",
-        "category": "파스타",
-        "portion": "1접시",
-        "tags": ["토마토", "면"],
-    },
-    "fb_pasta_rose": {
-        "foodName": "로제 파스타",
-        "calories": 720,
-        "cuisine": "Fusion",
-        "category": "파스타",
-        "portion": "1접시",
-        "tags": ["로제", "면"],
-    },
-    "fb_french_fries": {
-        "foodName": "감자튀김(중간 사이즈)",
-        "calories": 400,
-        "cuisine": "Western",
-        "category": "사이드",
-        "portion": "1컵",
-        "tags": ["사이드", "패스트푸드"],
-    },
-    "fb_onion_ring": {
-        "foodName": "어니언 링",
-        "calories": 360,
-        "cuisine": "Western",
-        "category": "사이드",
-        "portion": "1접시",
-        "tags": ["튀김"],
-    },
-    "fb_chicken_nugget6": {
-        "foodName": "치킨 너겟(6개)",
-        "calories": 270,
-        "cuisine": "Western",
-        "category": "사이드",
-        "portion": "6개",
-        "tags": ["간식", "치킨"],
-    },
-
-    # =============================
-    # 🏪 편의점 간식 / 즉석식품 (CVS 12종)
-    # =============================
-    "cvs_triangle_kimbap": {
-        "foodName": "삼각김밥",
-        "calories": 220,
-        "cuisine": "Korean",
-        "category": "간편식",
-        "portion": "1개",
-        "tags": ["편의점", "간편식"],
-    },
-    "cvs_lunchbox_basic": {
-        "foodName": "편의점 도시락(일반)",
-        "calories": 800,
-        "cuisine": "Korean",
-        "category": "도시락",
-        "portion": "1팩",
-        "tags": ["편의점", "한끼"],
-    },
-    "cvs_hotbar": {
-        "foodName": "어묵 핫바",
-        "calories": 210,
-        "cuisine": "Korean",
-        "category": "간식",
-        "portion": "1개",
-        "tags": ["편의점"],
-    },
-    "cvs_cup_ramen": {
-        "foodName": "컵라면",
-        "calories": 380,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1개",
-        "tags": ["편의점", "간편"],
-    },
-    "cvs_cup_tteokbokki": {
-        "foodName": "컵 떡볶이",
-        "calories": 430,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1컵",
-        "tags": ["편의점", "분식"],
-    },
-    "cvs_sandwich_egg": {
-        "foodName": "에그 샌드위치",
-        "calories": 360,
-        "cuisine": "Western",
-        "category": "샌드위치",
-        "portion": "1개",
-        "tags": ["편의점", "아침"],
-    },
-    "cvs_sandwich_club": {
-        "foodName": "클럽 샌드위치",
-        "calories": 450,
-        "cuisine": "Western",
-        "category": "샌드위치",
-        "portion": "1개",
-        "tags": ["편의점"],
-    },
-    "cvs_choco_bar": {
-        "foodName": "초코바 아이스크림",
-        "calories": 210,
-        "cuisine": "Dessert",
-        "category": "아이스크림",
-        "portion": "1개",
-        "tags": ["편의점", "디저트"],
-    },
-    "cvs_snack_chips": {
-        "foodName": "감자칩(소)",
-        "calories": 300,
-        "cuisine": "Snack",
-        "category": "과자",
-        "portion": "1봉지(소)",
-        "tags": ["과자"],
-    },
-    "cvs_snack_choco": {
-        "foodName": "초콜릿 과자",
-        "calories": 260,
-        "cuisine": "Snack",
-        "category": "과자",
-        "portion": "1봉지",
-        "tags": ["초코", "과자"],
-    },
-    "cvs_jelly": {
-        "foodName": "젤리(소량)",
-        "calories": 180,
-        "cuisine": "Snack",
-        "category": "과자",
-        "portion": "1봉지(소)",
-        "tags": ["간식", "젤리"],
-    },
-    "cvs_energy_drink": {
-        "foodName": "에너지 드링크",
-        "calories": 120,
-        "cuisine": "Drink",
-        "category": "음료",
-        "portion": "1캔",
-        "tags": ["카페인"],
-    },
-
-    # =============================
-    # 🍳 한식 아침 / 집밥 (Korean Home 10종)
-    # =============================
-    "kh_egg_rice": {
-        "foodName": "계란밥",
-        "calories": 430,
-        "cuisine": "Korean",
-        "category": "밥",
-        "portion": "1그릇",
-        "tags": ["집밥", "아침"],
-    },
-    "kh_seaweed_soup": {
-        "foodName": "미역국(밥 제외)",
-        "calories": 120,
-        "cuisine": "Korean",
-        "category": "국",
-        "portion": "1그릇",
-        "tags": ["집밥"],
-    },
-    "kh_kongnamul_guk": {
-        "foodName": "콩나물국",
-        "calories": 90,
-        "cuisine": "Korean",
-        "category": "국",
-        "portion": "1그릇",
-        "tags": ["해장", "집밥"],
-    },
-    "kh_stirfry_kimchi": {
-        "foodName": "볶음김치(반찬)",
-        "calories": 80,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은 접시",
-        "tags": ["반찬"],
-    },
-    "kh_rolled_egg": {
-        "foodName": "계란말이",
-        "calories": 210,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "조각 4개",
-        "tags": ["반찬"],
-    },
-    "kh_stirfry_spam": {
-        "foodName": "스팸 볶음",
-        "calories": 260,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은 접시",
-        "tags": ["짠맛"],
-    },
-    "kh_stirfry_anchovy": {
-        "foodName": "멸치볶음",
-        "calories": 110,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은 접시",
-        "tags": ["칼슘"],
-    },
-    "kh_kimchi_pancake": {
-        "foodName": "김치전",
-        "calories": 420,
-        "cuisine": "Korean",
-        "category": "전",
-        "portion": "중간 크기 1장",
-        "tags": ["부침개"],
-    },
-    "kh_potato_pancake": {
-        "foodName": "감자전",
-        "calories": 360,
-        "cuisine": "Korean",
-        "category": "전",
-        "portion": "중간 크기 1장",
-        "tags": ["부침개"],
-    },
-    "kh_rice_porridge_chicken": {
-        "foodName": "닭죽",
-        "calories": 420,
-        "cuisine": "Korean",
-        "category": "죽",
-        "portion": "1그릇",
-        "tags": ["아침", "소화"],
-    },
-    # =============================
-    # 🍎 과일 / 자연식품 Fruits (12종)
-    # =============================
-    "fr_apple": {
-        "foodName": "사과(1개)",
-        "calories": 95,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1개",
-        "tags": ["비타민", "자연식"],
-    },
-    "fr_banana": {
-        "foodName": "바나나(1개)",
-        "calories": 105,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1개",
-        "tags": ["칼륨", "간식"],
-    },
-    "fr_orange": {
-        "foodName": "오렌지(1개)",
-        "calories": 60,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1개",
-        "tags": ["비타민C"],
-    },
-    "fr_strawberry_10": {
-        "foodName": "딸기(10개)",
-        "calories": 40,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "10개",
-        "tags": ["간식"],
-    },
-    "fr_grapes_100": {
-        "foodName": "포도(100g)",
-        "calories": 70,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "100g",
-        "tags": ["간식"],
-    },
-    "fr_peach": {
-        "foodName": "복숭아(1개)",
-        "calories": 60,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1개",
-        "tags": ["여름과일"],
-    },
-    "fr_watermelon_slice": {
-        "foodName": "수박(한 조각)",
-        "calories": 85,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1조각",
-        "tags": ["여름"],
-    },
-    "fr_pineapple_slice": {
-        "foodName": "파인애플(1조각)",
-        "calories": 50,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1조각",
-        "tags": ["열대과일"],
-    },
-    "fr_melon_slice": {
-        "foodName": "메론(한 조각)",
-        "calories": 75,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1조각",
-        "tags": ["여름"],
-    },
-    "fr_blueberry_100": {
-        "foodName": "블루베리(100g)",
-        "calories": 57,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "100g",
-        "tags": ["항산화"],
-    },
-    "fr_tangerine2": {
-        "foodName": "귤(2개)",
-        "calories": 70,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "2개",
-        "tags": ["겨울과일"],
-    },
-    "fr_kiwi": {
-        "foodName": "키위(1개)",
-        "calories": 45,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1개",
-        "tags": ["비타민C"],
-    },
-
-    # =============================
-    # 🐟 해산물 Seafood (10종)
-    # =============================
-    "sf_sashimi": {
-        "foodName": "모둠 회(1인분)",
-        "calories": 360,
-        "cuisine": "Korean",
-        "category": "해산물",
-        "portion": "1인분",
-        "tags": ["회", "단백질"],
-    },
-    "sf_grilled_salmon": {
-        "foodName": "연어구이",
-        "calories": 470,
-        "cuisine": "Western",
-        "category": "해산물",
-        "portion": "1접시",
-        "tags": ["연어"],
-    },
-    "sf_simchi": {
-        "foodName": "고등어구이",
-        "calories": 430,
-        "cuisine": "Korean",
-        "category": "해산물",
-        "portion": "1접시",
-        "tags": ["구이"],
-    },
-    "sf_shrimp_boil": {
-        "foodName": "찐 새우(6개)",
-        "calories": 180,
-        "cuisine": "Global",
-        "category": "해산물",
-        "portion": "6개",
-        "tags": ["저지방"],
-    },
-    "sf_squid_stirfry": {
-        "foodName": "오징어볶음",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "해산물",
-        "portion": "1접시",
-        "tags": ["매운"],
-    },
-    "sf_fish_cutlet": {
-        "foodName": "생선까스",
-        "calories": 560,
-        "cuisine": "Western",
-        "category": "튀김",
-        "portion": "1접시",
-        "tags": ["튀김"],
-    },
-    "sf_octopus": {
-        "foodName": "문어숙회",
-        "calories": 370,
-        "cuisine": "Korean",
-        "category": "해산물",
-        "portion": "1접시",
-        "tags": ["술안주"],
-    },
-    "sf_clam_soup": {
-        "foodName": "조개탕",
-        "calories": 200,
-        "cuisine": "Korean",
-        "category": "국물",
-        "portion": "1그릇",
-        "tags": ["해장"],
-    },
-    "sf_mussel_soup": {
-        "foodName": "홍합탕",
-        "calories": 220,
-        "cuisine": "Korean",
-        "category": "국물",
-        "portion": "1그릇",
-        "tags": ["해장"],
-    },
-    "sf_eel_bowl": {
-        "foodName": "장어덮밥",
-        "calories": 780,
-        "cuisine": "Japanese",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["원기"],
-    },
-
-    # =============================
-    # 🍢 분식 Street Food (12종)
-    # =============================
-    "sf_tonkatsu": {
-        "foodName": "돈가스",
-        "calories": 790,
-        "cuisine": "Japanese",
-        "category": "튀김",
-        "portion": "1접시",
-        "tags": ["분식"],
-    },
-    "sf_bbq_sausage": {
-        "foodName": "빨간소세지볶음",
-        "calories": 390,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은 접시",
-        "tags": ["분식", "안주"],
-    },
-    "sf_corn_dog": {
-        "foodName": "핫도그(1개)",
-        "calories": 450,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1개",
-        "tags": ["분식"],
-    },
-    "sf_kim_mari": {
-        "foodName": "김말이튀김(3개)",
-        "calories": 410,
-        "cuisine": "Korean",
-        "category": "튀김",
-        "portion": "3개",
-        "tags": ["분식"],
-    },
-    "sf_soondae": {
-        "foodName": "순대(1인분)",
-        "calories": 550,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1인분",
-        "tags": ["분식"],
-    },
-    "sf_cream_tteok": {
-        "foodName": "크림 떡볶이(1인분)",
-        "calories": 720,
-        "cuisine": "Fusion",
-        "category": "분식",
-        "portion": "1인분",
-        "tags": ["떡볶이"],
-    },
-    "sf_rose_tteok": {
-        "foodName": "로제 떡볶이(1인분)",
-        "calories": 780,
-        "cuisine": "Fusion",
-        "category": "분식",
-        "portion": "1인분",
-        "tags": ["떡볶이"],
-    },
-    "sf_gungjung_tteok": {
-        "foodName": "궁중 떡볶이(1인분)",
-        "calories": 610,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1인분",
-        "tags": ["전통", "달달"],
-    },
-    "sf_fishcake": {
-        "foodName": "어묵",
-        "calories": 140,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1꼬치",
-        "tags": ["겨울", "간식"],
-    },
-    "sf_bungeoppang_2": {
-        "foodName": "붕어빵(2개)",
-        "calories": 330,
-        "cuisine": "Korean",
-        "category": "디저트",
-        "portion": "2개",
-        "tags": ["겨울간식"],
-    },
-    "sf_tanghuru": {
-        "foodName": "탕후루(딸기 3개)",
-        "calories": 240,
-        "cuisine": "Street",
-        "category": "디저트",
-        "portion": "3개",
-        "tags": ["달달"],
-    },
-    "sf_gukmul": {
-        "foodName": "떡볶이 국물 한컵...",
-        "calories": 180,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "컵",
-        "tags": ["매운", "중독"],
-    },
-    # =============================
-    # 1) 🍺 술 / 주류 Alcohol (10종)
-    # =============================
-    "al_beer_can": {
-        "foodName": "맥주 캔(355ml)",
-        "calories": 150,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "1캔(355ml)",
-        "tags": ["맥주", "알코올"],
-    },
-    "al_beer_500": {
-        "foodName": "생맥주(500ml)",
-        "calories": 210,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "500ml",
-        "tags": ["맥주", "회식"],
-    },
-    "al_soju_1shot": {
-        "foodName": "소주(1잔)",
-        "calories": 60,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "1잔(50ml)",
-        "tags": ["소주"],
-    },
-    "al_soju_half_bottle": {
-        "foodName": "소주 반병",
-        "calories": 300,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "180ml",
-        "tags": ["소주", "회식"],
-    },
-    "al_makgeolli_bowl": {
-        "foodName": "막걸리(사발 1그릇)",
-        "calories": 220,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "1사발(250ml)",
-        "tags": ["막걸리"],
-    },
-    "al_red_wine_glass": {
-        "foodName": "레드 와인(1잔)",
-        "calories": 125,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "150ml",
-        "tags": ["와인"],
-    },
-    "al_white_wine_glass": {
-        "foodName": "화이트 와인(1잔)",
-        "calories": 120,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "150ml",
-        "tags": ["와인"],
-    },
-    "al_whisky_shot": {
-        "foodName": "위스키 스트레이트(1샷)",
-        "calories": 70,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "30ml",
-        "tags": ["위스키"],
-    },
-    "al_highball": {
-        "foodName": "하이볼(1잔)",
-        "calories": 180,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "1잔",
-        "tags": ["칵테일"],
-    },
-    "al_cocktail_mojito": {
-        "foodName": "모히또(1잔)",
-        "calories": 200,
-        "cuisine": "Drink",
-        "category": "주류",
-        "portion": "1잔",
-        "tags": ["칵테일"],
-    },
-
-    # =============================
-    # 2) 👶 임산부 / 당뇨 / 유아 식단 (Special Diet 10종)
-    #    * 참고용 대략값
-    # =============================
-    "md_pregnant_bibimbap": {
-        "foodName": "채소 가득 비빔밥(임산부용)",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "밥",
-        "portion": "1그릇",
-        "tags": ["임산부", "저자극"],
-    },
-    "md_pregnant_salmon": {
-        "foodName": "구운 연어와 현미밥",
-        "calories": 600,
-        "cuisine": "Fusion",
-        "category": "메인",
-        "portion": "1접시",
-        "tags": ["임산부", "오메가3"],
-    },
-    "md_diabetes_brown_rice": {
-        "foodName": "현미밥 + 채소반찬 세트(당뇨식)",
-        "calories": 480,
-        "cuisine": "Korean",
-        "category": "식단",
-        "portion": "1세트",
-        "tags": ["당뇨식", "저당"],
-    },
-    "md_diabetes_salad_chicken": {
-        "foodName": "닭가슴살 샐러드(당뇨친화)",
-        "calories": 260,
-        "cuisine": "Western",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["당뇨식", "저탄수"],
-    },
-    "md_baby_porridge_veggie": {
-        "foodName": "야채 미음(유아)",
-        "calories": 120,
-        "cuisine": "Korean",
-        "category": "유아식",
-        "portion": "작은 그릇 1개",
-        "tags": ["이유식"],
-    },
-    "md_baby_porridge_chicken": {
-        "foodName": "닭고기 쌀죽(유아)",
-        "calories": 180,
-        "cuisine": "Korean",
-        "category": "유아식",
-        "portion": "작은 그릇 1개",
-        "tags": ["이유식", "단백질"],
-    },
-    "md_low_salt_soup": {
-        "foodName": "저염 야채국",
-        "calories": 80,
-        "cuisine": "Korean",
-        "category": "국",
-        "portion": "1그릇",
-        "tags": ["저염식"],
-    },
-    "md_gestational_snack": {
-        "foodName": "그릭요거트 + 견과류(간식)",
-        "calories": 230,
-        "cuisine": "Snack",
-        "category": "간식",
-        "portion": "1컵",
-        "tags": ["임산부", "단백질"],
-    },
-    "md_diabetes_snack": {
-        "foodName": "방울토마토 한 컵",
-        "calories": 35,
-        "cuisine": "Snack",
-        "category": "간식",
-        "portion": "1컵",
-        "tags": ["당뇨식", "저당"],
-    },
-    "md_baby_banana_half": {
-        "foodName": "바나나 반 개(유아)",
-        "calories": 50,
-        "cuisine": "Global",
-        "category": "유아식",
-        "portion": "0.5개",
-        "tags": ["이유식"],
-    },
-
-    # =============================
-    # 3) 🏋️ 헬스 / 고단백 식단 (Fitness & Protein 10종)
-    # =============================
-    "fit_lean_steak": {
-        "foodName": "저지방 스테이크(200g)",
-        "calories": 420,
-        "cuisine": "Western",
-        "category": "고기",
-        "portion": "200g",
-        "tags": ["고단백", "헬스"],
-    },
-    "fit_chicken_breast": {
-        "foodName": "구운 닭가슴살(150g)",
-        "calories": 250,
-        "cuisine": "Western",
-        "category": "고기",
-        "portion": "150g",
-        "tags": ["다이어트", "고단백"],
-    },
-    "fit_scrambled_egg_white": {
-        "foodName": "달걀흰자 스크램블",
-        "calories": 110,
-        "cuisine": "Western",
-        "category": "단백질",
-        "portion": "흰자 3개분",
-        "tags": ["저지방"],
-    },
-    "fit_protein_shake": {
-        "foodName": "프로틴 쉐이크(물 타서)",
-        "calories": 160,
-        "cuisine": "Drink",
-        "category": "보충제",
-        "portion": "1잔",
-        "tags": ["헬스", "단백질"],
-    },
-    "fit_protein_shake_milk": {
-        "foodName": "프로틴 쉐이크(우유 타서)",
-        "calories": 220,
-        "cuisine": "Drink",
-        "category": "보충제",
-        "portion": "1잔",
-        "tags": ["헬스", "단백질"],
-    },
-    "fit_cottage_cheese": {
-        "foodName": "코티지 치즈 볼",
-        "calories": 200,
-        "cuisine": "Western",
-        "category": "간식",
-        "portion": "1컵",
-        "tags": ["고단백"],
-    },
-    "fit_tofu_steak": {
-        "foodName": "두부스테이크",
-        "calories": 260,
-        "cuisine": "Korean",
-        "category": "단백질",
-        "portion": "1접시",
-        "tags": ["식물성 단백질"],
-    },
-    "fit_salmon_salad": {
-        "foodName": "연어 샐러드(헬스용)",
-        "calories": 340,
-        "cuisine": "Western",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["오메가3", "단백질"],
-    },
-    "fit_egg_sandwich_lean": {
-        "foodName": "저칼로리 에그 샌드위치",
-        "calories": 320,
-        "cuisine": "Western",
-        "category": "샌드위치",
-        "portion": "1개",
-        "tags": ["다이어트"],
-    },
-    "fit_oatmeal_bowl": {
-        "foodName": "오트밀 볼(우유+과일)",
-        "calories": 350,
-        "cuisine": "Western",
-        "category": "아침식사",
-        "portion": "1그릇",
-        "tags": ["식이섬유"],
-    },
-
-    # =============================
-    # 4) 🕌 할랄 / 🥦 비건 / 🌾 글루텐 프리 (Halal/Vegan/GF 12종)
-    # =============================
-    "hv_halal_chicken_rice": {
-        "foodName": "할랄 치킨 오버 라이스",
-        "calories": 750,
-        "cuisine": "MiddleEast",
-        "category": "밥",
-        "portion": "1그릇",
-        "tags": ["할랄"],
-    },
-    "hv_falafel_wrap": {
-        "foodName": "팔라펠 랩",
-        "calories": 520,
-        "cuisine": "MiddleEast",
-        "category": "랩",
-        "portion": "1개",
-        "tags": ["할랄", "비건"],
-    },
-    "hv_hummus_plate": {
-        "foodName": "후무스 플레이트",
-        "calories": 420,
-        "cuisine": "MiddleEast",
-        "category": "딥&빵",
-        "portion": "1접시",
-        "tags": ["비건"],
-    },
-    "hv_vegan_bibimbap": {
-        "foodName": "비건 비빔밥(고기 없이)",
-        "calories": 480,
-        "cuisine": "Korean",
-        "category": "밥",
-        "portion": "1그릇",
-        "tags": ["비건"],
-    },
-    "hv_vegan_burger": {
-        "foodName": "비건 버거",
-        "calories": 520,
-        "cuisine": "Western",
-        "category": "버거",
-        "portion": "1개",
-        "tags": ["비건"],
-    },
-    "hv_vegan_pasta": {
-        "foodName": "토마토 비건 파스타",
-        "calories": 620,
-        "cuisine": "Western",
-        "category": "파스타",
-        "portion": "1접시",
-        "tags": ["비건"],
-    },
-    "hv_gf_bread": {
-        "foodName": "글루텐 프리 식빵(2조각)",
-        "calories": 180,
-        "cuisine": "Western",
-        "category": "빵",
-        "portion": "2조각",
-        "tags": ["글루텐프리"],
-    },
-    "hv_gf_pasta": {
-        "foodName": "글루텐 프리 파스타",
-        "calories": 640,
-        "cuisine": "Western",
-        "category": "파스타",
-        "portion": "1접시",
-        "tags": ["글루텐프리"],
-    },
-    "hv_soy_latte": {
-        "foodName": "두유 라떼",
-        "calories": 150,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["비건"],
-    },
-    "hv_almond_milk": {
-        "foodName": "아몬드 밀크(무가당)",
-        "calories": 30,
-        "cuisine": "Drink",
-        "category": "음료",
-        "portion": "1컵(240ml)",
-        "tags": ["비건", "저칼로리"],
-    },
-    "hv_quinoa_bowl": {
-        "foodName": "퀴노아 샐러드 볼",
-        "calories": 360,
-        "cuisine": "Fusion",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["비건", "글루텐프리"],
-    },
-    "hv_tofu_bowl": {
-        "foodName": "두부야채 볼",
-        "calories": 320,
-        "cuisine": "Fusion",
-        "category": "볼",
-        "portion": "1그릇",
-        "tags": ["비건", "고단백"],
-    },
-
-    # =============================
-    # 5) 🌏 세계 음식 (World Cuisine 12종)
-    # =============================
-    "wc_th_pad_thai": {
-        "foodName": "팟타이",
-        "calories": 750,
-        "cuisine": "Thai",
-        "category": "면",
-        "portion": "1접시",
-        "tags": ["태국"],
-    },
-    "wc_th_tom_yum": {
-        "foodName": "똠얌꿍",
-        "calories": 350,
-        "cuisine": "Thai",
-        "category": "수프",
-        "portion": "1그릇",
-        "tags": ["매운", "태국"],
-    },
-    "wc_vn_pho": {
-        "foodName": "베트남 쌀국수",
-        "calories": 450,
-        "cuisine": "Vietnamese",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["베트남"],
-    },
-    "wc_vn_banh_mi": {
-        "foodName": "반미 샌드위치",
-        "calories": 520,
-        "cuisine": "Vietnamese",
-        "category": "샌드위치",
-        "portion": "1개",
-        "tags": ["베트남"],
-    },
-    "wc_us_burger_set": {
-        "foodName": "버거 세트(버거+감튀+콜라)",
-        "calories": 980,
-        "cuisine": "American",
-        "category": "패스트푸드",
-        "portion": "1세트",
-        "tags": ["미국식"],
-    },
-    "wc_it_lasagna": {
-        "foodName": "라자냐",
-        "calories": 720,
-        "cuisine": "Italian",
-        "category": "파스타",
-        "portion": "1조각",
-        "tags": ["이탈리아"],
-    },
-    "wc_it_carbonara": {
-        "foodName": "까르보나라",
-        "calories": 780,
-        "cuisine": "Italian",
-        "category": "파스타",
-        "portion": "1접시",
-        "tags": ["크림", "이탈리아"],
-    },
-    "wc_mx_taco3": {
-        "foodName": "타코(3개)",
-        "calories": 600,
-        "cuisine": "Mexican",
-        "category": "랩",
-        "portion": "3개",
-        "tags": ["멕시코"],
-    },
-    "wc_mx_burrito": {
-        "foodName": "부리또",
-        "calories": 680,
-        "cuisine": "Mexican",
-        "category": "랩",
-        "portion": "1개",
-        "tags": ["멕시코"],
-    },
-    "wc_in_curry_chicken": {
-        "foodName": "인도식 치킨 커리 + 밥",
-        "calories": 780,
-        "cuisine": "Indian",
-        "category": "커리",
-        "portion": "1접시",
-        "tags": ["인도"],
-    },
-    "wc_in_naan": {
-        "foodName": "난(버터 난 1장)",
-        "calories": 260,
-        "cuisine": "Indian",
-        "category": "빵",
-        "portion": "1장",
-        "tags": ["인도"],
-    },
-    "wc_gr_gyro": {
-        "foodName": "그리스식 자이로",
-        "calories": 650,
-        "cuisine": "Greek",
-        "category": "랩",
-        "portion": "1개",
-        "tags": ["그리스"],
-    },
-
-    # =============================
-    # 6) 📊 디테일 영양소 버전 (Detail Nutrition 8종)
-    #    * calories + 탄단지 + 나트륨 + 당류
-    # =============================
-    "dn_kimbap_basic": {
-        "foodName": "김밥(1줄)",
-        "calories": 320,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1줄",
-        "tags": ["김밥"],
-        "carbs": 50,
-        "protein": 8,
-        "fat": 7,
-        "sodium": 700,
-        "sugar": 4,
-    },
-    "dn_tteokbokki_basic": {
-        "foodName": "떡볶이(1인분)",
-        "calories": 550,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1인분",
-        "tags": ["떡볶이"],
-        "carbs": 95,
-        "protein": 10,
-        "fat": 10,
-        "sodium": 1630,
-        "sugar": 15,
-    },
-    "dn_ramen_basic": {
-        "foodName": "라면(1봉지 조리)",
-        "calories": 500,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["라면"],
-        "carbs": 72,
-        "protein": 10,
-        "fat": 18,
-        "sodium": 1700,
-        "sugar": 3,
-    },
-    "dn_chicken_fried": {
-        "foodName": "후라이드 치킨(1인분)",
-        "calories": 750,
-        "cuisine": "Korean",
-        "category": "치킨",
-        "portion": "닭 1/2마리",
-        "tags": ["치킨"],
-        "carbs": 30,
-        "protein": 46,
-        "fat": 45,
-        "sodium": 1370,
-        "sugar": 4,
-    },
-    "dn_americano_sweet": {
-        "foodName": "시럽 추가 아이스 아메리카노",
-        "calories": 60,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["커피"],
-        "carbs": 15,
-        "protein": 1,
-        "fat": 0,
-        "sodium": 5,
-        "sugar": 15,
-    },
-    "dn_cola_can": {
-        "foodName": "콜라(캔 355ml)",
-        "calories": 140,
-        "cuisine": "Drink",
-        "category": "탄산음료",
-        "portion": "1캔",
-        "tags": ["탄산"],
-        "carbs": 39,
-        "protein": 0,
-        "fat": 0,
-        "sodium": 45,
-        "sugar": 39,
-    },
-    "dn_salad_chicken_light": {
-        "foodName": "닭가슴살 샐러드(드레싱 적게)",
-        "calories": 230,
-        "cuisine": "Western",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["다이어트"],
-        "carbs": 12,
-        "protein": 28,
-        "fat": 7,
-        "sodium": 260,
-        "sugar": 5,
-    },
-    "dn_oatmeal_plain": {
-        "foodName": "플레인 오트밀(우유 없이)",
-        "calories": 190,
-        "cuisine": "Western",
-        "category": "아침식사",
-        "portion": "1그릇",
-        "tags": ["식이섬유"],
-        "carbs": 32,
-        "protein": 6,
-        "fat": 3,
-        "sodium": 2,
-        "sugar": 1,
-    },
-    # =============================
-    # 🏫 학교 급식 / 단체 식단 (School Meal 12종)
-    # =============================
-    "sm_fried_rice": {
-        "foodName": "급식 볶음밥",
-        "calories": 620,
-        "cuisine": "Korean",
-        "category": "급식",
-        "portion": "1그릇",
-        "tags": ["학교급식"],
-    },
-    "sm_curry_rice": {
-        "foodName": "급식 카레라이스",
-        "calories": 680,
-        "cuisine": "Korean",
-        "category": "급식",
-        "portion": "1그릇",
-        "tags": ["카레"],
-    },
-    "sm_sausage_stir": {
-        "foodName": "비엔나 소시지볶음",
-        "calories": 260,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은 접시",
-        "tags": ["급식반찬"],
-    },
-    "sm_tofu_stew": {
-        "foodName": "순두부찌개",
-        "calories": 360,
-        "cuisine": "Korean",
-        "category": "찌개",
-        "portion": "1그릇",
-        "tags": ["급식"],
-    },
-    "sm_fish_cutlet": {
-        "foodName": "생선까스(급식)",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "튀김",
-        "portion": "1개",
-        "tags": ["밥반찬"],
-    },
-    "sm_cold_noodle": {
-        "foodName": "비빔국수",
-        "calories": 540,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["여름"],
-    },
-    "sm_kimchi": {
-        "foodName": "급식 김치",
-        "calories": 30,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "조금",
-        "tags": ["김치"],
-    },
-    "sm_fishcake_soup": {
-        "foodName": "어묵국",
-        "calories": 120,
-        "cuisine": "Korean",
-        "category": "국",
-        "portion": "1그릇",
-        "tags": ["국물"],
-    },
-    "sm_bulgogi": {
-        "foodName": "급식 불고기",
-        "calories": 430,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "1접시",
-        "tags": ["단체급식"],
-    },
-    "sm_egg_roll": {
-        "foodName": "계란말이",
-        "calories": 210,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "조각 4개",
-        "tags": ["반찬"],
-    },
-    "sm_jjajang": {
-        "foodName": "급식 짜장밥",
-        "calories": 730,
-        "cuisine": "Korean",
-        "category": "밥",
-        "portion": "1그릇",
-        "tags": ["급식"],
-    },
-    "sm_yogurt": {
-        "foodName": "급식 요구르트",
-        "calories": 60,
-        "cuisine": "Dessert",
-        "category": "간식",
-        "portion": "1병",
-        "tags": ["급식"],
-    },
-
-    # =============================
-    # 🌙 야식 / 배달 음식 (Night Menu 12종)
-    # =============================
-    "nt_bossam": {
-        "foodName": "보쌈(1인분)",
-        "calories": 760,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "1접시",
-        "tags": ["야식"],
-    },
-    "nt_jokbal": {
-        "foodName": "족발(1인분)",
-        "calories": 840,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "1접시",
-        "tags": ["야식"],
-    },
-    "nt_chicken_half": {
-        "foodName": "치킨 반마리",
-        "calories": 820,
-        "cuisine": "Korean",
-        "category": "치킨",
-        "portion": "반마리",
-        "tags": ["야식", "치킨"],
-    },
-    "nt_tteok_pizza": {
-        "foodName": "떡볶이 + 피자 세트",
-        "calories": 1100,
-        "cuisine": "Fusion",
-        "category": "세트",
-        "portion": "2인분",
-        "tags": ["야식폭탄"],
-    },
-    "nt_sushi_set": {
-        "foodName": "모둠초밥(배달)",
-        "calories": 720,
-        "cuisine": "Japanese",
-        "category": "밥",
-        "portion": "1세트",
-        "tags": ["신선"],
-    },
-    "nt_champon_rice": {
-        "foodName": "짬뽕밥",
-        "calories": 950,
-        "cuisine": "Chinese",
-        "category": "면+밥",
-        "portion": "1그릇",
-        "tags": ["매운"],
-    },
-    "nt_rose_pasta": {
-        "foodName": "명란 로제 파스타",
-        "calories": 860,
-        "cuisine": "Fusion",
-        "category": "파스타",
-        "portion": "1접시",
-        "tags": ["야식"],
-    },
-    "nt_kimbap_set": {
-        "foodName": "김밥 2줄 + 튀김",
-        "calories": 1050,
-        "cuisine": "Korean",
-        "category": "세트",
-        "portion": "2줄",
-        "tags": ["분식"],
-    },
-    "nt_burger_deluxe": {
-        "foodName": "버거 세트(배달)",
-        "calories": 1200,
-        "cuisine": "American",
-        "category": "세트",
-        "portion": "1세트",
-        "tags": ["패스트푸드"],
-    },
-    "nt_udon_tempura": {
-        "foodName": "튀김우동",
-        "calories": 680,
-        "cuisine": "Japanese",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["면"],
-    },
-    "nt_ramyun_cheese": {
-        "foodName": "치즈 라면",
-        "calories": 600,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["컵라면"],
-    },
-    "nt_pork_cutlet": {
-        "foodName": "배달 돈가스",
-        "calories": 820,
-        "cuisine": "Japanese",
-        "category": "튀김",
-        "portion": "1접시",
-        "tags": ["튀김"],
-    },
-
-    # =============================
-    # ☕ 카페 베이커리 & 음료 확장 (Cafe Bakery 15종)
-    # =============================
-    "cb_cafe_mocha": {
-        "foodName": "카페모카",
-        "calories": 290,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["초코", "카페"],
-    },
-    "cb_caramel_latte": {
-        "foodName": "카라멜 라떼",
-        "calories": 330,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["달달"],
-    },
-    "cb_green_tea_latte": {
-        "foodName": "녹차 라떼",
-        "calories": 280,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["녹차"],
-    },
-    "cb_choco_latte": {
-        "foodName": "초코 라떼",
-        "calories": 350,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["초코"],
-    },
-    "cb_scone": {
-        "foodName": "스콘(플레인)",
-        "calories": 380,
-        "cuisine": "Dessert",
-        "category": "빵",
-        "portion": "1개",
-        "tags": ["카페"],
-    },
-    "cb_scone_blueberry": {
-        "foodName": "블루베리 스콘",
-        "calories": 420,
-        "cuisine": "Dessert",
-        "category": "빵",
-        "portion": "1개",
-        "tags": ["과일"],
-    },
-    "cb_canelle": {
-        "foodName": "까눌레(1개)",
-        "calories": 200,
-        "cuisine": "French",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["카페"],
-    },
-    "cb_tart_egg": {
-        "foodName": "에그타르트(1개)",
-        "calories": 250,
-        "cuisine": "Portuguese",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["달달"],
-    },
-    "cb_cake_tiramisu": {
-        "foodName": "티라미수 케이크",
-        "calories": 380,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1조각",
-        "tags": ["케이크"],
-    },
-    "cb_bagel_creamcheese": {
-        "foodName": "크림치즈 베이글",
-        "calories": 420,
-        "cuisine": "Western",
-        "category": "빵",
-        "portion": "1개",
-        "tags": ["카페"],
-    },
-    "cb_honey_bread": {
-        "foodName": "허니브레드",
-        "calories": 680,
-        "cuisine": "Western",
-        "category": "디저트",
-        "portion": "1접시",
-        "tags": ["위험한칼로리"],
-    },
-    "cb_yogurt_granola": {
-        "foodName": "요거트 그라놀라",
-        "calories": 330,
-        "cuisine": "Western",
-        "category": "간식",
-        "portion": "1컵",
-        "tags": ["건강"],
-    },
-    "cb_strawberry_latte": {
-        "foodName": "생딸기 라떼",
-        "calories": 320,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["달달", "과일"],
-    },
-    "cb_earlgrey_milk_tea": {
-        "foodName": "얼그레이 밀크티",
-        "calories": 260,
-        "cuisine": "Drink",
-        "category": "티",
-        "portion": "1잔",
-        "tags": ["티"],
-    },
-    "cb_lemon_ade": {
-        "foodName": "레몬에이드",
-        "calories": 190,
-        "cuisine": "Drink",
-        "category": "에이드",
-        "portion": "1잔",
-        "tags": ["상큼"],
-    },
-# =============================
-# 🍱 Convenience Foods (편의점 간편식)
-# =============================
-"cv_spam_mayo_rice": {
-    "foodName": "스팸마요 덮밥",
-    "calories": 820,
-    "cuisine": "Convenience",
-    "category": "밥",
-    "portion": "1개",
-    "tags": ["편의점"],
-},
-"cv_tuna_gimbap": {
-    "foodName": "참치김밥",
-    "calories": 410,
-    "cuisine": "Convenience",
-    "category": "밥",
-    "portion": "1줄",
-    "tags": ["편의점"],
-},
-"cv_chicken_mayo": {
-    "foodName": "치킨마요",
-    "calories": 850,
-    "cuisine": "Convenience",
-    "category": "밥",
-    "portion": "1개",
-    "tags": ["인기메뉴"],
-},
-"cv_shrimp_burger": {
-    "foodName": "새우버거(편의점)",
-    "calories": 520,
-    "cuisine": "Convenience",
-    "category": "버거",
-    "portion": "1개",
-    "tags": ["간편"],
-},
-
-# =============================
-# 🍜 Korean Instant Ramen / Cup Noodles
-# =============================
-"ramen_budae": {
-    "foodName": "부대라면",
-    "calories": 560,
-    "cuisine": "Korean",
-    "category": "면",
-    "portion": "1봉지",
-    "tags": ["매운"],
-},
-"ramen_butter_corn": {
-    "foodName": "버터옥수수 라면",
-    "calories": 595,
-    "cuisine": "Korean",
-    "category": "면",
-    "portion": "1봉지",
-    "tags": ["고소"],
-},
-"ramen_red_cup": {
-    "foodName": "매운 큰컵 라면",
-    "calories": 480,
-    "cuisine": "Korean",
-    "category": "컵라면",
-    "portion": "1개",
-    "tags": ["컵라면"],
-},
-
-# =============================
-# 🇻🇳 동남아 음식 (Vietnam / Thai)
-# =============================
-"vn_banhmi": {
-    "foodName": "반미 샌드위치",
-    "calories": 520,
-    "cuisine": "Vietnam",
-    "category": "샌드위치",
-    "portion": "1개",
-    "tags": ["베트남"],
-},
-"th_tomyum": {
-    "foodName": "똠얌꿍",
-    "calories": 350,
-    "cuisine": "Thai",
-    "category": "수프",
-    "portion": "1그릇",
-    "tags": ["매운","해산물"],
-},
-
-# =============================
-# 🍔 글로벌 패스트푸드 브랜드별
-# =============================
-"mc_chicken": {
-    "foodName": "맥치킨",
-    "calories": 430,
-    "cuisine": "Western",
-    "category": "버거",
-    "portion": "1개",
-    "tags": ["맥도날드"],
-},
-"bk_chicken_king": {
-    "foodName": "치킨킹 버거",
-    "calories": 750,
-    "cuisine": "Western",
-    "category": "버거",
-    "portion": "1개",
-    "tags": ["버거킹"],
-},
-"kfc_hot_wings_4": {
-    "foodName": "핫윙(4개)",
-    "calories": 360,
-    "cuisine": "Western",
-    "category": "치킨",
-    "portion": "4개",
-    "tags": ["KFC","안주"],
-},
-
-# =============================
-# 🇮🇹 European / Italian
-# =============================
-"it_bolognese": {
-    "foodName": "볼로네제 파스타",
-    "calories": 680,
-    "cuisine": "Italian",
-    "category": "파스타",
-    "portion": "1접시",
-    "tags": ["토마토"],
-},
-"it_four_cheese_pizza": {
-    "foodName": "포치즈 피자",
-    "calories": 890,
-    "cuisine": "Italian",
-    "category": "피자",
-    "portion": "1판(조각6)",
-    "tags": ["치즈"],
-},
-
-# =============================
-# 🥗 Healthy & Diet Foods
-# =============================
-"hf_tofu_salad": {
-    "foodName": "두부 샐러드",
-    "calories": 260,
-    "cuisine": "Healthy",
-    "category": "샐러드",
-    "portion": "1그릇",
-    "tags": ["다이어트","비건"],
-},
-"hf_broccoli": {
-    "foodName": "브로콜리(100g)",
-    "calories": 35,
-    "cuisine": "Healthy",
-    "category": "야채",
-    "portion": "100g",
-    "tags": ["저칼로리"],
-},
-
-# =============================
-# 🧮 주요 식재료 (탄단지 자동 계산 지원)
-# =============================
-"ing_rice_100": {
-    "foodName": "백미(100g)",
-    "calories": 130,
-    "cuisine": "Ingredient",
-    "category": "탄수화물",
-    "portion": "100g",
-    "tags": ["식재료"],
-},
-"ing_salmon_100": {
-    "foodName": "연어(100g)",
-    "calories": 208,
-    "cuisine": "Ingredient",
-    "category": "단백질",
-    "portion": "100g",
-    "tags": ["오메가3"],
-},
-
-# =============================
-# 🍿 사진 기반 데이터 학습용 스낵
-# =============================
-"sn_almond": {
-    "foodName": "아몬드(한 줌)",
-    "calories": 160,
-    "cuisine": "Snack",
-    "category": "견과류",
-    "portion": "25g",
-    "tags": ["건강간식"],
-},
-"sn_cereal_bar": {
-    "foodName": "시리얼바",
-    "calories": 190,
-    "cuisine": "Snack",
-    "category": "간식",
-    "portion": "1개",
-    "tags": ["간편"],
-},
-
-# =============================
-# 🏋️ 운동 후 보충식
-# =============================
-"pt_greek_yogurt": {
-    "foodName": "그릭요거트(플레인)",
-    "calories": 120,
-    "cuisine": "Supplement",
-    "category": "간식",
-    "portion": "1컵",
-    "tags": ["단백질","저당"],
-},
-"pt_choco_milk": {
-    "foodName": "초코우유",
-    "calories": 180,
-    "cuisine": "Supplement",
-    "category": "음료",
-    "portion": "200ml",
-    "tags": ["운동후"],
-},
-
-# =============================
-# 🔊 안내 라벨 (System Labels)
-# =============================
-"tag_low_kcal": {
-    "foodName": "저칼로리 추천",
-    "calories": 0,
-    "cuisine": "Guide",
-    "category": "시스템",
-    "portion": "-",
-    "tags": ["안내"],
-},
-"tag_high_fat_warn": {
-    "foodName": "지방 주의",
-    "calories": 0,
-    "cuisine": "Guide",
-    "category": "시스템",
-    "portion": "-",
-    "tags": ["주의"],
-},
-    "k_gamja_jjim": {
-        "foodName": "감자조림",
-        "calories": 210,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은 접시",
-        "tags": ["가정식"],
-    },
-    "k_ojingeo_muchim": {
-        "foodName": "오징어무침",
-        "calories": 280,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은 접시",
-        "tags": ["매운","해산물"],
-    },
-    "k_kimchi_pancake": {
-        "foodName": "김치전",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "전",
-        "portion": "1접시",
-        "tags": ["안주","기름짐"],
-    },
-    "k_soup_beef": {
-        "foodName": "소고기미역국",
-        "calories": 230,
-        "cuisine": "Korean",
-        "category": "국",
-        "portion": "1그릇",
-        "tags": ["집밥"],
-    },
-    "k_pork_cutlet_korean": {
-        "foodName": "등심 돈가스(한식)",
-        "calories": 820,
-        "cuisine": "Korean",
-        "category": "튀김",
-        "portion": "1접시",
-        "tags": ["경양식"],
-    },
-    "k_mayak_egg": {
-        "foodName": "마약계란(2개)",
-        "calories": 240,
-        "cuisine": "Korean",
-        "category": "간식",
-        "portion": "2개",
-        "tags": ["단짠"],
-    },
-    "k_tteok_soup": {
-        "foodName": "떡국",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "국물",
-        "portion": "1그릇",
-        "tags": ["명절"],
-    },
-    "k_cheese_tonkatsu_curry": {
-        "foodName": "치즈돈까스 카레",
-        "calories": 1050,
-        "cuisine": "Korean",
-        "category": "세트",
-        "portion": "1접시",
-        "tags": ["폭식주의"],
-    },
-    "k_cheese_ball_6": {
-        "foodName": "치즈볼(6개)",
-        "calories": 540,
-        "cuisine": "Snack",
-        "category": "간식",
-        "portion": "6개",
-        "tags": ["야식","달달"],
-    },
-    "k_fire_mandu": {
-        "foodName": "불닭만두(6개)",
-        "calories": 480,
-        "cuisine": "Korean",
-        "category": "만두",
-        "portion": "6개",
-        "tags": ["매운"],
-    },
-    "us_hotdog": {
-        "foodName": "핫도그(미국식)",
-        "calories": 390,
-        "cuisine": "Western",
-        "category": "간편식",
-        "portion": "1개",
-        "tags": ["패스트푸드"],
-    },
-    "us_baby_back_ribs": {
-        "foodName": "베이비백립",
-        "calories": 720,
-        "cuisine": "Western",
-        "category": "고기",
-        "portion": "1인분",
-        "tags": ["BBQ"],
-    },
-    "mx_burrito": {
-        "foodName": "부리또",
-        "calories": 680,
-        "cuisine": "Mexican",
-        "category": "랩",
-        "portion": "1개",
-        "tags": ["포만감"],
-    },
-    "tr_kebab": {
-        "foodName": "케밥",
-        "calories": 650,
-        "cuisine": "Turkish",
-        "category": "고기",
-        "portion": "1개",
-        "tags": ["중동"],
-    },
-    "gr_greek_salad": {
-        "foodName": "그릭샐러드",
-        "calories": 430,
-        "cuisine": "Greek",
-        "category": "샐러드",
-        "portion": "1접시",
-        "tags": ["치즈","올리브"],
-    },
-    "cb_blueberry_bagel": {
-        "foodName": "블루베리 베이글",
-        "calories": 350,
-        "cuisine": "Western",
-        "category": "빵",
-        "portion": "1개",
-        "tags": ["카페"],
-    },
-    "cb_garlic_bread": {
-        "foodName": "마늘빵",
-        "calories": 440,
-        "cuisine": "Western",
-        "category": "빵",
-        "portion": "1조각",
-        "tags": ["향강함"],
-    },
-    "cb_matcha_cake": {
-        "foodName": "녹차 케이크",
-        "calories": 390,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1조각",
-        "tags": ["카페"],
-    },
-    "cb_vanilla_latte": {
-        "foodName": "바닐라 라떼",
-        "calories": 310,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["달달"],
-    },
-    "cb_cookie_choco": {
-        "foodName": "초코 쿠키",
-        "calories": 180,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["초코"],
-    },
-    "drink_mango_juice": {
-        "foodName": "망고주스",
-        "calories": 160,
-        "cuisine": "Drink",
-        "category": "주스",
-        "portion": "1잔",
-        "tags": ["과일"],
-    },
-    "drink_choco_frappe": {
-        "foodName": "초코 프라페",
-        "calories": 420,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["초코","카페"],
-    },
-    "drink_milkshake_strawberry": {
-        "foodName": "딸기 밀크셰이크",
-        "calories": 510,
-        "cuisine": "Drink",
-        "category": "디저트",
-        "portion": "1잔",
-        "tags": ["폭탄"],
-    },
-    "hf_quinoa_bowl": {
-        "foodName": "퀴노아볼",
-        "calories": 420,
-        "cuisine": "Healthy",
-        "category": "샐러드",
-        "portion": "1볼",
-        "tags": ["슈퍼푸드"],
-    },
-    "hf_choco_proteinball": {
-        "foodName": "프로틴볼(4개)",
-        "calories": 240,
-        "cuisine": "Supplement",
-        "category": "간식",
-        "portion": "4개",
-        "tags": ["헬스"],
-    },
-    "hf_edamame": {
-        "foodName": "에다마메(100g)",
-        "calories": 140,
-        "cuisine": "Japanese",
-        "category": "간식",
-        "portion": "100g",
-        "tags": ["식물성단백"],
-    },
-    "dz_churros": {
-        "foodName": "츄러스",
-        "calories": 410,
-        "cuisine": "Spanish",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["달달"],
-    },
-    "dz_brownie": {
-        "foodName": "브라우니",
-        "calories": 450,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["초코"],
-    },
-    "sn_popcorn": {
-        "foodName": "팝콘(버터)",
-        "calories": 420,
-        "cuisine": "Snack",
-        "category": "간식",
-        "portion": "중간 사이즈",
-        "tags": ["영화관"],
-    },
-    "kids_cereal_milk": {
-        "foodName": "시리얼 + 우유",
-        "calories": 290,
-        "cuisine": "Meal",
-        "category": "아침",
-        "portion": "1볼",
-        "tags": ["어린이","간편"],
-    },
-    "kids_fish_cake": {
-        "foodName": "어묵볶음",
-        "calories": 180,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은접시",
-        "tags": ["급식"],
-    },
-    "k_doenjang_soup_pork": {
-        "foodName": "돼지고기 된장찌개",
-        "calories": 400,
-        "cuisine": "Korean",
-        "category": "찌개",
-        "portion": "1그릇",
-        "tags": ["집밥"],
-    },
-    "k_chicken_rice_soup": {
-        "foodName": "닭곰탕",
-        "calories": 480,
-        "cuisine": "Korean",
-        "category": "국",
-        "portion": "1그릇",
-        "tags": ["해장"],
-    },
-    "k_dubu_jjim": {
-        "foodName": "두부조림",
-        "calories": 240,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은 접시",
-        "tags": ["건강"],
-    },
-    "k_gaji_bokkeum": {
-        "foodName": "가지볶음",
-        "calories": 150,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "작은 접시",
-        "tags": ["채소"],
-    },
-    "k_kongbiji_stew": {
-        "foodName": "콩비지찌개",
-        "calories": 420,
-        "cuisine": "Korean",
-        "category": "찌개",
-        "portion": "1그릇",
-        "tags": ["담백"],
-    },
-    "k_la_galbi": {
-        "foodName": "LA갈비",
-        "calories": 890,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "250g",
-        "tags": ["단짠","구이"],
-    },
-    "k_stirfried_octopus": {
-        "foodName": "낙지볶음",
-        "calories": 560,
-        "cuisine": "Korean",
-        "category": "해산물",
-        "portion": "1접시",
-        "tags": ["매운"],
-    },
-    "k_fried_galbi": {
-        "foodName": "갈비튀김",
-        "calories": 770,
-        "cuisine": "Korean",
-        "category": "튀김",
-        "portion": "1접시",
-        "tags": ["안주"],
-    },
-    "k_samgyetang_ginseng": {
-        "foodName": "삼계탕(인삼)",
-        "calories": 740,
-        "cuisine": "Korean",
-        "category": "정식",
-        "portion": "1그릇",
-        "tags": ["보양식"],
-    },
-    "k_suyuk": {
-        "foodName": "수육(돼지)",
-        "calories": 620,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "1접시",
-        "tags": ["부드러움"],
-    },
-    "cn_sichuan_tang": {
-        "foodName": "사천탕면",
-        "calories": 780,
-        "cuisine": "Chinese",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["매운"],
-    },
-    "cn_yangjangpi": {
-        "foodName": "양장피",
-        "calories": 720,
-        "cuisine": "Chinese",
-        "category": "샐러드",
-        "portion": "1접시",
-        "tags": ["해산물"],
-    },
-    "cn_chili_shrimp": {
-        "foodName": "칠리새우",
-        "calories": 740,
-        "cuisine": "Chinese",
-        "category": "해산물",
-        "portion": "1접시",
-        "tags": ["중식"],
-    },
-    "cn_fried_pork_fillet": {
-        "foodName": "꿔바로우",
-        "calories": 860,
-        "cuisine": "Chinese",
-        "category": "튀김",
-        "portion": "1접시",
-        "tags": ["달달"],
-    },
-    "cn_eggplant_garlic": {
-        "foodName": "어향가지",
-        "calories": 600,
-        "cuisine": "Chinese",
-        "category": "야채",
-        "portion": "1접시",
-        "tags": ["향신료"],
-    },
-    "jp_sashimi_set": {
-        "foodName": "사시미 모둠",
-        "calories": 420,
-        "cuisine": "Japanese",
-        "category": "해산물",
-        "portion": "1세트",
-        "tags": ["회"],
-    },
-    "jp_katsumesh": {
-        "foodName": "가츠메시",
-        "calories": 830,
-        "cuisine": "Japanese",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["튀김"],
-    },
-    "jp_tempura_udon": {
-        "foodName": "튀김우동",
-        "calories": 690,
-        "cuisine": "Japanese",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["우동"],
-    },
-    "jp_spicy_ramen": {
-        "foodName": "매운 일본 라멘",
-        "calories": 610,
-        "cuisine": "Japanese",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["매운"],
-    },
-    "ws_grilled_salmon": {
-        "foodName": "연어 스테이크",
-        "calories": 580,
-        "cuisine": "Western",
-        "category": "고기",
-        "portion": "200g",
-        "tags": ["헬스"],
-    },
-    "ws_beef_stew": {
-        "foodName": "비프 스튜",
-        "calories": 650,
-        "cuisine": "Western",
-        "category": "스튜",
-        "portion": "1볼",
-        "tags": ["든든"],
-    },
-    "ws_caesar_salad": {
-        "foodName": "시저샐러드",
-        "calories": 520,
-        "cuisine": "Western",
-        "category": "샐러드",
-        "portion": "1접시",
-        "tags": ["치즈"],
-    },
-    "ws_chicken_steak": {
-        "foodName": "치킨스테이크",
-        "calories": 580,
-        "cuisine": "Western",
-        "category": "고기",
-        "portion": "200g",
-        "tags": ["단백질"],
-    },
-    "ws_baked_potato": {
-        "foodName": "오븐감자",
-        "calories": 160,
-        "cuisine": "Western",
-        "category": "사이드",
-        "portion": "1개",
-        "tags": ["저지방"],
-    },
-    "dz_tiramisu_latte": {
-        "foodName": "티라미수 라떼",
-        "calories": 430,
-        "cuisine": "Cafe",
-        "category": "음료",
-        "portion": "1잔",
-        "tags": ["달달"],
-    },
-    "dz_redvelvet": {
-        "foodName": "레드벨벳 케이크",
-        "calories": 390,
-        "cuisine": "Dessert",
-        "category": "케이크",
-        "portion": "1조각",
-        "tags": ["케이크"],
-    },
-    "dz_pudding": {
-        "foodName": "푸딩",
-        "calories": 250,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["부드러움"],
-    },
-    "dz_honey_cookie": {
-        "foodName": "약과",
-        "calories": 210,
-        "cuisine": "Korean",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["전통"],
-    },
-    "dz_bingsu": {
-        "foodName": "팥빙수",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "디저트",
-        "portion": "1볼",
-        "tags": ["여름"],
-    },
-    "k_gyeran_bap": {
-        "foodName": "계란밥(간장버터)",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "밥",
-        "portion": "1그릇",
-        "tags": ["집밥","간편"],
-    },
-    "k_chajang_bap": {
-        "foodName": "짜장밥",
-        "calories": 780,
-        "cuisine": "Korean",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["중식풍"],
-    },
-    "k_mushroom_bibimbap": {
-        "foodName": "버섯 비빔밥",
-        "calories": 540,
-        "cuisine": "Korean",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["채소","건강"],
-    },
-    "k_bacon_kimchi_fry": {
-        "foodName": "베이컨 김치볶음",
-        "calories": 420,
-        "cuisine": "Korean",
-        "category": "반찬",
-        "portion": "1접시",
-        "tags": ["밥도둑"],
-    },
-    "k_tofu_kimchi": {
-        "foodName": "두부김치",
-        "calories": 480,
-        "cuisine": "Korean",
-        "category": "안주",
-        "portion": "1접시",
-        "tags": ["야식","안주"],
-    },
-    "cv_instant_tteokbokki": {
-        "foodName": "전자레인지 떡볶이",
-        "calories": 620,
-        "cuisine": "Convenience",
-        "category": "분식",
-        "portion": "1용기",
-        "tags": ["편의점","간편조리"],
-    },
-    "cv_frozen_pizza_slice": {
-        "foodName": "냉동피자(2조각)",
-        "calories": 460,
-        "cuisine": "Convenience",
-        "category": "피자",
-        "portion": "2조각",
-        "tags": ["야식"],
-    },
-    "cv_frozen_mandu_pan": {
-        "foodName": "냉동만두 팬구이(8개)",
-        "calories": 520,
-        "cuisine": "Convenience",
-        "category": "만두",
-        "portion": "8개",
-        "tags": ["분식"],
-    },
-    "cv_rice_burger": {
-        "foodName": "편의점 라이스버거",
-        "calories": 540,
-        "cuisine": "Convenience",
-        "category": "버거",
-        "portion": "1개",
-        "tags": ["간편식"],
-    },
-    "cv_cup_risotto": {
-        "foodName": "컵 리소토",
-        "calories": 430,
-        "cuisine": "Convenience",
-        "category": "밥",
-        "portion": "1컵",
-        "tags": ["편의점"],
-    },
-    "hf_chicken_rice_bowl": {
-        "foodName": "닭가슴살 현미볼",
-        "calories": 520,
-        "cuisine": "Healthy",
-        "category": "볼",
-        "portion": "1볼",
-        "tags": ["다이어트","헬스"],
-    },
-    "hf_salad_bowl_mixed": {
-        "foodName": "믹스 샐러드볼",
-        "calories": 260,
-        "cuisine": "Healthy",
-        "category": "샐러드",
-        "portion": "1볼",
-        "tags": ["채소","저칼로리"],
-    },
-    "hf_salmon_poke": {
-        "foodName": "연어 포케볼",
-        "calories": 580,
-        "cuisine": "Hawaiian",
-        "category": "볼",
-        "portion": "1볼",
-        "tags": ["포케","오메가3"],
-    },
-    "hf_egg_avocado_toast": {
-        "foodName": "에그 아보카도 토스트",
-        "calories": 420,
-        "cuisine": "Healthy",
-        "category": "브런치",
-        "portion": "1접시",
-        "tags": ["브런치","건강"],
-    },
-    "hf_yogurt_fruit_bowl": {
-        "foodName": "요거트 과일볼",
-        "calories": 310,
-        "cuisine": "Healthy",
-        "category": "간식",
-        "portion": "1볼",
-        "tags": ["과일","요거트"],
-    },
-    "nt_cheese_rabokki": {
-        "foodName": "치즈라볶이",
-        "calories": 830,
-        "cuisine": "Korean",
-        "category": "분식",
-        "portion": "1그릇",
-        "tags": ["야식","매운"],
-    },
-    "nt_half_half_chicken": {
-        "foodName": "반반치킨(후라이드+양념)",
-        "calories": 1500,
-        "cuisine": "Korean",
-        "category": "치킨",
-        "portion": "한 마리 기준",
-        "tags": ["야식폭탄"],
-    },
-    "nt_pork_belly_rice": {
-        "foodName": "삼겹살덮밥",
-        "calories": 920,
-        "cuisine": "Korean",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["고기","배달"],
-    },
-    "nt_spicy_seafood_stew": {
-        "foodName": "얼큰 해물탕(야식)",
-        "calories": 640,
-        "cuisine": "Korean",
-        "category": "탕",
-        "portion": "1냄비(2인분)",
-        "tags": ["해장","매운"],
-    },
-    "nt_gopchang_bokkeum": {
-        "foodName": "곱창볶음",
-        "calories": 980,
-        "cuisine": "Korean",
-        "category": "안주",
-        "portion": "1접시",
-        "tags": ["야식","술안주"],
-    },
-    "cb_cream_cheese_pie": {
-        "foodName": "크림치즈 파이",
-        "calories": 430,
-        "cuisine": "Dessert",
-        "category": "디저트",
-        "portion": "1조각",
-        "tags": ["카페","달달"],
-    },
-    "cb_affogato": {
-        "foodName": "아포가토",
-        "calories": 260,
-        "cuisine": "Cafe",
-        "category": "디저트",
-        "portion": "1잔",
-        "tags": ["에스프레소","아이스크림"],
-    },
-    "cb_coldbrew_latte": {
-        "foodName": "콜드브루 라떼",
-        "calories": 190,
-        "cuisine": "Cafe",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["카페"],
-    },
-    "cb_earlgrey_cake": {
-        "foodName": "얼그레이 케이크",
-        "calories": 360,
-        "cuisine": "Dessert",
-        "category": "케이크",
-        "portion": "1조각",
-        "tags": ["티","카페"],
-    },
-    "cb_frappuccino_caramel": {
-        "foodName": "카라멜 프라푸치노",
-        "calories": 430,
-        "cuisine": "Cafe",
-        "category": "음료",
-        "portion": "1잔",
-        "tags": ["달달","카페"],
-    },
-    "kids_cheese_pizza_slice": {
-        "foodName": "어린이 치즈피자(1조각)",
-        "calories": 260,
-        "cuisine": "Western",
-        "category": "피자",
-        "portion": "1조각",
-        "tags": ["어린이"],
-    },
-    "kids_fruit_cup": {
-        "foodName": "과일 컵(믹스)",
-        "calories": 110,
-        "cuisine": "Global",
-        "category": "간식",
-        "portion": "1컵",
-        "tags": ["과일","건강"],
-    },
-    "kids_choco_biscuit": {
-        "foodName": "초코 비스킷(3개)",
-        "calories": 180,
-        "cuisine": "Snack",
-        "category": "간식",
-        "portion": "3개",
-        "tags": ["어린이","달달"],
-    },
-    "kids_mini_corn_dog": {
-        "foodName": "미니 핫도그(3개)",
-        "calories": 260,
-        "cuisine": "Snack",
-        "category": "간식",
-        "portion": "3개",
-        "tags": ["간식","키즈"],
-    },
-    "kids_chicken_rice_small": {
-        "foodName": "어린이 치킨덮밥",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "덮밥",
-        "portion": "1그릇(소)",
-        "tags": ["어린이","순한맛"],
-    },
-    "br_scrambled_egg_toast": {
-        "foodName": "스크램블 에그 토스트",
-        "calories": 420,
-        "cuisine": "Western",
-        "category": "아침",
-        "portion": "1접시",
-        "tags": ["브런치","간편"],
-    },
-    "br_french_toast": {
-        "foodName": "프렌치토스트",
-        "calories": 480,
-        "cuisine": "Western",
-        "category": "아침",
-        "portion": "2조각",
-        "tags": ["달달","브런치"],
-    },
-    "br_butter_croissant": {
-        "foodName": "버터 크루아상",
-        "calories": 340,
-        "cuisine": "Western",
-        "category": "빵",
-        "portion": "1개",
-        "tags": ["카페","브런치"],
-    },
-    "br_egg_bacon_plate": {
-        "foodName": "베이컨 에그 플레이트",
-        "calories": 520,
-        "cuisine": "Western",
-        "category": "브런치",
-        "portion": "1접시",
-        "tags": ["단백질"],
-    },
-    "br_porridge_mixed_grain": {
-        "foodName": "잡곡 죽",
-        "calories": 380,
-        "cuisine": "Korean",
-        "category": "죽",
-        "portion": "1그릇",
-        "tags": ["아침","건강"],
-    },
-    "of_pork_cutlet_lunch": {
-        "foodName": "직장인 돈가스 런치",
-        "calories": 880,
-        "cuisine": "Korean",
-        "category": "정식",
-        "portion": "1접시",
-        "tags": ["점심","든든"],
-    },
-    "of_soup_rice_combo": {
-        "foodName": "국 + 공기밥 세트",
-        "calories": 620,
-        "cuisine": "Korean",
-        "category": "정식",
-        "portion": "1인분",
-        "tags": ["회사식당"],
-    },
-    "of_salmon_don": {
-        "foodName": "연어덮밥",
-        "calories": 640,
-        "cuisine": "Japanese",
-        "category": "덮밥",
-        "portion": "1그릇",
-        "tags": ["점심","연어"],
-    },
-    "of_chicken_salad_lunch": {
-        "foodName": "직장인 치킨 샐러드",
-        "calories": 430,
-        "cuisine": "Healthy",
-        "category": "샐러드",
-        "portion": "1그릇",
-        "tags": ["다이어트","헬시런치"],
-    },
-    "of_kimchi_fried_rice_set": {
-        "foodName": "김치볶음밥 + 계란 세트",
-        "calories": 780,
-        "cuisine": "Korean",
-        "category": "볶음밥",
-        "portion": "1접시",
-        "tags": ["점심메뉴"],
-    },
-    "soup_mandu_guk": {
-        "foodName": "만두국",
-        "calories": 560,
-        "cuisine": "Korean",
-        "category": "국",
-        "portion": "1그릇",
-        "tags": ["겨울","든든"],
-    },
-    "soup_budae_jjigae_single": {
-        "foodName": "개인 부대찌개",
-        "calories": 720,
-        "cuisine": "Korean",
-        "category": "찌개",
-        "portion": "1인용 냄비",
-        "tags": ["해장","자극"],
-    },
-    "soup_codfish": {
-        "foodName": "대구탕",
-        "calories": 410,
-        "cuisine": "Korean",
-        "category": "탕",
-        "portion": "1냄비",
-        "tags": ["해장","해산물"],
-    },
-    "soup_pollack": {
-        "foodName": "동태찌개",
-        "calories": 480,
-        "cuisine": "Korean",
-        "category": "찌개",
-        "portion": "1냄비",
-        "tags": ["겨울","매운"],
-    },
-    "soup_soft_tofu": {
-        "foodName": "부드러운 순두부탕",
-        "calories": 360,
-        "cuisine": "Korean",
-        "category": "탕",
-        "portion": "1그릇",
-        "tags": ["담백","가벼움"],
-    },
-    "an_fried_shrimp_platter": {
-        "foodName": "새우튀김 모둠",
-        "calories": 620,
-        "cuisine": "Korean",
-        "category": "안주",
-        "portion": "1접시",
-        "tags": ["맥주안주","튀김"],
-    },
-    "an_spicy_chicken_feet": {
-        "foodName": "매운 닭발",
-        "calories": 540,
-        "cuisine": "Korean",
-        "category": "안주",
-        "portion": "1접시",
-        "tags": ["매운","소주안주"],
-    },
-    "an_cheese_platter": {
-        "foodName": "치즈 플래터",
-        "calories": 520,
-        "cuisine": "Western",
-        "category": "안주",
-        "portion": "1플레이트",
-        "tags": ["와인안주"],
-    },
-    "an_squid_peanut": {
-        "foodName": "마른오징어 땅콩",
-        "calories": 380,
-        "cuisine": "Korean",
-        "category": "안주",
-        "portion": "1접시",
-        "tags": ["맥주안주"],
-    },
-    "an_spam_grill": {
-        "foodName": "스팸 구이",
-        "calories": 460,
-        "cuisine": "Korean",
-        "category": "안주",
-        "portion": "조각 6개",
-        "tags": ["단짠","야식"],
-    },
-    "vg_vegan_curry": {
-        "foodName": "비건 채소 카레",
-        "calories": 520,
-        "cuisine": "Fusion",
-        "category": "카레",
-        "portion": "1접시",
-        "tags": ["비건","채식"],
-    },
-    "vg_grilled_veggie_plate": {
-        "foodName": "구운 채소 플레이트",
-        "calories": 260,
-        "cuisine": "Fusion",
-        "category": "샐러드",
-        "portion": "1접시",
-        "tags": ["채식","저칼로리"],
-    },
-    "vg_lentil_stew": {
-        "foodName": "렌틸콩 스튜",
-        "calories": 420,
-        "cuisine": "Western",
-        "category": "스튜",
-        "portion": "1볼",
-        "tags": ["비건","고단백"],
-    },
-    "vg_vegan_bibim_noodle": {
-        "foodName": "비건 비빔국수",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["채식","매콤"],
-    },
-    "vg_tomato_soup": {
-        "foodName": "토마토 수프",
-        "calories": 210,
-        "cuisine": "Western",
-        "category": "수프",
-        "portion": "1그릇",
-        "tags": ["라이트"],
-    },
-    "sf_korean_hotteok": {
-        "foodName": "꿀호떡",
-        "calories": 320,
-        "cuisine": "Korean",
-        "category": "간식",
-        "portion": "1개",
-        "tags": ["겨울간식","달달"],
-    },
-    "sf_taiwan_castella": {
-        "foodName": "대만 카스테라",
-        "calories": 380,
-        "cuisine": "Taiwan",
-        "category": "디저트",
-        "portion": "조각 1개",
-        "tags": ["폭신"],
-    },
-    "sf_thai_mango_sticky_rice": {
-        "foodName": "망고 스티키라이스",
-        "calories": 520,
-        "cuisine": "Thai",
-        "category": "디저트",
-        "portion": "1접시",
-        "tags": ["코코넛","과일"],
-    },
-    "sf_turkey_icecream": {
-        "foodName": "터키 아이스크림",
-        "calories": 260,
-        "cuisine": "Turkish",
-        "category": "디저트",
-        "portion": "1콘",
-        "tags": ["쫀득"],
-    },
-    "sf_brazil_cheese_bread": {
-        "foodName": "브라질 치즈빵(파오데케이조)",
-        "calories": 300,
-        "cuisine": "Brazil",
-        "category": "간식",
-        "portion": "3개",
-        "tags": ["치즈","간식"],
-    },
-    "fr_mixed_berries_bowl": {
-        "foodName": "믹스 베리 볼",
-        "calories": 130,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1볼",
-        "tags": ["항산화","디톡스"],
-    },
-    "fr_watermelon_slice": {
-        "foodName": "수박 조각(3조각)",
-        "calories": 90,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "3조각",
-        "tags": ["여름","수분"],
-    },
-    "fr_grapefruit_half": {
-        "foodName": "자몽 반개",
-        "calories": 50,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "0.5개",
-        "tags": ["다이어트"],
-    },
-    "fr_apple_small": {
-        "foodName": "사과(소)",
-        "calories": 70,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1개",
-        "tags": ["간식","기본과일"],
-    },
-    "fr_pineapple_cup": {
-        "foodName": "파인애플 컵",
-        "calories": 110,
-        "cuisine": "Global",
-        "category": "과일",
-        "portion": "1컵",
-        "tags": ["상큼"],
-    },
-    "k_chuseok_jeon_platter": {
-        "foodName": "추석 모둠전",
-        "calories": 860,
-        "cuisine": "Korean",
-        "category": "전",
-        "portion": "가족 접시 1개",
-        "tags": ["명절","기름짐"],
-    },
-    "k_bibim_naengmyeon_egg": {
-        "foodName": "계란 비빔냉면",
-        "calories": 560,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["여름","매콤"],
-    },
-    "k_mul_naengmyeon_meat": {
-        "foodName": "고명 많은 물냉면",
-        "calories": 520,
-        "cuisine": "Korean",
-        "category": "면",
-        "portion": "1그릇",
-        "tags": ["여름","시원"],
-    },
-    "k_bossam_kimchi": {
-        "foodName": "수육 보쌈(김치 포함)",
-        "calories": 780,
-        "cuisine": "Korean",
-        "category": "고기",
-        "portion": "1접시",
-        "tags": ["쌈","야식"],
-    },
-    "k_ojingeo_sundae": {
-        "foodName": "오징어순대",
-        "calories": 430,
-        "cuisine": "Korean",
-        "category": "안주",
-        "portion": "1접시",
-        "tags": ["해산물","특별메뉴"],
-    },
-    "sn_butter_ring_snack": {
-        "foodName": "버터링 과자",
-        "calories": 230,
-        "cuisine": "Snack",
-        "category": "과자",
-        "portion": "1봉(소)",
-        "tags": ["달달","간식"],
-    },
-    "sn_choco_pie": {
-        "foodName": "초코파이",
-        "calories": 170,
-        "cuisine": "Snack",
-        "category": "디저트",
-        "portion": "1개",
-        "tags": ["간식","초코"],
-    },
-    "sn_shrimp_cracker": {
-        "foodName": "새우과자",
-        "calories": 290,
-        "cuisine": "Snack",
-        "category": "과자",
-        "portion": "1봉(중)",
-        "tags": ["짭짤"],
-    },
-    "sn_hard_candy_5": {
-        "foodName": "사탕(5개)",
-        "calories": 110,
-        "cuisine": "Snack",
-        "category": "간식",
-        "portion": "5개",
-        "tags": ["당류"],
-    },
-    "sn_icecream_cone": {
-        "foodName": "콘 아이스크림",
-        "calories": 260,
-        "cuisine": "Dessert",
-        "category": "아이스크림",
-        "portion": "1개",
-        "tags": ["여름간식"],
-    },
-    "drink_strawberry_smoothie": {
-        "foodName": "딸기 스무디",
-        "calories": 360,
-        "cuisine": "Drink",
-        "category": "스무디",
-        "portion": "1잔",
-        "tags": ["과일","카페"],
-    },
-    "drink_mango_smoothie": {
-        "foodName": "망고 스무디",
-        "calories": 380,
-        "cuisine": "Drink",
-        "category": "스무디",
-        "portion": "1잔",
-        "tags": ["과일","달달"],
-    },
-    "drink_grapefruit_ade": {
-        "foodName": "자몽에이드",
-        "calories": 190,
-        "cuisine": "Drink",
-        "category": "에이드",
-        "portion": "1잔",
-        "tags": ["상큼","카페"],
-    },
-    "drink_peach_iced_tea": {
-        "foodName": "복숭아 아이스티",
-        "calories": 140,
-        "cuisine": "Drink",
-        "category": "티",
-        "portion": "1잔",
-        "tags": ["달달","카페"],
-    },
-    "drink_matcha_latte_ice": {
-        "foodName": "아이스 말차 라떼",
-        "calories": 260,
-        "cuisine": "Drink",
-        "category": "커피",
-        "portion": "1잔",
-        "tags": ["녹차","카페"],
-    },
-    "pt_egg_white_omelette": {
-        "foodName": "흰자 오믈렛",
-        "calories": 190,
-        "cuisine": "Healthy",
-        "category": "식사",
-        "portion": "1접시",
-        "tags": ["저지방","고단백"],
-    },
-    "pt_steamed_chicken_veggie": {
-        "foodName": "찜닭가슴살 + 야채",
-        "calories": 360,
-        "cuisine": "Healthy",
-        "category": "식사",
-        "portion": "1접시",
-        "tags": ["단백질","다이어트"],
-    },
-    "pt_brown_rice_150": {
-        "foodName": "현미밥(150g)",
-        "calories": 240,
-        "cuisine": "Healthy",
-        "category": "탄수화물",
-        "portion": "150g",
-        "tags": ["복합탄수화물"],
-    },
-    "pt_protein_yogurt_cup": {
-        "foodName": "프로틴 요거트컵",
-        "calories": 210,
-        "cuisine": "Supplement",
-        "category": "간식",
-        "portion": "1컵",
-        "tags": ["헬스","단백질"],
-    },
-    "pt_banana_milk_shake": {
-        "foodName": "바나나 단백질 셰이크",
-        "calories": 260,
-        "cuisine": "Supplement",
-        "category": "음료",
-        "portion": "1잔",
-        "tags": ["운동후","단백질"],
-    },
-    "hm_thai_basil_chicken_rice": {
-        "foodName": "태국식 바질 치킨 라이스",
-        "calories": 670,
-        "cuisine": "Thai",
-        "category": "덮밥",
-        "portion": "1접시",
-        "tags": ["바질","매콤"],
-    },
-    "hm_indian_butter_chicken": {
-        "foodName": "버터치킨 + 난",
-        "calories": 880,
-        "cuisine": "Indian",
-        "category": "카레",
-        "portion": "1세트",
-        "tags": ["인도","버터"],
-    },
-    "hm_mexican_chicken_rice": {
-        "foodName": "멕시칸 치킨라이스",
-        "calories": 720,
-        "cuisine": "Mexican",
-        "category": "덮밥",
-        "portion": "1접시",
-        "tags": ["향신료","푸짐"],
-    },
-    "hm_kebab_wrap": {
-        "foodName": "케밥 랩 샌드위치",
-        "calories": 640,
-        "cuisine": "Turkish",
-        "category": "랩",
-        "portion": "1개",
-        "tags": ["중동","길거리음식"],
-    },
-    "hm_ratatouille_bowl": {
-        "foodName": "라따뚜이 볼",
-        "calories": 320,
-        "cuisine": "French",
-        "category": "야채요리",
-        "portion": "1볼",
-        "tags": ["채소","건강"],
-    },
-    "dz_banana_bread_slice": {
-        "foodName": "바나나 브레드(1조각)",
-        "calories": 260,
-        "cuisine": "Dessert",
-        "category": "빵",
-        "portion": "1조각",
-        "tags": ["홈베이킹"],
-    },
-    "dz_lemon_cake_slice": {
-        "foodName": "레몬케이크 조각",
-        "calories": 240,
-        "cuisine": "Dessert",
-        "category": "케이크",
-        "portion": "1조각",
-        "tags": ["상큼"],
-    },
-    "dz_cheesecake_ny": {
-        "foodName": "뉴욕 치즈케이크",
-        "calories": 420,
-        "cuisine": "Dessert",
-        "category": "케이크",
-        "portion": "1조각",
-        "tags": ["치즈","진한맛"],
-    },
-    "dz_misu_garak_tea": {
-        "foodName": "미숫가루",
-        "calories": 310,
-        "cuisine": "Korean",
-        "category": "음료",
-        "portion": "1잔",
-        "tags": ["전통","포만감"],
-    },
-    "dz_black_sesame_latte": {
-        "foodName": "흑임자 라떼",
-        "calories": 340,
-        "cuisine": "Korean",
-        "category": "음료",
-        "portion": "1잔",
-        "tags": ["고소","전통"],
-    },
-}
-
-// =======================================
-// 2단계) 점수 / 위험 / 추천 자동 생성 함수
-// =======================================
-function buildMetaForFood(food) {
-  const kcal = food.calories || 0;
-  const tags = food.tags || [];
-  const category = food.category || "";
-
-  // 1) 기본 점수 (칼로리 기준)
-  let healthScore = 80;     // 0~100
-  let scoreLabel = "보통 한 끼";
-  let riskLevel = "MID";    // LOW / MID / HIGH
-  let riskLabel = "적당히 주의";
-  let recommendSummary = "하루 총 칼로리 안에서 적당히 즐기기";
-  let recommendDetail = "다른 끼니는 조금 가볍게 맞추면 균형이 좋아요.";
-
-  // 🔸 칼로리 단계별 점수 + 위험
-  if (kcal <= 150) {
-    healthScore = 95;
-    scoreLabel = "초저칼로리";
-    riskLevel = "LOW";
-    riskLabel = "안심 메뉴";
-    recommendSummary = "다이어트·간식용으로 아주 좋음";
-    recommendDetail = "배가 많이 고프지 않을 때 간단히 먹기 좋아요.";
-  } else if (kcal <= 300) {
-    healthScore = 90;
-    scoreLabel = "가벼운 한 끼";
-    riskLevel = "LOW";
-    riskLabel = "부담 적음";
-    recommendSummary = "자주 먹어도 큰 부담 없음";
-    recommendDetail = "샐러드·과일과 같이 먹으면 더 좋습니다.";
-  } else if (kcal <= 500) {
-    healthScore = 75;
-    scoreLabel = "평균적인 한 끼";
-    riskLevel = "MID";
-    riskLabel = "적당한 칼로리";
-    recommendSummary = "하루 1~2번 정도 무난";
-    recommendDetail = "야식보다는 점심·저녁 메인 메뉴로 추천.";
-  } else if (kcal <= 800) {
-    healthScore = 60;
-    scoreLabel = "조금 높은 칼로리";
-    riskLevel = "MID";
-    riskLabel = "양·소스 주의";
-    recommendSummary = "일주일에 2~3회 이내로";
-    recommendDetail = "국·소스·치즈 양을 줄이면 체감 칼로리를 줄일 수 있어요.";
-  } else {
-    healthScore = 45;
-    scoreLabel = "고칼로리 폭탄";
-    riskLevel = "HIGH";
-    riskLabel = "체중·혈당 주의";
-    recommendSummary = "가끔 특별한 날에만";
-    recommendDetail = "야채·샐러드와 같이 먹고, 다른 끼니는 가볍게 조절하는 것을 추천.";
-  }
-
-  // 🔸 다이어트/샐러드/과일 태그는 가산점
-  const isDiet =
-    tags.includes("다이어트") ||
-    tags.includes("헬스") ||
-    tags.includes("저칼로리") ||
-    category.includes("샐러드") ||
-    category.includes("과일");
-
-  if (isDiet) {
-    healthScore = Math.min(100, healthScore + 10);
-    if (riskLevel === "MID") riskLevel = "LOW";
-    scoreLabel = "다이어트 친화 메뉴";
-    recommendSummary = "다이어트·체중관리용으로 적합";
-    recommendDetail = "단백질·섬유질 위주 식단에 잘 어울립니다.";
-  }
-
-  // 🔸 야식/폭탄 태그는 위험도 상향
-  const isNightBomb =
-    tags.includes("야식폭탄") ||
-    tags.includes("위험한칼로리") ||
-    tags.includes("야식") ||
-    tags.includes("술안주");
-
-  if (isNightBomb || category === "세트") {
-    riskLevel = "HIGH";
-    riskLabel = "야식·고칼로리 주의";
-    healthScore = Math.min(healthScore, 55);
-    if (kcal >= 900) {
-      recommendSummary = "아주 가끔, 특별한 날에만";
-      recommendDetail = "취침 4시간 전에는 피하는 것을 강력 추천합니다.";
-    } else {
-      recommendSummary = "주 1~2회 이하 권장";
-      recommendDetail = "가능하면 점심에 먹고, 저녁은 가볍게 맞춰 주세요.";
-    }
-  }
-
-  // 🔸 과일/자연식은 안정성 상향
-  if (category === "과일" || tags.includes("자연식")) {
-    riskLevel = "LOW";
-    riskLabel = "자연식 위주";
-    healthScore = Math.max(healthScore, 85);
-    recommendSummary = "간식·후식으로 좋음";
-    recommendDetail = "단, 당 조절이 필요하다면 하루 총 과일 양을 함께 관리해 주세요.";
-  }
-
-  return {
-    score: {
-      value: healthScore,    // 0~100
-      label: scoreLabel,     // “초저칼로리”, “보통 한 끼” 등
-    },
-    risk: {
-      level: riskLevel,      // "LOW" | "MID" | "HIGH"
-      label: riskLabel,      // “야식·고칼로리 주의” 등
-    },
-    recommend: {
-      summary: recommendSummary,  // 카드에 한 줄 요약
-      detail: recommendDetail,    // 상세 설명 박스에 사용
-    },
-  };
-}
-
-// =======================================
-// 3단계) 최종 사용용 CALORIE_TABLE 만들기
-// =======================================
-const CALORIE_TABLE = {};
-
-Object.entries(CALORIE_TABLE_RAW).forEach(([key, food]) => {
-  const meta = buildMetaForFood(food);
-  CALORIE_TABLE[key] = {
-    ...food,
-    ...meta,  // 👉 score / risk / recommend 필드 추가
-  };
-});
+FOOD_TABLE_PATH = os.getenv(
+    "SMARTCAL_FOOD_TABLE_PATH", os.path.join(os.path.dirname(__file__), "data", "food_table.json")
+)
+FOOD_TABLE_BIN_PATH = os.getenv("SMARTCAL_FOOD_TABLE_BIN_PATH", os.path.splitext(FOOD_TABLE_PATH)[0] + ".bin")
+
+# 1 이면 스키마 error / 중복 key 가 있는 테이블로는 서버를 띄우지 않음 (기본: 경고만 출력)
+FOOD_TABLE_STRICT = os.getenv("SMARTCAL_FOOD_TABLE_STRICT", "0") == "1"
+
+# 파일이 바뀌었는지 확인하는 주기 (초, 0 이면 감시 안 함 → /admin/reload-foods 로만 다시 읽기)
+FOOD_TABLE_WATCH_SEC = float(os.getenv("SMARTCAL_FOOD_TABLE_WATCH_SEC", "5"))
+
+# /admin/* 호출용 토큰 (X-Admin-Token 헤더, 비어 있으면 관리자 엔드포인트 사용 안 함)
+ADMIN_TOKEN = os.getenv("SMARTCAL_ADMIN_TOKEN", "")
+
+# 별칭 파일 (모델 라벨 → 테이블 key)
+ALIASES_PATH = os.getenv("SMARTCAL_ALIASES_PATH", os.path.join(os.path.dirname(__file__), "data", "food_aliases.json"))
+
+
+# -----------------------------
+# 4-1. 양(portion) 추정 (portion.py)
+#    - 음식 박스 면적을 같은 사진의 기준 물체(그릇 / 컵 / 수저)와 비교해서
+#      1인분 대비 배율을 추정하고, item 의 칼로리 / 성분 합계에 곱함
+#    - 기준 물체가 없으면 배율 1.0 (portionBasis "none")
+#      SMARTCAL_PORTION_IMAGE_FRACTION (예: 0.25) 을 정하면 대신 이미지 면적 × 그 비율을 1인분으로 봄
+#      (보정되지 않은 어림값이라 기본은 끔, portion.py 참고)
+#    - item 마다 portionMultiplier, 응답에 portionBasis (기준 물체 라벨 / "image" / "none")
+#    - 기준 물체 클래스도 모델 클래스 필터에 같이 넣음 (item 에는 안 나옴)
+#    - SMARTCAL_PORTION=0 이면 끔 (예전처럼 1인분 칼로리 그대로)
+# -----------------------------
+PORTION_ENABLED = os.getenv("SMARTCAL_PORTION", "1") == "1"
+portion_estimator = PortionEstimator(
+    names,
+    image_fraction=float(os.getenv("SMARTCAL_PORTION_IMAGE_FRACTION", "0") or 0) or None,
+    min_multiplier=float(os.getenv("SMARTCAL_PORTION_MIN", "0.5")),
+    max_multiplier=float(os.getenv("SMARTCAL_PORTION_MAX", "2.0")),
+    exponent=float(os.getenv("SMARTCAL_PORTION_EXPONENT", "1.0")),
+) if PORTION_ENABLED else None
+
+
+# 클래스가 다른 중복 검출 제거 (dedupe.py)
+#   - 같은 category 의 음식 박스가 이 IoU 이상 겹치면 신뢰도 높은 것만 합계에 넣음 (0 이면 끔)
+DEDUPE_IOU = float(os.getenv("SMARTCAL_DEDUPE_IOU", "0.6"))
+
+
+# -----------------------------
+# 4-2. 테이블 버전 (FoodState) / 다시 읽기
+#    - 원본 JSON 을 검증 + 바이너리로 빌드해 두고(없거나 오래됐으면 자동) mmap 으로 열고,
+#      거기서 파생되는 것들을 한 묶음(FoodState)으로 만듦 (food_state.py)
+#        table      : key → FoodRecord (foodName / calories / ... 읽기 전용 레코드)
+#        meta       : 점수 / 위험 / 추천 (예전 JS buildMetaForFood 규칙, 테이블 전체에 한 번 계산)
+#        nutrition  : 영양 성분 열 저장소 (한 접시 / 하루 / 기록 전체 합계를 한 번의 합산으로)
+#        index      : cuisine / category / tags 비트맵 역색인 (/foods 필터 조회)
+#        search     : foodName / key 검색 색인 (/foods/search)
+#        class_index: 모델 클래스 ID → 미리 만들어 둔 item 레코드 (별칭 파일 data/food_aliases.json 반영)
+#    - 파일이 바뀌면(감시 스레드) 또는 POST /admin/reload-foods 로 새 묶음을 옆에서 만들고 참조만 교체
+#      → 요청은 시작할 때 foods.state 를 한 번 잡아서 끝까지 사용 (락 없음, 처리 중이던 요청은 이전 버전으로 끝남)
+#      → 응답의 tableVersion 으로 어느 버전으로 계산했는지 알 수 있음 (테이블 + 별칭 파일 기준)
+#    - 모델 클래스 필터(테이블에 있는 클래스 ID 만 NMS / 박스 추출)도 교체할 때 같이 바꿈
+#    - 워커가 여러 개면 워커마다 감시 스레드가 같은 파일을 보고 각자 교체함
+#      (/admin/reload-foods 는 요청을 받은 워커만 바로 교체)
+# -----------------------------
+def build_foods(previous, force):
+    return build_food_state(
+        names,
+        FOOD_TABLE_PATH,
+        FOOD_TABLE_BIN_PATH,
+        aliases_path=ALIASES_PATH,
+        strict=FOOD_TABLE_STRICT,
+        previous=previous,
+        force=force,
+    )
+
+
+def model_filter_classes(class_index) -> list:
+    classes = set(class_index.food_class_ids)
+    if portion_estimator is not None:
+        classes.update(portion_estimator.reference_class_ids)
+    return sorted(classes)
+
+
+def on_foods_swap(old, new):
+    model.set_filter(classes=model_filter_classes(new.class_index), conf=CONF_THRESHOLD)
+    if old is not None and old.version != new.version:
+        # 이전 버전으로 만든 응답은 더 이상 쓰지 않음
+        result_cache.clear()
+        near_dup_cache.clear()
+
+    print(f"[칼로리 테이블] 버전 {new.version}\n" + report_summary(new.table.validation_report))
+    print("[커버리지]\n" + new.class_index.coverage_summary())
+    if not new.class_index.food_class_ids:
+        print(f"[경고] {MODEL_PATH} 의 클래스 중 CALORIE_TABLE 에 있는 것이 없습니다. 모든 검출이 걸러집니다.")
+
+
+foods = FoodStateReloader(
+    build_foods,
+    on_swap=on_foods_swap,
+    watch_paths=(FOOD_TABLE_PATH, ALIASES_PATH),
+    watch_interval_sec=FOOD_TABLE_WATCH_SEC,
+)
+
 
 # -----------------------------
 # 5. base64 → PIL.Image 변환 함수
@@ -3857,100 +274,817 @@ def decode_base64_image(b64_str: str) -> Image.Image:
         _, b64_str = b64_str.split(",", 1)
 
     img_bytes = base64.b64decode(b64_str)
-    img = Image.open(io.BytesIO(img_bytes)).convert("RGB")
-    return img
+    return decode_image_bytes(img_bytes)
+
+
+def decode_image_bytes(img_bytes: bytes) -> Image.Image:
+    # 업로드된 JPEG/PNG 바이트 → PIL.Image (base64 단계 없음)
+    #   JPEG 은 IMGSZ 기준 draft 모드로 축소 디코딩 (YOLO 가 어차피 640 으로 줄임)
+    return open_image_for_model(img_bytes, IMGSZ)
+
+
+def decode_base64_to_array(b64_str: str) -> np.ndarray:
+    # 디코딩 풀에서 실행: base64 → PIL → numpy (YOLO 입력, 복사 1회)
+    return image_to_array(decode_base64_image(b64_str))
+
+
+def decode_bytes_to_array(img_bytes: bytes) -> np.ndarray:
+    # 디코딩 풀에서 실행: 바이트 → PIL → numpy (YOLO 입력, 복사 1회)
+    return image_to_array(decode_image_bytes(img_bytes))
 
 
 # -----------------------------
 # 6. /predict 엔드포인트 (프론트에서 호출)
 # -----------------------------
 @app.post("/predict")
-def predict(data: ImageData):
+async def predict(data: ImageData, request: Request):
     """
-    1) base64 이미지를 디코딩하고
-    2) YOLO로 음식 후보를 찾고
+    1) base64 이미지를 디코딩하고 (디코딩 풀)
+    2) YOLO로 음식 후보를 찾고 (배칭 스케줄러 → 추론 풀)
     3) CALORIE_TABLE 과 매칭해서
        items + totalCalories 형태로 돌려줌
     """
-    # 1. 이미지 디코딩
-    try:
-        img = decode_base64_image(data.image)
-    except Exception as e:
-        return {"success": False, "error": f"이미지 디코딩 실패: {e}"}
+    return await run_predict(
+        decode_base64_to_array,
+        data.image,
+        near_duplicate=data.nearDuplicate,
+        include_meta=data.includeMeta,
+        include_macros=data.includeMacros,
+        client=client_scope(request),
+    )
 
-    # 2. YOLO 추론
-    try:
-        np_img = np.array(img)
-        results = model(np_img)[0]  # 첫 번째 결과만 사용
-    except Exception as e:
-        return {"success": False, "error": f"YOLO 추론 중 오류: {e}"}
-
-    items = []
-
-    # 3. 감지된 박스들 순회
-    if results.boxes is not None:
-        for box in results.boxes:
-            cls_id = int(box.cls[0])
-            conf = float(box.conf[0])
-
-            # 신뢰도 너무 낮으면 패스
-            if conf < 0.35:
-                continue
-
-            cls_name = names.get(cls_id, "")
-
-            # 우리가 칼로리 테이블에 등록한 클래스만 사용
-            if cls_name in CALORIE_TABLE:
-                info = CALORIE_TABLE[cls_name]
-                items.append(
-                    {
-                        "foodName": info["foodName"],
-                        "calories": info["calories"],
-                        "cuisine": info["cuisine"],
-                        "category": info["category"],
-                        "portion": info["portion"],
-                        "conf": round(conf, 3),
-                    }
-                )
-
-    # 4. 아무 음식도 못 찾았을 때
+
+# 업로드 시 사용할 수 있는 form 필드 이름
+UPLOAD_FIELD_NAMES = ("file", "image")
+
+
+@app.post("/predict/upload")
+async def predict_upload(request: Request):
+    """
+    base64 없이 이미지를 바로 올리는 엔드포인트
+      - multipart/form-data: "file" (또는 "image") 필드
+      - image/jpeg, image/png, application/octet-stream: 바디 전체가 이미지
+    응답 형태는 /predict 와 완전히 같음
+    (?nearDuplicate=false 로 근접 중복 캐시를 끌 수 있음, ?includeMeta=true 면 score / risk / recommend 포함,
+     ?includeMacros=true 면 성분 합계 포함)
+    """
+    near_duplicate = query_flag(request, "nearDuplicate", True)
+    include_meta = query_flag(request, "includeMeta", False)
+    include_macros = query_flag(request, "includeMacros", False)
+    content_type = request.headers.get("content-type", "")
+
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = next((form[k] for k in UPLOAD_FIELD_NAMES if k in form), None)
+        if upload is None or isinstance(upload, str):
+            return {"success": False, "error": "이미지 파일이 없습니다. 'file' 필드로 업로드해 주세요."}
+        img_bytes = await upload.read()
+    else:
+        img_bytes = await request.body()
+
+    if not img_bytes:
+        return {"success": False, "error": "이미지 데이터가 비어 있습니다."}
+
+    return await run_predict(
+        decode_bytes_to_array,
+        img_bytes,
+        near_duplicate=near_duplicate,
+        include_meta=include_meta,
+        include_macros=include_macros,
+        client=client_scope(request),
+    )
+
+
+def query_flag(request: Request, name: str, default: bool) -> bool:
+    value = request.query_params.get(name)
+    if value is None:
+        return default
+    return value.lower() not in ("0", "false", "no")
+
+
+def client_scope(request: Request):
+    # 근접 중복 캐시를 나눠 쓰는 단위 (X-Client-Id, ip 모드면 접속 주소). None 이면 근접 중복 캐시 안 씀
+    client_id = request.headers.get("x-client-id", "").strip()
+    if client_id:
+        return f"id:{client_id}"
+    if NEARDUP_SCOPE == "ip" and request.client is not None:
+        return f"ip:{request.client.host}"
+    return None
+
+
+def decode_and_hash(decode_fn, payload, want_hash: bool):
+    # 디코딩 풀에서 한 번에: 디코딩 + (필요하면) perceptual hash
+    np_img = decode_fn(payload)
+    return np_img, (dhash64(np_img) if want_hash else None)
+
+
+async def run_predict(
+    decode_fn,
+    payload,
+    near_duplicate: bool = True,
+    include_meta: bool = False,
+    include_macros: bool = False,
+    client=None,
+) -> dict:
+    """/predict, /predict/upload 공통 처리: 캐시 → 디코딩 → 추론 → 응답 만들기
+    (캐시에는 메타 / 성분 합계까지 넣은 응답을 저장하고, 요청하지 않은 부분은 돌려주기 직전에 뺌)"""
+    response = await predict_full(decode_fn, payload, foods.state, near_duplicate, client)
+    return trim_response(response, include_meta, include_macros)
+
+
+def trim_response(response: dict, include_meta: bool, include_macros: bool) -> dict:
+    if not include_macros and "macros" in response:
+        response = {k: v for k, v in response.items() if k != "macros"}
+    items = response.get("items")
+    if include_meta or not items:
+        return response
+    return {**response, "items": [{k: v for k, v in item.items() if k not in META_FIELDS} for item in items]}
+
+
+def cached_for(state, cached):
+    # 캐시에 남아 있던 다른 테이블 버전의 응답은 버림 (교체 직후 처리 중이던 요청이 넣은 것)
+    if cached is not None and cached.get("tableVersion") == state.version:
+        return cached
+    return None
+
+
+async def predict_full(decode_fn, payload, state, near_duplicate: bool = True, client=None) -> dict:
+    """state: 요청 시작할 때 잡은 FoodState (교체되더라도 이 요청은 끝까지 같은 버전 사용)
+    client: 근접 중복 캐시 범위 (같은 client 가 보낸 사진끼리만 재사용, None 이면 근접 중복 캐시 안 씀)"""
+    async with PREDICT_SLOTS:
+        loop = asyncio.get_running_loop()
+
+        # 0. 같은 이미지를 다시 보낸 경우 캐시된 응답 반환
+        cache_key = None
+        if result_cache.enabled:
+            cache_key = await loop.run_in_executor(DECODE_EXECUTOR, result_cache.key_for, payload)
+            cached = cached_for(state, result_cache.get(cache_key))
+            if cached is not None:
+                return cached
+
+        # 1. 이미지 디코딩 (+ 근접 중복 확인용 해시)
+        use_near_dup = near_dup_cache.enabled and near_duplicate and client is not None
+        if near_dup_cache.enabled and not use_near_dup:
+            near_dup_cache.skip()
+        try:
+            np_img, phash = await loop.run_in_executor(
+                DECODE_EXECUTOR, decode_and_hash, decode_fn, payload, use_near_dup
+            )
+        except Exception as e:
+            return {"success": False, "error": f"이미지 디코딩 실패: {e}"}
+
+        # 1-1. 같은 클라이언트가 직전에 찍은 거의 같은 사진이면 그 결과 재사용
+        #      (다른 사진의 결과라서 result_cache 에는 넣지 않음)
+        if phash is not None:
+            cached = cached_for(state, near_dup_cache.get(phash, client))
+            if cached is not None:
+                return cached
+
+        # 2. YOLO 추론 (배칭 스케줄러를 거쳐서 실행)
+        try:
+            detections = await asyncio.wrap_future(batcher.submit(np_img))
+        except QueueFullError as e:
+            return {"success": False, "error": f"서버가 혼잡합니다. 잠시 후 다시 시도해 주세요: {e}"}
+        except Exception as e:
+            return {"success": False, "error": f"YOLO 추론 중 오류: {e}"}
+
+    response = build_predict_response(detections, state, np_img.shape[:2])
+    if cache_key is not None:
+        result_cache.put(cache_key, response)
+    if phash is not None:
+        near_dup_cache.put(phash, response, client)
+    return response
+
+
+def build_predict_response(detections, state, image_hw, track_ids=None, record_stats=True) -> dict:
+    """검출 결과 1장 (Detections) → 프론트 응답 형태 (items / totalCalories / note / tableVersion)
+    image_hw: 원본 이미지 (높이, 너비) — 기준 물체가 없을 때 양 추정 기준
+    track_ids: 추적 모드에서 박스별 트랙 ID (있으면 item 마다 trackId)
+    record_stats: False 면 별칭 적중 통계에 넣지 않음 (추적 모드에서 YOLO 를 안 돌린 프레임)"""
+    class_index = state.class_index
+    # 1. 검출 결과를 한 번에 걸러냄 (신뢰도 마스크 + 테이블에 있는 클래스만)
+    mask = class_index.food_mask(detections.cls, detections.conf, CONF_THRESHOLD)
+
+    # 1-1. 같은 음식이 두 클래스로 잡힌 경우 하나만 남김 (같은 category + 많이 겹침)
+    duplicates = 0
+    if DEDUPE_IOU > 0 and mask.sum() > 1:
+        idx = np.flatnonzero(mask)
+        keep = suppress_cross_class(
+            detections.xyxy[idx], detections.conf[idx], class_index.class_group[detections.cls[idx]], DEDUPE_IOU
+        )
+        mask[idx[~keep]] = False
+        duplicates = int((~keep).sum())
+
+    cls_ids = detections.cls[mask]
+    if record_stats:
+        state.alias_stats.record(cls_ids)
+    records = [class_index.records[c] for c in cls_ids.tolist()]
+    confs = round_confidences(detections.conf[mask])
+
+    # 1-2. 양 배율 (박스 면적 / 1인분 면적, 모든 박스 한 번에)
+    multipliers, portion_basis = None, None
+    if portion_estimator is not None and len(cls_ids):
+        multipliers, portion_basis = portion_estimator.estimate(
+            detections.xyxy, detections.cls, detections.conf, mask, image_hw, CONF_THRESHOLD
+        )
+        mults = multipliers.tolist()
+        kcals = np.rint(class_index.class_calories[cls_ids] * multipliers).astype(np.int64).tolist()
+        items = [
+            {**rec.fields, "calories": kcal, "portionMultiplier": m, "conf": conf, **(rec.meta or {})}
+            for rec, kcal, m, conf in zip(records, kcals, mults, confs)
+        ]
+    else:
+        kcals = [rec.fields["calories"] for rec in records]
+        items = [{**rec.fields, "conf": conf, **(rec.meta or {})} for rec, conf in zip(records, confs)]
+    if track_ids is not None:
+        for item, track_id in zip(items, track_ids[mask].tolist()):
+            item["trackId"] = track_id
+
+    # 2. 아무 음식도 못 찾았을 때 (macros 는 모두 0 으로, 요청하지 않았으면 trim_response 에서 빠짐)
     if not items:
+        macros = zero_totals()
+        macros.pop("calories")
         return {
             "items": [],
             "totalCalories": 0,
             "note": "YOLO가 명확한 음식 객체를 찾지 못했습니다. 음식이 화면 중앙에 잘 보이도록 다시 촬영해 주세요.",
+            "macros": macros,
+            "tableVersion": state.version,
         }
 
-    # 5. 총 칼로리 계산
-    total_kcal = sum(item["calories"] for item in items)
+    # 3. 총 칼로리 + 성분 합계 (클래스 ID 로 영양 성분 열을 모아서 한 번에 합산)
+    #    총 칼로리는 item 에 보여 준 (반올림한) 칼로리의 합 → item 을 더하면 항상 total 과 같음
+    #    성분 합계만 반올림 전 배율로 계산
+    totals = class_index.plate_totals(cls_ids, multipliers)
+    totals.pop("calories")
+    total_kcal = int(sum(kcals))
 
-    # 6. 안내 메시지 만들기 (추가 정보 포함)
-    detail_lines = []
-    for item in items:
-        line = (
-            f"• {item['foodName']} ≈ {item['calories']} kcal "
-            f"(신뢰도 {item['conf']}, 분류: {item['cuisine']} / {item['category']}, 기준량: {item['portion']})"
-        )
-        detail_lines.append(line)
+    # 4. 안내 메시지 만들기 (레코드에 미리 만들어 둔 문장 앞뒤 + 칼로리 / 양 / 신뢰도)
+    if multipliers is not None:
+        detail_lines = [
+            f"{rec.note_head}{kcal} kcal (양 ×{m}, 신뢰도 {conf}{rec.note_tail}"
+            for rec, kcal, m, conf in zip(records, kcals, mults, confs)
+        ]
+    else:
+        detail_lines = [
+            f"{rec.note_head}{kcal} kcal (신뢰도 {conf}{rec.note_tail}" for rec, kcal, conf in zip(records, kcals, confs)
+        ]
 
     note = (
         "YOLOv8 기반 자동 인식 결과입니다. 실제 음식 종류, 양, 조리법에 따라 칼로리는 달라질 수 있어요.\n"
         + "\n".join(detail_lines)
     )
 
-    # 7. 프론트가 이해할 수 있는 형태로 반환
-    return {
-        "items": [
-            {
-                "foodName": item["foodName"],
-                "calories": item["calories"],
-                "cuisine": item["cuisine"],
-                "category": item["category"],
-                "portion": item["portion"],
-                "conf": item["conf"],
-            }
-            for item in items
-        ],
+    # 5. 프론트가 이해할 수 있는 형태로 반환
+    response = {
+        "items": items,
         "totalCalories": total_kcal,
         "note": note,
+        "macros": totals,
+        "tableVersion": state.version,
+    }
+    if portion_basis is not None:
+        response["portionBasis"] = portion_basis
+    if duplicates:
+        response["duplicatesRemoved"] = duplicates
+    return response
+
+
+# -----------------------------
+# 6-1. /nutrition/totals (기록 합계)
+#    - 음식 key + 인분(servings) + 날짜(day, 선택) 목록 → 전체 합계 + 날짜별 합계
+#    - 성분 정보가 없는 항목은 성분 합계에서 빠지고 itemsWithNutrients 로 알려줌
+# -----------------------------
+class NutritionEntry(BaseModel):
+    key: str
+    servings: float = 1.0
+    day: Optional[str] = None
+
+
+class NutritionQuery(BaseModel):
+    items: List[NutritionEntry]
+
+
+@app.post("/nutrition/totals")
+def nutrition_totals(query: NutritionQuery):
+    state = foods.state
+    rows = np.array([state.nutrition.row_of(e.key) for e in query.items], dtype=np.int64)
+    unknown = sorted({e.key for e, r in zip(query.items, rows.tolist()) if r < 0})
+    if unknown:
+        return {"success": False, "error": f"칼로리 테이블에 없는 key: {', '.join(unknown)}"}
+
+    servings = np.array([e.servings for e in query.items], dtype=np.float64)
+    days = sorted({e.day for e in query.items if e.day is not None})
+    day_ids = {d: i for i, d in enumerate(days)}
+    groups = np.array([day_ids.get(e.day, len(days)) for e in query.items], dtype=np.int64)
+
+    sums, known, counts = state.nutrition.totals_by_group(rows, groups, len(days) + 1, servings)
+    return {
+        "total": totals_dict(sums.sum(axis=0), known.sum(axis=0), len(rows)),
+        "byDay": {d: totals_dict(sums[i], known[i], counts[i]) for d, i in day_ids.items()},
+        "tableVersion": state.version,
+    }
+
+
+# -----------------------------
+# 6-2. /foods (테이블 필터 조회), /foods/search (이름 검색)
+#    - 예: /foods?cuisine=Korean&tag=매운&maxCalories=600
+#    - 같은 필드 여러 값(반복 또는 쉼표)은 OR, 필드끼리는 AND
+#      (tag 는 기본 AND, tagMode=any 면 OR)
+#    - offset / limit 으로 페이지 (limit 최대 FOODS_MAX_LIMIT)
+# -----------------------------
+FOODS_DEFAULT_LIMIT = 20
+FOODS_MAX_LIMIT = 200
+SEARCH_DEFAULT_LIMIT = 10
+
+
+def query_list(request: Request, name: str) -> list:
+    values = []
+    for raw in request.query_params.getlist(name):
+        values.extend(v for v in raw.split(",") if v.strip())
+    return values
+
+
+def food_item(state, row: int, include_meta: bool = False) -> dict:
+    rec = state.table.record(row)
+    item = {"key": rec.key, **record_to_dict(rec)}
+    if include_meta:
+        item.update(state.meta.for_row(row))
+    return item
+
+
+@app.get("/foods")
+def list_foods(request: Request):
+    params = request.query_params
+    try:
+        min_kcal = int(params["minCalories"]) if "minCalories" in params else None
+        max_kcal = int(params["maxCalories"]) if "maxCalories" in params else None
+        offset = max(0, int(params.get("offset", 0)))
+        limit = min(FOODS_MAX_LIMIT, max(1, int(params.get("limit", FOODS_DEFAULT_LIMIT))))
+    except ValueError:
+        return {"success": False, "error": "minCalories / maxCalories / offset / limit 은 정수여야 합니다."}
+
+    tag_mode = params.get("tagMode", "all").lower()
+    if tag_mode not in ("all", "any"):
+        return {"success": False, "error": "tagMode 는 all 또는 any 입니다."}
+
+    state = foods.state
+    rows = state.index.query(
+        cuisine=query_list(request, "cuisine"),
+        category=query_list(request, "category"),
+        tags=query_list(request, "tag"),
+        tag_mode=tag_mode,
+        min_calories=min_kcal,
+        max_calories=max_kcal,
+    )
+    include_meta = query_flag(request, "includeMeta", False)
+    return {
+        "total": len(rows),
+        "offset": offset,
+        "limit": limit,
+        "items": [food_item(state, r, include_meta) for r in rows[offset:offset + limit].tolist()],
+        "tableVersion": state.version,
     }
+
+
+@app.get("/foods/search")
+def search_foods(request: Request):
+    """
+    음식 이름 검색 (인식이 틀렸을 때 직접 고르기 / 자동완성)
+      - ?q=김치, ?q=ㄱㅊㅉㄱ (초성), ?q=김치찌게 (오타), ?q=kimchi (key)
+      - ?limit= 최대 개수 (기본 10)
+    """
+    query = request.query_params.get("q", "")
+    try:
+        limit = min(FOODS_MAX_LIMIT, max(1, int(request.query_params.get("limit", SEARCH_DEFAULT_LIMIT))))
+    except ValueError:
+        return {"success": False, "error": "limit 은 정수여야 합니다."}
+    state = foods.state
+    return {"query": query, "items": state.search.search(query, limit), "tableVersion": state.version}
+
+
+@app.get("/foods/validation")
+def food_validation():
+    """칼로리 테이블 스키마 검증 결과 (빌드할 때 저장된 리포트)"""
+    state = foods.state
+    return {**state.table.validation_report, "tableVersion": state.version}
+
+
+@app.get("/foods/facets")
+def food_facets():
+    """필터에 쓸 수 있는 값과 항목 수"""
+    state = foods.state
+    return {**{field: state.index.values(field) for field in INDEXED_FIELDS}, "tableVersion": state.version}
+
+
+# -----------------------------
+# 6-3. /predict/batch (사진 여러 장 한 번에)
+#    - JSON: {"images": [base64, ...], "includeMeta": ..., ...}
+#      multipart: "file" / "image" / "files" 필드 여러 개 (옵션은 쿼리: ?includeMeta=true 등)
+#    - 사진마다 /predict 와 같은 처리 (캐시 → 디코딩 풀 → 배칭 스케줄러)를 동시에 돌려서
+#      디코딩은 병렬로, 추론은 배칭 스케줄러가 여러 장을 한 번에 묶어서 실행
+#    - 배치 하나가 동시에 쓰는 슬롯은 PREDICT_BATCH_CONCURRENCY 개까지 (다른 /predict 요청이 밀리지 않게)
+#    - 테이블 버전은 배치 전체에 하나 (요청 시작할 때의 foods.state)
+#    - 사진 수 / 전체 바이트 상한을 넘으면 처리하지 않고 오류
+#    - 응답: results (사진 순서, index 포함) + 전체 totalCalories
+#    - ?stream=ndjson (또는 Accept: application/x-ndjson) / ?stream=sse (또는 Accept: text/event-stream) 이면
+#      사진 하나 끝날 때마다 바로 한 줄씩 보냄 (끝나는 순서, index 로 구분), 마지막 줄은 summary
+#        ndjson: {"type": "result", "index": 2, "items": ..., "totalCalories": ..., "note": ...}\n ...
+#                {"type": "summary", "images": ..., "failed": ..., "totalCalories": ..., "tableVersion": ...}\n
+#        sse   : event: result / event: summary + data: (같은 JSON)
+#      서버는 결과를 모아 두지 않음 (끝난 사진의 데이터도 바로 놓아줌)
+# -----------------------------
+PREDICT_BATCH_MAX_IMAGES = int(os.getenv("SMARTCAL_PREDICT_BATCH_MAX_IMAGES", "32"))
+PREDICT_BATCH_MAX_BYTES = int(float(os.getenv("SMARTCAL_PREDICT_BATCH_MAX_MB", "40")) * 1024 * 1024)
+PREDICT_BATCH_CONCURRENCY = int(os.getenv("SMARTCAL_PREDICT_BATCH_CONCURRENCY", str(BATCH_MAX_SIZE)))
+
+BATCH_UPLOAD_FIELD_NAMES = UPLOAD_FIELD_NAMES + ("files",)
+
+
+# 파싱한 /predict/batch 요청 (디코딩 함수 + 사진 목록 + 옵션)
+BatchRequest = namedtuple(
+    "BatchRequest", ["decode_fn", "payloads", "near_duplicate", "include_meta", "include_macros", "client"]
+)
+
+
+def payload_bytes(payload) -> int:
+    # base64 문자열은 디코딩 후 크기로 계산
+    return len(payload) * 3 // 4 if isinstance(payload, str) else len(payload)
+
+
+async def read_body_limited(request: Request, limit: int):
+    """본문을 조금씩 읽으면서 크기를 세고, limit 을 넘는 순간 멈춤 (넘으면 None)
+    Content-Length 가 없는 chunked 요청도 메모리에 다 올리기 전에 끊음.
+    (읽은 바이트는 request 에 되돌리지 않고 그대로 파서에 넘김)"""
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def body_stream(body: bytes):
+    # 이미 읽은 본문 → multipart 파서 입력 (바이트 청크 스트림)
+    yield body
+
+
+async def parse_multipart(request: Request, body: bytes):
+    """읽어 둔 multipart 본문 → 업로드 파일 바이트 목록"""
+    parser = MultiPartParser(request.headers, body_stream(body), max_files=PREDICT_BATCH_MAX_IMAGES + 1)
+    form = await parser.parse()
+    try:
+        uploads = [u for k in BATCH_UPLOAD_FIELD_NAMES for u in form.getlist(k) if not isinstance(u, str)]
+        return [await u.read() for u in uploads]
+    finally:
+        await form.close()
+
+
+async def read_batch_request(request: Request):
+    """요청 → BatchRequest, 잘못됐거나 상한을 넘으면 오류 dict"""
+    # 본문 전체 상한 (base64 는 4/3 배 + JSON 여유분)
+    #   Content-Length 가 있으면 읽기 전에 먼저 거르고, 없거나 틀려도 읽으면서 센 크기로 끊음
+    too_large = {"success": False, "error": f"요청이 너무 큽니다 (최대 {PREDICT_BATCH_MAX_BYTES // (1024 * 1024)}MB)."}
+    body_limit = PREDICT_BATCH_MAX_BYTES * 4 // 3 + 64 * 1024
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > body_limit:
+        return too_large
+    body = await read_body_limited(request, body_limit)
+    if body is None:
+        return too_large
+
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        try:
+            payloads = await parse_multipart(request, body)
+        except MultiPartException as e:
+            return {"success": False, "error": f"multipart 형식이 잘못됐습니다: {e.message}"}
+        batch = BatchRequest(
+            decode_bytes_to_array,
+            payloads,
+            query_flag(request, "nearDuplicate", True),
+            query_flag(request, "includeMeta", False),
+            query_flag(request, "includeMacros", False),
+            client_scope(request),
+        )
+    else:
+        try:
+            data = BatchImageData(**json.loads(body))
+        except (ValueError, TypeError, ValidationError) as e:
+            return {"success": False, "error": f"요청 형식이 잘못됐습니다. {{\"images\": [base64, ...]}} 형태로 보내 주세요: {e}"}
+        batch = BatchRequest(
+            decode_base64_to_array,
+            data.images,
+            data.nearDuplicate,
+            data.includeMeta,
+            data.includeMacros,
+            client_scope(request),
+        )
+
+    if not batch.payloads:
+        return {"success": False, "error": "이미지가 없습니다."}
+    if len(batch.payloads) > PREDICT_BATCH_MAX_IMAGES:
+        return {"success": False, "error": f"이미지는 한 번에 최대 {PREDICT_BATCH_MAX_IMAGES}장까지 보낼 수 있습니다."}
+    if sum(payload_bytes(p) for p in batch.payloads) > PREDICT_BATCH_MAX_BYTES:
+        return {"success": False, "error": f"이미지 전체 크기가 너무 큽니다 (최대 {PREDICT_BATCH_MAX_BYTES // (1024 * 1024)}MB)."}
+    return batch
+
+
+async def iter_batch_predictions(batch: BatchRequest, state):
+    """사진마다 (index, 응답) 을 끝나는 순서대로 (응답을 모아 두지 않음)"""
+    slots = asyncio.Semaphore(PREDICT_BATCH_CONCURRENCY)
+
+    async def predict_one(index, payload):
+        async with slots:
+            response = await predict_full(batch.decode_fn, payload, state, batch.near_duplicate, batch.client)
+        batch.payloads[index] = None  # 원본 데이터는 더 필요 없음
+        return index, trim_response(response, batch.include_meta, batch.include_macros)
+
+    tasks = [asyncio.ensure_future(predict_one(i, p)) for i, p in enumerate(batch.payloads)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 클라이언트가 끊겼거나 중간에 멈춘 경우 남은 사진은 처리하지 않음
+        for task in tasks:
+            task.cancel()
+
+
+class BatchTotals:
+    """사진별 응답을 하나씩 받아서 배치 전체 합계 (칼로리 / 성분 / 실패 수)"""
+
+    def __init__(self, state):
+        self.state = state
+        self.images = 0
+        self.failed = 0
+        self.total_calories = 0
+        self.macros = None
+
+    def add(self, response: dict):
+        self.images += 1
+        if response.get("success") is False:
+            self.failed += 1
+            return
+        self.total_calories += response.get("totalCalories", 0)
+        macros = response.get("macros")
+        if macros is not None:
+            if self.macros is None:
+                self.macros = dict(macros)
+            else:
+                for field, value in macros.items():
+                    if value is not None:
+                        prev = self.macros.get(field)
+                        self.macros[field] = value if prev is None else round(prev + value, 1)
+
+    def summary(self) -> dict:
+        out = {
+            "images": self.images,
+            "failed": self.failed,
+            "totalCalories": self.total_calories,
+            "tableVersion": self.state.version,
+        }
+        if self.macros is not None:
+            out["macros"] = self.macros
+        return out
+
+
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+
+def stream_mode(request: Request):
+    """?stream=ndjson|sse 또는 Accept 헤더 → 스트리밍 형식 (없으면 None)"""
+    mode = request.query_params.get("stream", "").lower()
+    if mode in STREAM_MEDIA_TYPES:
+        return mode
+    accept = request.headers.get("accept", "")
+    for name, media_type in STREAM_MEDIA_TYPES.items():
+        if media_type in accept:
+            return name
+    return None
+
+
+def stream_record(mode: str, kind: str, record: dict) -> str:
+    data = json.dumps(record, ensure_ascii=False)
+    if mode == "sse":
+        return f"event: {kind}\ndata: {data}\n\n"
+    return json.dumps({"type": kind, **record}, ensure_ascii=False) + "\n"
+
+
+async def stream_batch(batch: BatchRequest, state, mode: str):
+    totals = BatchTotals(state)
+    async for index, response in iter_batch_predictions(batch, state):
+        totals.add(response)
+        yield stream_record(mode, "result", {"index": index, **response})
+    yield stream_record(mode, "summary", totals.summary())
+
+
+@app.post("/predict/batch")
+async def predict_batch(request: Request):
+    """
+    사진 여러 장 (하루치 식사 기록 등) → 사진별 결과 + 전체 칼로리
+      - 사진별 결과는 /predict 응답과 같은 형태 + index (보낸 순서)
+      - ?stream=ndjson / ?stream=sse 면 끝나는 대로 한 줄씩 (마지막은 summary)
+    """
+    mode = stream_mode(request)
+    batch = await read_batch_request(request)
+    if isinstance(batch, dict):
+        return batch
+
+    state = foods.state
+    if mode is not None:
+        return StreamingResponse(
+            stream_batch(batch, state, mode),
+            media_type=STREAM_MEDIA_TYPES[mode],
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    totals = BatchTotals(state)
+    results = [None] * len(batch.payloads)
+    async for index, response in iter_batch_predictions(batch, state):
+        totals.add(response)
+        results[index] = {"index": index, **response}
+    return {"results": results, **totals.summary()}
+
+
+# -----------------------------
+# 6-4. /ws/camera (실시간 카메라 미리보기)
+#    - WebSocket 으로 JPEG 프레임을 바이너리 메시지로 계속 보내면 검출 결과를 JSON 으로 돌려줌
+#      (HTTP 요청 / base64 없음, 옵션은 접속 주소 쿼리: ?includeMeta=true&includeMacros=true)
+#    - 추론 중에 들어온 프레임은 가장 최근 것 하나만 남기고 버림 (camera.py LatestFrame)
+#    - 연결당 초당 추론 횟수 상한 SMARTCAL_CAMERA_MAX_FPS, 서버 전체 연결 수 상한 SMARTCAL_CAMERA_MAX_CONNECTIONS
+#      (넘으면 접속 직후 1013 "Try Again Later" 로 닫음)
+#    - 결과: /predict 응답 + frame (처리한 프레임 번호, 1부터) + dropped (지금까지 버린 프레임 수)
+#    - ?track=true 면 추적 모드 (tracking.py): YOLO 는 키프레임에만 (N 프레임마다 / 장면이 바뀌면),
+#      그 사이 프레임은 화면 이동량만큼 박스를 옮겨서 응답. item 마다 trackId (연결 안에서 유지),
+#      응답에 keyframe (이번 프레임에 YOLO 를 돌렸는지). 결과 캐시는 쓰지 않음
+# -----------------------------
+CAMERA_MAX_FRAME_BYTES = int(float(os.getenv("SMARTCAL_CAMERA_MAX_FRAME_MB", "2")) * 1024 * 1024)
+camera_limiter = CameraLimiter(
+    max_connections=int(os.getenv("SMARTCAL_CAMERA_MAX_CONNECTIONS", "8")),
+    max_fps=float(os.getenv("SMARTCAL_CAMERA_MAX_FPS", "5")),
+)
+
+WS_TRY_AGAIN_LATER = 1013
+
+# 카메라 연결 번호 (연결마다 근접 중복 캐시를 따로 씀)
+camera_connection_ids = itertools.count(1)
+
+# 추적 모드 설정 (키프레임 간격 / 장면 변화 dHash 거리 / 검출 ↔ 트랙 IoU / 트랙 유지 키프레임 수)
+TRACK_KEYFRAME_INTERVAL = int(os.getenv("SMARTCAL_TRACK_KEYFRAME_INTERVAL", "10"))
+TRACK_SCENE_THRESHOLD = int(os.getenv("SMARTCAL_TRACK_SCENE_THRESHOLD", "24"))
+TRACK_IOU = float(os.getenv("SMARTCAL_TRACK_IOU", "0.3"))
+TRACK_MAX_MISSED = int(os.getenv("SMARTCAL_TRACK_MAX_MISSED", "2"))
+
+
+def decode_for_tracking(img_bytes: bytes):
+    # 디코딩 풀에서 한 번에: 디코딩 + 추적용 시그니처
+    np_img = decode_bytes_to_array(img_bytes)
+    return np_img, frame_signature(np_img)
+
+
+async def predict_tracked(tracker: FrameTracker, frame: bytes, state) -> dict:
+    """추적 모드 프레임 1장: 키프레임이면 YOLO + 트랙 갱신, 아니면 박스만 이동"""
+    loop = asyncio.get_running_loop()
+    try:
+        np_img, sig = await loop.run_in_executor(DECODE_EXECUTOR, decode_for_tracking, frame)
+    except Exception as e:
+        return {"success": False, "error": f"이미지 디코딩 실패: {e}"}
+
+    keyframe = tracker.needs_keyframe(sig)
+    if keyframe:
+        async with PREDICT_SLOTS:
+            try:
+                detections = await asyncio.wrap_future(batcher.submit(np_img))
+            except QueueFullError as e:
+                return {"success": False, "error": f"서버가 혼잡합니다. 잠시 후 다시 시도해 주세요: {e}"}
+            except Exception as e:
+                return {"success": False, "error": f"YOLO 추론 중 오류: {e}"}
+        tracker.update(detections, sig)
+    else:
+        tracker.propagate(sig)
+
+    detections, track_ids = tracker.current()
+    response = build_predict_response(detections, state, sig.image_hw, track_ids, record_stats=keyframe)
+    return {**response, "keyframe": keyframe}
+
+
+async def camera_worker(websocket: WebSocket, frames, include_meta: bool, include_macros: bool, tracker=None):
+    """대기 칸에서 최신 프레임을 꺼내서 추론 → 결과 전송 (연결당 1개씩만 진행)"""
+    client = f"camera:{next(camera_connection_ids)}"
+    last_start = 0.0
+    while True:
+        last_start = await camera_limiter.pace(last_start)
+        item = await frames.get()
+        if item is None:
+            return
+        seq, frame = item
+        if tracker is None:
+            response = await predict_full(decode_bytes_to_array, frame, foods.state, near_duplicate=True, client=client)
+        else:
+            response = await predict_tracked(tracker, frame, foods.state)
+            if response.get("keyframe") is False:
+                camera_limiter.frames_tracked += 1
+        camera_limiter.frames_processed += 1
+        response = trim_response(response, include_meta, include_macros)
+        try:
+            await websocket.send_json({"frame": seq, "dropped": frames.dropped, **response})
+        except (WebSocketDisconnect, RuntimeError):
+            return  # 보내는 중에 연결이 끊김
+
+
+@app.websocket("/ws/camera")
+async def camera_socket(websocket: WebSocket):
+    await websocket.accept()
+    frames = camera_limiter.open()
+    if frames is None:
+        await websocket.close(code=WS_TRY_AGAIN_LATER, reason="too many camera connections")
+        return
+
+    include_meta = query_flag(websocket, "includeMeta", False)
+    include_macros = query_flag(websocket, "includeMacros", False)
+    tracker = None
+    if query_flag(websocket, "track", False):
+        tracker = FrameTracker(
+            keyframe_interval=TRACK_KEYFRAME_INTERVAL,
+            scene_threshold=TRACK_SCENE_THRESHOLD,
+            iou_thres=TRACK_IOU,
+            max_missed=TRACK_MAX_MISSED,
+        )
+    worker = asyncio.ensure_future(camera_worker(websocket, frames, include_meta, include_macros, tracker))
+    try:
+        while not worker.done():
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            data = message.get("bytes")
+            if data is None:
+                await websocket.send_json({"success": False, "error": "JPEG 프레임을 바이너리 메시지로 보내 주세요."})
+            elif len(data) > CAMERA_MAX_FRAME_BYTES:
+                await websocket.send_json({"success": False, "error": "프레임이 너무 큽니다."})
+            elif data:
+                frames.put(data)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        camera_limiter.close(frames)
+        worker.cancel()
+
+
+# -----------------------------
+# 7. /metrics, /coverage, /aliases 엔드포인트 (운영 지표)
+# -----------------------------
+@app.get("/metrics")
+def metrics():
+    return {
+        "backend": {
+            "name": model.name,
+            "modelPath": MODEL_PATH,
+            "imgsz": model.imgsz,
+            "quantReport": getattr(model, "quant_report", None),
+            "confThreshold": model.conf,
+            "foodClassIds": len(foods.state.class_index.food_class_ids),
+            "portionReferenceClasses": portion_estimator.reference_class_ids if portion_estimator else [],
+        },
+        "foodTable": foods.stats(),
+        "batcher": batcher.stats(),
+        "resultCache": result_cache.stats(),
+        "nearDuplicateCache": near_dup_cache.stats(),
+        "camera": camera_limiter.stats(),
+        "workers": {
+            "decodeWorkers": DECODE_WORKERS,
+            "inferWorkers": INFER_WORKERS,
+            "inferThreads": INFER_THREADS,
+            "maxConcurrency": MAX_CONCURRENCY,
+            "freeSlots": PREDICT_SLOTS._value,
+        },
+    }
+
+
+@app.get("/coverage")
+def coverage():
+    """모델 클래스 ↔ 칼로리 테이블 연결 현황"""
+    state = foods.state
+    return {**state.class_index.coverage_report(), "tableVersion": state.version}
+
+
+@app.get("/aliases")
+def aliases_report():
+    """별칭별 적중률 (실제 추론 결과 기준)"""
+    state = foods.state
+    return {**state.alias_stats.report(), "tableVersion": state.version}
+
+
+# -----------------------------
+# 8. /admin/reload-foods (칼로리 테이블 다시 읽기)
+#    - X-Admin-Token 헤더가 SMARTCAL_ADMIN_TOKEN 과 같아야 함 (토큰을 안 정했으면 항상 거부)
+#    - 빌드는 디코딩 풀에서 (이벤트 루프 안 막음), 실패하면 이전 버전 그대로
+# -----------------------------
+@app.post("/admin/reload-foods")
+async def reload_foods(request: Request):
+    token = request.headers.get("x-admin-token", "")
+    if not ADMIN_TOKEN or not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        return {"success": False, "error": "관리자 토큰이 없거나 틀렸습니다."}
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(DECODE_EXECUTOR, foods.reload, True)
@@ -0,0 +1,83 @@
+import numpy as np
+
+from food_table import NUTRIENT_FIELDS
+
+
+# -----------------------------
+# 영양 성분 열 저장소
+#   - (항목 수, 필드 수) float64 행렬 하나: calories + carbs / protein / fat / sugar / sodium
+#   - 값이 없는 성분은 NaN (지금은 일부 항목만 성분 정보가 있음)
+#   - 한 접시 / 하루 / 전체 기록 합계가 전부 "행 번호 배열로 모아서 한 번에 합산"
+#     (NaN 은 합계에서 빼고, 값이 있던 항목 수를 같이 돌려줌)
+# -----------------------------
+NUTRITION_FIELDS = ("calories",) + NUTRIENT_FIELDS
+
+
+class NutritionStore:
+    def __init__(self, values: np.ndarray, table=None):
+        self.values = np.asarray(values, dtype=np.float64)  # (n, len(NUTRITION_FIELDS))
+        self.table = table
+
+    @classmethod
+    def from_table(cls, table) -> "NutritionStore":
+        """FoodTable 의 열(column)을 그대로 모아서 생성 (행 번호 = 항목 ID)"""
+        values = np.column_stack([table.column(f).astype(np.float64) for f in NUTRITION_FIELDS])
+        return cls(values, table)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def row_of(self, key: str) -> int:
+        return self.table.index_of(key) if self.table is not None else -1
+
+    def take(self, rows, scale=None) -> "NutritionStore":
+        """다른 ID 체계(예: 모델 클래스 ID)로 다시 색인한 저장소. rows 가 -1 이면 전부 NaN"""
+        rows = np.asarray(rows, dtype=np.int64)
+        values = np.full((len(rows), len(NUTRITION_FIELDS)), np.nan)
+        valid = rows >= 0
+        values[valid] = self.values[rows[valid]]
+        if scale is not None:
+            values *= np.asarray(scale, dtype=np.float64)[:, None]
+        return NutritionStore(values)
+
+    def _gather(self, ids, weights=None) -> np.ndarray:
+        vals = self.values[np.asarray(ids, dtype=np.int64)]
+        if weights is not None:
+            vals = vals * np.asarray(weights, dtype=np.float64)[:, None]
+        return vals
+
+    def totals(self, ids, weights=None) -> dict:
+        """한 접시 (또는 임의 항목 묶음) 합계"""
+        vals = self._gather(ids, weights)
+        return totals_dict(np.nansum(vals, axis=0), (~np.isnan(vals)).sum(axis=0), len(vals))
+
+    def totals_by_group(self, ids, groups, num_groups: int, weights=None):
+        """하루 / 사용자 기록 등 그룹별 합계 → (합계 (G, F), 값 있는 항목 수 (G, F), 항목 수 (G,))"""
+        vals = self._gather(ids, weights)
+        groups = np.asarray(groups, dtype=np.int64)
+        known = ~np.isnan(vals)
+
+        sums = np.zeros((num_groups, vals.shape[1]))
+        np.add.at(sums, groups, np.where(known, vals, 0.0))
+        counts = np.zeros((num_groups, vals.shape[1]), dtype=np.int64)
+        np.add.at(counts, groups, known)
+        return sums, counts, np.bincount(groups, minlength=num_groups)
+
+
+def zero_totals() -> dict:
+    """항목이 하나도 없을 때의 합계 (totals_dict 와 같은 모양, 성분은 None 대신 0)"""
+    out = {"calories": 0.0}
+    out.update((field, 0.0) for field in NUTRIENT_FIELDS)
+    out["items"] = 0
+    out["itemsWithNutrients"] = 0
+    return out
+
+
+def totals_dict(sums, known, items: int) -> dict:
+    """합계 행 하나 → 응답 형태 (값이 있던 항목이 하나도 없으면 None)"""
+    out = {"calories": round(float(sums[0]), 1)}
+    for i, field in enumerate(NUTRIENT_FIELDS, start=1):
+        out[field] = round(float(sums[i]), 1) if known[i] else None
+    out["items"] = int(items)
+    out["itemsWithNutrients"] = int(known[1:].min()) if len(known) > 1 else 0
+    return out
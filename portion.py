@@ -0,0 +1,91 @@
+import numpy as np
+
+
+# -----------------------------
+# 양(portion) 추정: 박스 면적 → 칼로리 배율
+#   - 같은 YOLO 결과에 기준 물체(그릇 / 접시 / 컵 / 수저)가 있으면 그 크기로 "1인분 면적"을 잡음
+#       1인분 면적 = 기준 물체 박스 면적 / REFERENCE_SERVING_RATIO[라벨]
+#     (기준 물체가 여러 개면 신뢰도가 가장 높은 것 하나)
+#   - 기준 물체가 없으면 기본은 배율 1.0 (basis "none", 1인분 칼로리 그대로)
+#     image_fraction 을 주면(선택) 이미지 면적 × image_fraction 을 1인분 면적으로 봄 (basis "image")
+#       0.25 는 "한 접시를 찍으면 음식이 화면의 1/4 정도" 라는 어림값일 뿐 실제 사진으로 보정한 값이 아님
+#       → 한 접시를 가까이 찍으면 화면을 거의 채워서 상한(2.0)까지 올라감, 그래서 기본은 끔
+#   - 배율 = clip((음식 박스 면적 / 1인분 면적) ** exponent, min, max), step 단위로 반올림
+#   - 박스 전체를 numpy 로 한 번에 계산 (이미지당 수십 µs, tools/bench_portion.py)
+# -----------------------------
+
+# 기준 물체 박스 면적 / 음식 1인분 박스 면적 (대략적인 값)
+#   bowl: 1인분이 그릇을 거의 채움, plate: 1인분이 접시의 60% 정도, 컵 / 수저는 1인분보다 작음
+REFERENCE_SERVING_RATIO = {
+    "bowl": 1.0,
+    "plate": 1.6,
+    "dish": 1.6,
+    "cup": 0.4,
+    "spoon": 0.25,
+    "fork": 0.25,
+    "knife": 0.3,
+    "chopsticks": 0.25,
+}
+
+
+class PortionEstimator:
+    def __init__(
+        self,
+        names: dict,
+        reference_ratio: dict = None,
+        image_fraction: float = None,
+        min_multiplier: float = 0.5,
+        max_multiplier: float = 2.0,
+        exponent: float = 1.0,
+        step: float = 0.05,
+    ):
+        reference_ratio = REFERENCE_SERVING_RATIO if reference_ratio is None else reference_ratio
+        self.names = dict(names)
+        num_classes = max(self.names, default=-1) + 1
+        # 클래스 ID → 기준 물체 비율 (0 이면 기준 물체 아님)
+        self.class_ratio = np.zeros(num_classes)
+        for cls_id, cls_name in self.names.items():
+            if cls_name in reference_ratio:
+                self.class_ratio[cls_id] = reference_ratio[cls_name]
+        self.image_fraction = float(image_fraction) if image_fraction else None
+        self.min_multiplier = float(min_multiplier)
+        self.max_multiplier = float(max_multiplier)
+        self.exponent = float(exponent)
+        self.step = float(step)
+
+    @property
+    def reference_class_ids(self) -> list:
+        """모델 클래스 필터에 같이 넣어야 하는 기준 물체 클래스"""
+        return np.flatnonzero(self.class_ratio > 0).tolist()
+
+    def estimate(self, xyxy, cls, conf, food_mask, image_hw, conf_threshold: float = 0.0):
+        """검출 전체 + 음식 박스 마스크 → (음식 박스별 배율 (K,), 기준: 기준 물체 라벨 / "image" / "none")"""
+        xyxy = np.asarray(xyxy, dtype=np.float64).reshape(-1, 4)
+        cls = np.asarray(cls, dtype=np.int64)
+        areas = (xyxy[:, 2] - xyxy[:, 0]).clip(0) * (xyxy[:, 3] - xyxy[:, 1]).clip(0)
+
+        # 1. 기준 물체 (음식으로 쓰인 박스는 제외)
+        in_range = (cls >= 0) & (cls < len(self.class_ratio))
+        ratio = np.zeros(len(cls))
+        ratio[in_range] = self.class_ratio[cls[in_range]]
+        is_ref = (ratio > 0) & (np.asarray(conf) >= conf_threshold) & ~food_mask & (areas > 0)
+
+        if is_ref.any():
+            ref = np.flatnonzero(is_ref)[np.argmax(np.asarray(conf)[is_ref])]
+            serving_area = areas[ref] / ratio[ref]
+            basis = self.names[int(cls[ref])]
+        elif self.image_fraction is not None:
+            h, w = image_hw
+            serving_area = float(h) * float(w) * self.image_fraction
+            basis = "image"
+        else:
+            return np.ones(int(food_mask.sum())), "none"
+
+        # 2. 음식 박스 배율
+        if serving_area <= 0:
+            return np.ones(int(food_mask.sum())), basis
+        mult = (areas[food_mask] / serving_area) ** self.exponent
+        mult = np.clip(mult, self.min_multiplier, self.max_multiplier)
+        if self.step > 0:
+            mult = np.round(mult / self.step) * self.step
+        return np.round(mult, 2), basis
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+
+# -----------------------------
+# 같은 사진 재전송(재시도, 더블탭)용 결과 캐시
+#   - key: 이미지 데이터(base64 문자열 또는 원본 바이트)의 blake2b 해시
+#   - value: /predict 응답 (items / totalCalories / note)
+#   - LRU + TTL, 개수 / 대략적인 메모리(바이트) 상한으로 제거
+# -----------------------------
+class ResultCache:
+    def __init__(self, max_entries=1024, max_bytes=16 * 1024 * 1024, ttl_sec=600.0):
+        self.max_entries = max(0, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl_sec = float(ttl_sec)
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key → (만료 시각, 크기, 응답)
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0      # 용량 초과로 제거
+        self.expirations = 0    # TTL 만료로 제거
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    @staticmethod
+    def key_for(data) -> str:
+        # base64 문자열이면 디코딩 전에 그대로 해시 (디코딩 비용 없이 조회)
+        if isinstance(data, str):
+            data = data.encode("ascii", "ignore")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, payload = entry
+            if expires_at < now:
+                self._remove(key, size)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, key, payload):
+        if not self.enabled:
+            return
+        # 응답 크기는 JSON 길이로 대충 계산
+        size = len(json.dumps(payload, ensure_ascii=False))
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl_sec
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (expires_at, size, payload)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                old_key, (_, old_size, _) = next(iter(self._entries.items()))
+                self._remove(old_key, old_size)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key, size):
+        del self._entries[key]
+        self._bytes -= size
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "config": {
+                    "maxEntries": self.max_entries,
+                    "maxBytes": self.max_bytes,
+                    "ttlSec": self.ttl_sec,
+                },
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+# -----------------------------
+# 연속 촬영(버스트) 사진용 근접 중복 캐시
+#   - key: 64비트 perceptual hash (dHash)
+#   - 고정 크기 링버퍼에 해시를 uint64 배열로 저장하고
+#     XOR + popcount 를 한 번에(벡터화) 계산해서 해밍 거리 검색
+#   - 거리 threshold 이하인 가장 가까운 항목의 응답을 재사용
+#   - scope (클라이언트 / 연결) 가 같은 항목끼리만 비교
+#     (다른 사용자의 비슷한 사진 — 무늬 없는 접시 등 — 결과가 섞이지 않게)
+# -----------------------------
+POPCOUNT_8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def hamming_distances(hashes: np.ndarray, query: int) -> np.ndarray:
+    x = np.bitwise_xor(hashes, np.uint64(query))
+    if hasattr(np, "bitwise_count"):  # numpy 2.0+
+        return np.bitwise_count(x)
+    return POPCOUNT_8[x.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def scope_id(scope) -> int:
+    # scope (클라이언트 주소, 연결 번호 등) → 64비트 정수 (None 이면 0 = 공용)
+    if scope is None:
+        return 0
+    digest = hashlib.blake2b(str(scope).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class NearDuplicateCache:
+    def __init__(self, capacity=512, threshold=4, ttl_sec=60.0):
+        self.capacity = max(0, int(capacity))
+        self.threshold = int(threshold)
+        self.ttl_sec = float(ttl_sec)
+
+        self._lock = threading.Lock()
+        self._hashes = np.zeros(self.capacity, dtype=np.uint64)
+        self._scopes = np.zeros(self.capacity, dtype=np.int64)
+        self._expires = np.full(self.capacity, -np.inf)  # 빈 칸은 항상 만료 상태
+        self._payloads = [None] * self.capacity
+        self._next = 0
+
+        self.lookups = 0
+        self.exact_hits = 0     # 거리 0
+        self.near_hits = 0      # 0 < 거리 <= threshold
+        self.misses = 0
+        self.skipped = 0        # 요청에서 껐거나 클라이언트 범위가 없는 경우
+        self.hit_distances = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0 and self.threshold >= 0
+
+    def get(self, phash: int, scope=None):
+        now = time.monotonic()
+        sid = scope_id(scope)
+        with self._lock:
+            self.lookups += 1
+            live = (self._expires >= now) & (self._scopes == sid)
+            if not live.any():
+                self.misses += 1
+                return None
+            dist = hamming_distances(self._hashes, phash)
+            dist = np.where(live, dist, 65)
+            best = int(np.argmin(dist))
+            d = int(dist[best])
+            if d > self.threshold:
+                self.misses += 1
+                return None
+            if d == 0:
+                self.exact_hits += 1
+            else:
+                self.near_hits += 1
+            self.hit_distances[d] += 1
+            return self._payloads[best]
+
+    def put(self, phash: int, payload, scope=None):
+        if not self.enabled:
+            return
+        sid = scope_id(scope)
+        with self._lock:
+            slot = self._next
+            self._hashes[slot] = np.uint64(phash)
+            self._scopes[slot] = sid
+            self._expires[slot] = time.monotonic() + self.ttl_sec
+            self._payloads[slot] = payload
+            self._next = (slot + 1) % self.capacity
+
+    def skip(self):
+        with self._lock:
+            self.skipped += 1
+
+    def clear(self):
+        with self._lock:
+            self._expires[:] = -np.inf
+            self._payloads = [None] * self.capacity
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.exact_hits + self.near_hits
+            return {
+                "config": {
+                    "capacity": self.capacity,
+                    "threshold": self.threshold,
+                    "ttlSec": self.ttl_sec,
+                },
+                "entries": int((self._expires >= time.monotonic()).sum()),
+                "lookups": self.lookups,
+                "exactHits": self.exact_hits,
+                "nearHits": self.near_hits,
+                "misses": self.misses,
+                "skipped": self.skipped,
+                "hitRate": round(hits / self.lookups, 4) if self.lookups else 0.0,
+                "hitDistanceHistogram": dict(sorted(self.hit_distances.items())),
+            }
@@ -0,0 +1,12 @@
+import json
+
+import numpy as np
+
+from food_index import round_confidences
+
+
+def test_round_confidences_serializes_like_python_round():
+    conf = np.array([0.9, 0.35, 0.8765], dtype=np.float32)
+    assert round_confidences(conf) == [0.9, 0.35, 0.877]
+    assert json.dumps(round_confidences(conf)) == "[0.9, 0.35, 0.877]"
+    assert f"{round_confidences(conf)[0]}" == "0.9"
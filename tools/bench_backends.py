@@ -0,0 +1,104 @@
+"""
+torch 백엔드 vs onnx 백엔드 일치도(parity) + 지연시간 비교
+
+    python -m tools.bench_backends                       # ultralytics 샘플 이미지 사용
+    python -m tools.bench_backends photos/*.jpg --onnx yolov8n.onnx
+
+  - 같은 이미지에서 (클래스 같고 IoU >= 0.9, conf 차이 <= 0.05) 인 박스를 짝지어 일치율 계산
+  - 일치율이 --min-match 보다 낮거나, torch 가 찾은 박스(기준)가 --min-boxes 개보다 적으면 종료 코드 1
+    (둘 다 아무것도 못 찾으면 일치율을 잴 수 없음 → 빈 테스트 세트 / 깨진 export 가 통과하지 않게)
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+from backends import TorchBackend, OnnxBackend, box_iou, export_onnx
+
+
+def load_images(paths):
+    if not paths:
+        from ultralytics.utils import ASSETS
+
+        paths = sorted(glob.glob(os.path.join(str(ASSETS), "*.jpg")))
+    # 서버와 같은 입력: RGB uint8 배열
+    return paths, [np.asarray(Image.open(p).convert("RGB")) for p in paths]
+
+
+def match_detections(a, b, iou_thres=0.9, conf_tol=0.05):
+    """a 의 박스 중 b 에 짝이 있는 개수 (그리디)"""
+    used = np.zeros(len(b.cls), dtype=bool)
+    matched = 0
+    for box, conf, cls in zip(a.xyxy, a.conf, a.cls):
+        cand = (~used) & (b.cls == cls) & (np.abs(b.conf - conf) <= conf_tol)
+        if not cand.any():
+            continue
+        ious = np.where(cand, box_iou(box, b.xyxy), 0.0)
+        j = int(ious.argmax())
+        if ious[j] >= iou_thres:
+            used[j] = True
+            matched += 1
+    return matched
+
+
+def time_backend(backend, images, repeat):
+    backend(images[:1])  # 워밍업
+    times = []
+    for _ in range(repeat):
+        for img in images:
+            t0 = time.perf_counter()
+            backend([img])
+            times.append((time.perf_counter() - t0) * 1000.0)
+    return float(np.mean(times)), float(np.percentile(times, 95))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("images", nargs="*")
+    parser.add_argument("--weights", default="yolov8n.pt")
+    parser.add_argument("--onnx", default=None, help="없으면 --weights 에서 export")
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-match", type=float, default=0.95)
+    parser.add_argument("--min-boxes", type=int, default=10, help="일치율 판정에 필요한 최소 기준(torch) 박스 수")
+    args = parser.parse_args()
+
+    onnx_path = args.onnx or export_onnx(args.weights, imgsz=args.imgsz)
+    torch_backend = TorchBackend(args.weights, imgsz=args.imgsz, threads=args.threads)
+    onnx_backend = OnnxBackend(onnx_path, imgsz=args.imgsz, threads=args.threads)
+
+    paths, images = load_images(args.images)
+
+    total = matched = ref_boxes = 0
+    print(f"{'image':<28} {'torch':>6} {'onnx':>6} {'matched':>8}")
+    for path, img in zip(paths, images):
+        t = torch_backend([img])[0]
+        o = onnx_backend([img])[0]
+        m = min(match_detections(t, o), match_detections(o, t))
+        total += max(len(t.cls), len(o.cls))
+        ref_boxes += len(t.cls)
+        matched += m
+        print(f"{os.path.basename(path):<28} {len(t.cls):>6} {len(o.cls):>6} {m:>8}")
+    rate = matched / total if total else 0.0
+    print(f"parity: {matched}/{total} boxes matched ({rate:.1%}, {ref_boxes} reference boxes)")
+
+    print(f"{'backend':<8} {'mean ms':>9} {'p95 ms':>9}")
+    for backend in (torch_backend, onnx_backend):
+        mean, p95 = time_backend(backend, images, args.repeat)
+        print(f"{backend.name:<8} {mean:>9.1f} {p95:>9.1f}")
+
+    if ref_boxes < max(1, args.min_boxes):
+        print(f"FAIL: only {ref_boxes} reference boxes < {args.min_boxes} (parity not measured)")
+        sys.exit(1)
+    if rate < args.min_match:
+        print(f"FAIL: parity {rate:.1%} < {args.min_match:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
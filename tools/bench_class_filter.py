@@ -0,0 +1,87 @@
+"""
+클래스 필터를 모델 호출 안으로 넣었을 때 후처리 비용 비교
+
+    python -m tools.bench_class_filter                    # 합성 '어수선한 장면' 출력으로 측정
+    python -m tools.bench_class_filter --onnx yolov8n.onnx photos/*.jpg
+
+  - all  : 모든 클래스로 NMS 후 파이썬에서 걸러냄 (기존 방식)
+  - food : 음식 클래스만 NMS 로 넘김 (set_filter)
+"""
+import argparse
+import time
+
+import numpy as np
+
+from backends import LetterboxMeta, OnnxBackend, postprocess
+
+# COCO 음식 클래스 (banana ~ cake)
+COCO_FOOD_IDS = list(range(46, 56))
+
+
+def make_cluttered_pred(num_clutter=40, num_food=3, per_object=150, nc=80, anchors=8400, seed=0):
+    """YOLOv8 출력 (4 + nc, anchors) 모양의 합성 예측: 사람/가구 등 많고 음식은 조금"""
+    rng = np.random.default_rng(seed)
+    pred = np.zeros((4 + nc, anchors), dtype=np.float32)
+    pred[0:2] = rng.uniform(0, 640, size=(2, anchors))
+    pred[2:4] = rng.uniform(8, 64, size=(2, anchors))
+    pred[4:] = rng.uniform(0, 0.05, size=(nc, anchors))
+
+    clutter_ids = [c for c in range(nc) if c not in COCO_FOOD_IDS]
+    objects = [(int(rng.choice(clutter_ids))) for _ in range(num_clutter)]
+    objects += [int(rng.choice(COCO_FOOD_IDS)) for _ in range(num_food)]
+
+    slots = rng.permutation(anchors)
+    for k, cls in enumerate(objects):
+        idx = slots[k * per_object:(k + 1) * per_object]
+        cx, cy = rng.uniform(50, 590, size=2)
+        w, h = rng.uniform(40, 200, size=2)
+        pred[0, idx] = cx + rng.normal(0, 6, per_object)
+        pred[1, idx] = cy + rng.normal(0, 6, per_object)
+        pred[2, idx] = w * rng.uniform(0.85, 1.15, per_object)
+        pred[3, idx] = h * rng.uniform(0.85, 1.15, per_object)
+        pred[4 + cls, idx] = rng.uniform(0.4, 0.95, per_object)
+    return pred
+
+
+def time_ms(fn, repeat):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("images", nargs="*")
+    parser.add_argument("--onnx", default=None, help="주면 실제 모델로도 측정")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--conf", type=float, default=0.35)
+    args = parser.parse_args()
+
+    meta = LetterboxMeta(1.0, 0, 0, 640, 640)
+    mask = np.zeros(80, dtype=bool)
+    mask[COCO_FOOD_IDS] = True
+
+    print("synthetic cluttered scene (40 non-food objects, 3 food objects, 150 candidates each)")
+    print(f"{'mode':<6} {'post ms':>9} {'boxes':>6}")
+    pred = make_cluttered_pred()
+    for name, class_mask in (("all", None), ("food", mask)):
+        ms = time_ms(lambda: postprocess(pred, meta, args.conf, 0.7, 300, class_mask), args.repeat)
+        n = len(postprocess(pred, meta, args.conf, 0.7, 300, class_mask).cls)
+        print(f"{name:<6} {ms:>9.2f} {n:>6}")
+
+    if args.onnx:
+        from PIL import Image
+
+        backend = OnnxBackend(args.onnx, conf=args.conf)
+        images = [np.asarray(Image.open(p).convert("RGB")) for p in args.images]
+        print(f"{args.onnx} on {len(images)} images")
+        for name, classes in (("all", None), ("food", COCO_FOOD_IDS)):
+            backend.set_filter(classes=classes)
+            ms = time_ms(lambda: [backend([img]) for img in images], max(1, args.repeat // 4))
+            print(f"{name:<6} {ms / max(1, len(images)):>9.2f} ms/image (end-to-end)")
+
+
+if __name__ == "__main__":
+    main()
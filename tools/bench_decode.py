@@ -0,0 +1,128 @@
+"""
+JPEG 디코딩 벤치마크 (기존 방식 vs draft 디코딩)
+
+    python -m tools.bench_decode                 # 합성 12MP 사진으로 측정
+    python -m tools.bench_decode photos/*.jpg    # 실제 사진으로 측정
+
+  - legacy: Image.open(...).convert("RGB") → np.array(img)   (전체 해상도 + 이중 복사)
+  - draft : open_image_for_model(...) → image_to_array(img)  (imgsz 기준 축소 디코딩 + 복사 1회)
+  - 최대 메모리(RSS)는 모드별로 별도 프로세스를 띄워서 측정
+"""
+import argparse
+import io
+import json
+import resource
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from imaging import image_to_array, open_image_for_model
+
+
+def make_sample_jpeg(width=4032, height=3024, seed=0) -> bytes:
+    # 부드러운 그라디언트 + 잡음: 실제 사진과 비슷한 압축률이 나오도록
+    rng = np.random.default_rng(seed)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :]
+    base = np.stack(np.broadcast_arrays((x + y) / 2, x * 0.8 + 20, 255 - y * 0.9), axis=-1)
+    noise = rng.normal(0, 6, size=(height, width, 1)).astype(np.float32)
+    arr = np.clip(base + noise, 0, 255).astype(np.uint8)
+    buf = io.BytesIO()
+    Image.fromarray(arr).save(buf, format="JPEG", quality=90)
+    return buf.getvalue()
+
+
+def decode_legacy(img_bytes: bytes, imgsz: int) -> np.ndarray:
+    img = Image.open(io.BytesIO(img_bytes)).convert("RGB")
+    return np.array(img)
+
+
+def decode_draft(img_bytes: bytes, imgsz: int) -> np.ndarray:
+    return image_to_array(open_image_for_model(img_bytes, imgsz))
+
+
+MODES = {"legacy": decode_legacy, "draft": decode_draft}
+
+
+def write_synthetic_samples(out_dir, count=3):
+    paths = []
+    for i in range(count):
+        path = os.path.join(out_dir, f"sample_{i}.jpg")
+        with open(path, "wb") as f:
+            f.write(make_sample_jpeg(seed=i))
+        paths.append(path)
+    return paths
+
+
+def peak_rss_mb() -> float:
+    # VmHWM 은 exec 이후 새로 시작 (ru_maxrss 는 부모 프로세스 값이 남을 수 있음)
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def run_mode(mode, samples, imgsz, repeat):
+    fn = MODES[mode]
+    fn(samples[0], imgsz)  # 워밍업
+    times = []
+    shape = None
+    for _ in range(repeat):
+        for data in samples:
+            t0 = time.perf_counter()
+            arr = fn(data, imgsz)
+            times.append((time.perf_counter() - t0) * 1000.0)
+            shape = arr.shape
+    return {
+        "mode": mode,
+        "meanMs": round(float(np.mean(times)), 2),
+        "p95Ms": round(float(np.percentile(times, 95)), 2),
+        "outShape": list(shape),
+        "maxRssMB": round(peak_rss_mb(), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("images", nargs="*")
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--mode", choices=sorted(MODES), help="(내부용) 한 모드만 측정하고 JSON 출력")
+    args = parser.parse_args()
+
+    if args.mode:
+        samples = [open(p, "rb").read() for p in args.images]
+        print(json.dumps(run_mode(args.mode, samples, args.imgsz, args.repeat)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = args.images or write_synthetic_samples(tmp)
+
+        # 모드마다 새 프로세스에서 측정해야 RSS 가 섞이지 않음
+        rows = []
+        for mode in ("legacy", "draft"):
+            cmd = [sys.executable, "-m", "tools.bench_decode", "--mode", mode,
+                   "--imgsz", str(args.imgsz), "--repeat", str(args.repeat), *paths]
+            out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+            rows.append(json.loads(out.strip().splitlines()[-1]))
+
+    src = f"{len(args.images)} files" if args.images else "3 synthetic 4032x3024 JPEGs"
+    print(f"samples: {src}, imgsz={args.imgsz}, repeat={args.repeat}")
+    print(f"{'mode':<8} {'mean ms':>9} {'p95 ms':>9} {'max RSS MB':>11}  out shape")
+    for r in rows:
+        print(f"{r['mode']:<8} {r['meanMs']:>9} {r['p95Ms']:>9} {r['maxRssMB']:>11}  {tuple(r['outShape'])}")
+    legacy, draft = rows
+    print(f"speedup: x{legacy['meanMs'] / max(draft['meanMs'], 1e-6):.1f}")
+
+
+if __name__ == "__main__":
+    main()
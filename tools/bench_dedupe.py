@@ -0,0 +1,164 @@
+"""
+클래스가 다른 중복 검출 제거(dedupe.py)가 합계를 얼마나 바꾸는지 / 얼마나 걸리는지
+
+    python -m tools.bench_dedupe                              # 합성 접시 1000개
+    python -m tools.bench_dedupe --model yolov8n.pt photos/*.jpg
+
+  - 합성 접시: COCO 음식 클래스 1~5개를 겹치지 않게 놓고,
+      dup   확률로 같은 category 의 다른 클래스로 한 번 더 검출 (박스 조금 흔들고 신뢰도 낮게) → 지워야 함
+      stack 확률로 다른 category 음식을 겹쳐 놓음 (피자 위 브로콜리 등) → 남겨야 함
+      pile  확률로 같은 category 의 다른 음식을 실제로 겹쳐 놓음 (과일 그릇의 바나나 + 사과 등) → 남겨야 함
+    정답은 규칙과 상관없이 박스를 만들 때 정함 (pile 은 dedupe 규칙으로는 중복과 구별이 안 되는 경우)
+    정답(중복 없는 합계)과 비교해서 제거 전 / 후 오차, 지운 중복 / 남은 중복 / 잘못 지운 진짜 음식 수를 출력
+    (pile 을 0 으로 두면 잘못 지운 수는 구성상 항상 0 이라 의미 없음)
+  - --model 을 주면 실제 사진에서 제거 전 / 후 합계와 바뀐 사진 수를 출력
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from dedupe import suppress_cross_class
+from food_state import build_food_state
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COCO_FOOD = {
+    40: "wine glass", 46: "banana", 47: "apple", 48: "sandwich", 49: "orange",
+    50: "broccoli", 51: "carrot", 52: "hot dog", 53: "pizza", 54: "donut", 55: "cake",
+}
+
+
+def load_class_index(names):
+    state = build_food_state(
+        names,
+        os.path.join(HERE, "data", "food_table.json"),
+        os.path.join(HERE, "data", "food_table.bin"),
+        aliases_path=os.path.join(HERE, "data", "food_aliases.json"),
+    )
+    return state.class_index
+
+
+def jitter_box(rng, box, amount):
+    w, h = box[2] - box[0], box[3] - box[1]
+    return box + rng.uniform(-amount, amount, size=4) * np.array([w, h, w, h])
+
+
+def synthetic_plates(class_index, count, dup_rate, stack_rate, pile_rate=0.0, seed=0):
+    """(xyxy, conf, cls, 진짜 박스 마스크, 같은 category 로 겹친 진짜 박스 마스크) 목록"""
+    rng = np.random.default_rng(seed)
+    food_ids = np.array(class_index.food_class_ids)
+    groups = class_index.class_group
+    plates = []
+    for _ in range(count):
+        boxes, confs, classes, real, piled = [], [], [], [], []
+        for slot in range(rng.integers(1, 6)):
+            cls = int(rng.choice(food_ids))
+            x, y = (slot % 3) * 210 + 10, (slot // 3) * 210 + 10
+            box = np.array([x, y, x + rng.uniform(120, 200), y + rng.uniform(120, 200)])
+            conf = rng.uniform(0.5, 0.95)
+            boxes.append(box), confs.append(conf), classes.append(cls), real.append(True), piled.append(False)
+
+            same = food_ids[(groups[food_ids] == groups[cls]) & (food_ids != cls)]
+            if len(same) and rng.random() < dup_rate:
+                boxes.append(jitter_box(rng, box, 0.05))
+                confs.append(conf * rng.uniform(0.5, 0.95))
+                classes.append(int(rng.choice(same)))
+                real.append(False), piled.append(False)
+
+            other = food_ids[groups[food_ids] != groups[cls]]
+            if rng.random() < stack_rate:
+                boxes.append(jitter_box(rng, box, 0.1))
+                confs.append(rng.uniform(0.4, 0.9))
+                classes.append(int(rng.choice(other)))
+                real.append(True), piled.append(False)
+
+            # 같은 category 의 다른 음식이 실제로 겹쳐 있음 (어느 정도 겹치는지는 무작위 → 일부만 IoU 기준을 넘음)
+            if len(same) and rng.random() < pile_rate:
+                boxes.append(jitter_box(rng, box, 0.3))
+                confs.append(rng.uniform(0.4, 0.9))
+                classes.append(int(rng.choice(same)))
+                real.append(True), piled.append(True)
+        plates.append(
+            (
+                np.array(boxes, dtype=np.float32),
+                np.array(confs, dtype=np.float32),
+                np.array(classes),
+                np.array(real),
+                np.array(piled),
+            )
+        )
+    return plates
+
+
+def dedupe(class_index, xyxy, conf, cls, iou):
+    return suppress_cross_class(xyxy, conf, class_index.class_group[cls], iou)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("images", nargs="*")
+    parser.add_argument("--model", default=None, help="주면 실제 사진으로도 측정 (.pt)")
+    parser.add_argument("--plates", type=int, default=1000)
+    parser.add_argument("--dup-rate", type=float, default=0.3)
+    parser.add_argument("--stack-rate", type=float, default=0.15)
+    parser.add_argument("--pile-rate", type=float, default=0.15, help="같은 category 음식이 실제로 겹치는 확률")
+    parser.add_argument("--iou", type=float, default=0.6)
+    args = parser.parse_args()
+
+    class_index = load_class_index(COCO_FOOD)
+    plates = synthetic_plates(class_index, args.plates, args.dup_rate, args.stack_rate, args.pile_rate)
+
+    before_err, after_err, times = [], [], []
+    changed = wrong = wrong_piled = removed = dups = dups_removed = piles = 0
+    for xyxy, conf, cls, real, piled in plates:
+        t0 = time.perf_counter()
+        keep = dedupe(class_index, xyxy, conf, cls, args.iou)
+        times.append((time.perf_counter() - t0) * 1e6)
+
+        truth = class_index.total_calories(cls[real])
+        before = class_index.total_calories(cls)
+        after = class_index.total_calories(cls[keep])
+        before_err.append(abs(before - truth) / max(truth, 1))
+        after_err.append(abs(after - truth) / max(truth, 1))
+        changed += before != after
+        removed += int((~keep).sum())
+        wrong += int((~keep & real).sum())
+        wrong_piled += int((~keep & piled).sum())
+        dups += int((~real).sum())
+        dups_removed += int((~keep & ~real).sum())
+        piles += int(piled.sum())
+
+    boxes = sum(len(p[2]) for p in plates)
+    print(
+        f"synthetic plates: {len(plates)} ({boxes} boxes, dup rate {args.dup_rate}, "
+        f"stack rate {args.stack_rate}, pile rate {args.pile_rate})"
+    )
+    print(f"  duplicates removed   : {dups_removed}/{dups}")
+    print(f"  real foods removed   : {wrong} (of {piles} same-category overlaps: {wrong_piled})")
+    print(f"  plates with new total: {changed}")
+    print(f"  total error vs truth : before {np.mean(before_err) * 100:.1f}%  after {np.mean(after_err) * 100:.1f}%")
+    if not args.pile_rate:
+        print("  note: --pile-rate 0 → real foods removed is 0 by construction (truth uses the same rule)")
+    print(f"  time per plate       : mean {np.mean(times):.1f} us, p95 {np.percentile(times, 95):.1f} us")
+
+    if args.model:
+        from PIL import Image
+
+        from backends import TorchBackend
+
+        backend = TorchBackend(args.model)
+        class_index = load_class_index(backend.names)
+        backend.set_filter(classes=class_index.food_class_ids)
+        print(f"{args.model} on {len(args.images)} images")
+        for path in args.images:
+            det = backend([np.asarray(Image.open(path).convert("RGB"))])[0]
+            mask = class_index.food_mask(det.cls, det.conf)
+            keep = dedupe(class_index, det.xyxy[mask], det.conf[mask], det.cls[mask], args.iou)
+            before = class_index.total_calories(det.cls[mask])
+            after = class_index.total_calories(det.cls[mask][keep])
+            print(f"  {os.path.basename(path):<30} {before:>6} → {after:>6} kcal ({int((~keep).sum())} removed)")
+
+
+if __name__ == "__main__":
+    main()
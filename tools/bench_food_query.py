@@ -0,0 +1,125 @@
+"""
+/foods 필터 조회 벤치마크 (비트맵 역색인 vs dict 전체 순회)
+
+    python -m tools.bench_food_query                  # 10k, 100k 합성 항목
+    python -m tools.bench_food_query --sizes 1000 1000000
+
+  - 실제 테이블의 cuisine / category / tags / 칼로리 분포에서 뽑아서 합성 항목 생성
+  - 같은 조건을 두 방식으로 실행해서 결과가 같은지 확인하고 쿼리당 시간 비교
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from food_query import FoodIndex, normalize
+from food_table import FoodTable, compile_food_table, read_source
+
+QUERIES = [
+    {"cuisine": ["Korean"], "tags": ["매운"], "max_calories": 600},
+    {"cuisine": ["Korean", "Japanese", "Chinese"]},
+    {"category": ["면", "밥"], "min_calories": 300, "max_calories": 700},
+    {"tags": ["매운", "국물"], "tag_mode": "any"},
+    {"tags": ["매운", "야식"]},
+    {"max_calories": 200},
+]
+
+
+def synthetic_foods(real, size, seed=0):
+    rng = np.random.default_rng(seed)
+    cuisines = [e["cuisine"] for _, e in real]
+    categories = [e["category"] for _, e in real]
+    tag_lists = [e.get("tags", []) for _, e in real]
+    calories = np.array([e["calories"] for _, e in real])
+
+    foods = []
+    picks = rng.integers(0, len(real), size=(size, 4))
+    jitter = rng.normal(1.0, 0.15, size=size)
+    for i in range(size):
+        a, b, c, d = picks[i]
+        foods.append({
+            "key": f"syn_{i:07d}",
+            "foodName": f"합성 {i}",
+            "calories": int(max(0, calories[d] * jitter[i])),
+            "cuisine": cuisines[a],
+            "category": categories[b],
+            "portion": "1인분",
+            "tags": tag_lists[c],
+        })
+    return foods
+
+
+def linear_scan(foods, cuisine=(), category=(), tags=(), tag_mode="all", min_calories=None, max_calories=None):
+    cuisine = {normalize(v) for v in cuisine}
+    category = {normalize(v) for v in category}
+    tags = {normalize(v) for v in tags}
+    out = []
+    for row, food in enumerate(foods):
+        if cuisine and normalize(food["cuisine"]) not in cuisine:
+            continue
+        if category and normalize(food["category"]) not in category:
+            continue
+        if tags:
+            food_tags = {normalize(t) for t in food["tags"]}
+            if tag_mode == "any" and not (tags & food_tags):
+                continue
+            if tag_mode != "any" and not tags <= food_tags:
+                continue
+        if min_calories is not None and food["calories"] < min_calories:
+            continue
+        if max_calories is not None and food["calories"] > max_calories:
+            continue
+        out.append(row)
+    return out
+
+
+def best_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return min(times)
+
+
+def main():
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    real = read_source(os.path.join(here, "data", "food_table.json"))
+    for size in args.sizes:
+        foods = synthetic_foods(real, size)
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "foods.json")
+            with open(src, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "foods": foods}, f, ensure_ascii=False)
+            compile_food_table(src, os.path.join(tmp, "foods.bin"))
+            table = FoodTable(os.path.join(tmp, "foods.bin"))
+
+            t0 = time.perf_counter()
+            index = FoodIndex(table)
+            build_ms = (time.perf_counter() - t0) * 1000.0
+            index_kb = sum(b.nbytes for field in index.bitmaps.values() for b in field.values()) / 1024.0
+
+            print(f"\n{size} foods: index build {build_ms:.1f} ms, "
+                  f"{sum(len(v) for v in index.bitmaps.values())} bitmaps, {index_kb:.0f} KB")
+            print(f"{'query':<70} {'hits':>7} {'scan ms':>9} {'index ms':>9} {'speedup':>8}")
+            for q in QUERIES:
+                got = index.query(**q).tolist()
+                want = linear_scan(foods, **q)
+                if got != want:
+                    raise SystemExit(f"result mismatch for {q}: index {len(got)} vs scan {len(want)}")
+                scan_ms = best_ms(lambda: linear_scan(foods, **q), args.repeat)
+                index_ms = best_ms(lambda: index.query(**q), args.repeat)
+                label = json.dumps(q, ensure_ascii=False)
+                print(f"{label:<70} {len(got):>7} {scan_ms:>9.2f} {index_ms:>9.3f} {scan_ms / index_ms:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
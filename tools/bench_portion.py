@@ -0,0 +1,81 @@
+"""
+양(portion) 추정 비용 / 결과 확인
+
+    python -m tools.bench_portion                 # 합성 검출 결과 (박스 수별)
+    python -m tools.bench_portion --boxes 5 50 300
+
+  - 기준 물체(bowl)가 있는 장면 / 없는 장면 각각 estimate() 한 번에 걸리는 시간
+  - 예시 장면 몇 개의 배율 (그릇보다 작은 음식 / 큰 음식 / 기준 물체 없음)
+    기준 물체 없는 장면은 기본(배율 1.0)과 --image-fraction 을 준 경우를 같이 출력
+"""
+import argparse
+import time
+
+import numpy as np
+
+from portion import PortionEstimator
+
+# COCO 클래스 일부 (bowl = 45, 음식 = banana ~ cake)
+NAMES = {41: "cup", 42: "fork", 43: "knife", 44: "spoon", 45: "bowl", **{i: f"food{i}" for i in range(46, 56)}}
+FOOD_IDS = np.arange(46, 56)
+BOWL = 45
+
+
+def synthetic(num_boxes, with_reference, seed=0):
+    rng = np.random.default_rng(seed)
+    xy = rng.uniform(0, 500, size=(num_boxes, 2))
+    wh = rng.uniform(40, 300, size=(num_boxes, 2))
+    xyxy = np.hstack([xy, xy + wh]).astype(np.float32)
+    cls = rng.choice(FOOD_IDS, size=num_boxes).astype(np.int64)
+    if with_reference:
+        cls[0] = BOWL
+    conf = rng.uniform(0.35, 0.95, size=num_boxes).astype(np.float32)
+    return xyxy, cls, conf, np.isin(cls, FOOD_IDS)
+
+
+def time_us(fn, repeat):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boxes", type=int, nargs="+", default=[3, 10, 50, 300])
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--image-fraction", type=float, default=0.25, help="기준 물체 없을 때 이미지 면적 비율 (선택 기능)")
+    args = parser.parse_args()
+
+    est = PortionEstimator(NAMES, image_fraction=args.image_fraction)
+    default_est = PortionEstimator(NAMES)
+    print(f"{'boxes':>6} {'reference':>10} {'us/image':>9}")
+    for n in args.boxes:
+        for with_ref in (True, False):
+            xyxy, cls, conf, mask = synthetic(max(n, 2), with_ref)
+            us = time_us(lambda: est.estimate(xyxy, cls, conf, mask, (640, 640), 0.35), args.repeat)
+            print(f"{n:>6} {('bowl' if with_ref else 'image'):>10} {us:>9.1f}")
+
+    print("\nexamples (640x640 image, bowl 200x200)")
+    scenes = {
+        "food half the bowl": [[0, 0, 200, 200, BOWL], [300, 300, 441, 441, 46]],
+        "food same as bowl": [[0, 0, 200, 200, BOWL], [300, 300, 500, 500, 46]],
+        "platter 3x bowl": [[0, 0, 200, 200, BOWL], [200, 200, 546, 546, 46]],
+        "no reference, 1/4 image": [[0, 0, 320, 320, 46]],
+        "no reference, small": [[0, 0, 100, 100, 46]],
+    }
+    for name, boxes in scenes.items():
+        arr = np.array(boxes, dtype=np.float32)
+        cls = arr[:, 4].astype(np.int64)
+        mult, basis = est.estimate(arr[:, :4], cls, np.full(len(arr), 0.9), np.isin(cls, FOOD_IDS), (640, 640))
+        print(f"  {name:<26} basis={basis:<6} multiplier={mult.tolist()}")
+        if basis == "image":
+            mult, basis = default_est.estimate(
+                arr[:, :4], cls, np.full(len(arr), 0.9), np.isin(cls, FOOD_IDS), (640, 640)
+            )
+            print(f"  {'  (default, no fraction)':<26} basis={basis:<6} multiplier={mult.tolist()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+칼로리 테이블 로딩 벤치마크 (dict 리터럴 vs json.load vs mmap 바이너리)
+
+    python -m tools.bench_table_load                # data/food_table.json 그대로
+    python -m tools.bench_table_load --scale 50     # 항목을 50배로 늘린 합성 테이블
+
+  - literal: main.py 에 있던 방식 (거대한 dict 리터럴 소스를 compile + exec)
+  - json   : json.load 로 dict 생성
+  - mmap   : food_table.load_food_table (빌드된 .bin 을 mmap, 조회 시점에 필요한 페이지만 읽음)
+  - 모드마다 새 프로세스에서 측정: 로딩 시간, 모든 key 조회 시간, 늘어난 RSS / private 메모리
+    (private 는 워커끼리 공유할 수 없는 메모리 → 워커 수만큼 곱해짐)
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from food_table import compile_food_table, load_food_table, read_source
+
+
+def memory_kb() -> dict:
+    # Rss: 공유 페이지 포함, Private: 이 프로세스만 쓰는 페이지
+    out = {"rss": 0, "private": 0}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Rss:"):
+                    out["rss"] = int(line.split()[1])
+                elif line.startswith(("Private_Clean:", "Private_Dirty:")):
+                    out["private"] += int(line.split()[1])
+    except OSError:
+        pass
+    return out
+
+
+def write_sources(out_dir, source_path, scale):
+    entries = read_source(source_path)
+    table = {}
+    for i in range(scale):
+        suffix = f"_{i}" if i else ""
+        for key, entry in entries:
+            table[key + suffix] = entry
+
+    json_path = os.path.join(out_dir, "food_table.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "foods": [{"key": k, **v} for k, v in table.items()]}, f, ensure_ascii=False)
+
+    literal_path = os.path.join(out_dir, "food_table_literal.py")
+    with open(literal_path, "w", encoding="utf-8") as f:
+        f.write("CALORIE_TABLE_RAW = {\n")
+        for key, entry in table.items():
+            f.write(f"    {key!r}: {entry!r},\n")
+        f.write("}\n")
+
+    bin_path = os.path.join(out_dir, "food_table.bin")
+    compile_food_table(json_path, bin_path)
+    return {"json": json_path, "literal": literal_path, "bin": bin_path, "count": len(table)}
+
+
+def load_literal(paths):
+    with open(paths["literal"], encoding="utf-8") as f:
+        src = f.read()
+    scope = {}
+    exec(compile(src, paths["literal"], "exec"), scope)
+    return scope["CALORIE_TABLE_RAW"]
+
+
+def load_json(paths):
+    with open(paths["json"], encoding="utf-8") as f:
+        return {food.pop("key"): food for food in json.load(f)["foods"]}
+
+
+def load_mmap(paths):
+    return load_food_table(paths["json"], paths["bin"])
+
+
+MODES = {"literal": load_literal, "json": load_json, "mmap": load_mmap}
+
+
+def run_mode(mode, paths):
+    before = memory_kb()
+    t0 = time.perf_counter()
+    table = MODES[mode](paths)
+    load_ms = (time.perf_counter() - t0) * 1000.0
+
+    # 서버가 하는 일: key 로 조회해서 칼로리 읽기
+    keys = list(table)
+    t0 = time.perf_counter()
+    total = 0
+    for key in keys:
+        food = table[key]
+        total += food["calories"] if isinstance(food, dict) else food.calories
+    lookup_ms = (time.perf_counter() - t0) * 1000.0
+
+    after = memory_kb()
+    return {
+        "mode": mode,
+        "entries": len(keys),
+        "loadMs": round(load_ms, 2),
+        "lookupAllMs": round(lookup_ms, 2),
+        "rssMB": round((after["rss"] - before["rss"]) / 1024.0, 2),
+        "privateMB": round((after["private"] - before["private"]) / 1024.0, 2),
+        "checksum": total,
+    }
+
+
+def main():
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--source", default=os.path.join(here, "data", "food_table.json"))
+    parser.add_argument("--scale", type=int, default=1, help="항목 수 배율 (합성 key 추가)")
+    parser.add_argument("--mode", choices=sorted(MODES), help="(내부용) 한 모드만 측정하고 JSON 출력")
+    parser.add_argument("--paths", help="(내부용) 생성된 파일 경로 JSON")
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, json.loads(args.paths))))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_sources(tmp, args.source, max(1, args.scale))
+
+        rows = []
+        for mode in ("literal", "json", "mmap"):
+            cmd = [sys.executable, "-m", "tools.bench_table_load", "--mode", mode, "--paths", json.dumps(paths)]
+            out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+            rows.append(json.loads(out.strip().splitlines()[-1]))
+        bin_kb = os.path.getsize(paths["bin"]) / 1024.0
+
+    print(f"entries: {paths['count']} (scale x{args.scale}), .bin {bin_kb:.0f} KB")
+    print(f"{'mode':<8} {'load ms':>9} {'lookup ms':>10} {'+RSS MB':>8} {'+private MB':>12}")
+    for r in rows:
+        print(f"{r['mode']:<8} {r['loadMs']:>9} {r['lookupAllMs']:>10} {r['rssMB']:>8} {r['privateMB']:>12}")
+    if len({r["checksum"] for r in rows}) != 1:
+        sys.exit("checksum mismatch: 모드별 칼로리 합계가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+추적 모드(tracking.py) 벤치마크: YOLO 호출을 얼마나 줄이고 결과가 얼마나 달라지는지
+
+    python -m tools.bench_tracking --model yolov8n.pt                      # 샘플 사진으로 만든 합성 영상
+    python -m tools.bench_tracking --model yolov8n.pt clips/plate1 clips/plate2   # 프레임 폴더 (이름 순)
+
+  - 합성 영상: 사진 한 장을 천천히 이동(패닝) + 손떨림으로 자른 프레임, 중간에 다른 사진으로 장면 전환
+  - 기준: 모든 프레임에 YOLO (지금의 /ws/camera)
+  - 추적: 키프레임에만 YOLO, 나머지는 박스 이동 (/ws/camera?track=true)
+  - 프레임마다 기준 결과와 비교 (같은 클래스 + IoU >= 0.5 를 일치로 보는 F1, 총 칼로리 차이)
+    + 총 칼로리가 직전 프레임과 달라진 횟수 (깜빡임)
+"""
+import argparse
+import glob
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+from backends import load_backend
+from dedupe import iou_matrix
+from food_state import build_food_state
+from tracking import FrameTracker, frame_signature
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_clip(path):
+    files = sorted(f for f in glob.glob(os.path.join(path, "*")) if f.lower().endswith((".jpg", ".jpeg", ".png")))
+    return [np.asarray(Image.open(f).convert("RGB")) for f in files]
+
+
+def synthetic_clip(images, frames_per_scene=45, size=480, seed=0):
+    """사진마다 frames_per_scene 장: 대각선으로 천천히 이동 + 2px 정도 흔들림"""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for img in images:
+        h, w = img.shape[:2]
+        size_y, size_x = min(size, h), min(size, w)
+        span_x, span_y = w - size_x, h - size_y
+        for k in range(frames_per_scene):
+            t = k / max(1, frames_per_scene - 1)
+            x = int(np.clip(t * span_x * 0.5 + rng.normal(0, 2), 0, span_x))
+            y = int(np.clip(t * span_y * 0.5 + rng.normal(0, 2), 0, span_y))
+            frames.append(np.ascontiguousarray(img[y:y + size_y, x:x + size_x]))
+    return frames
+
+
+def match_f1(a_boxes, a_cls, b_boxes, b_cls, iou_thres=0.5):
+    if not len(a_cls) and not len(b_cls):
+        return 1.0
+    if not len(a_cls) or not len(b_cls):
+        return 0.0
+    ious = iou_matrix(a_boxes, b_boxes)
+    ious[a_cls[:, None] != b_cls[None, :]] = 0.0
+    matched = 0
+    used_a, used_b = set(), set()
+    for flat in np.argsort(-ious, axis=None).tolist():
+        i, j = divmod(flat, ious.shape[1])
+        if ious[i, j] < iou_thres:
+            break
+        if i in used_a or j in used_b:
+            continue
+        used_a.add(i), used_b.add(j)
+        matched += 1
+    return 2 * matched / (len(a_cls) + len(b_cls))
+
+
+def food_only(class_index, det, conf):
+    mask = class_index.food_mask(det.cls, det.conf, conf)
+    return det.xyxy[mask], det.cls[mask]
+
+
+def run_clip(backend, class_index, frames, args):
+    tracker = FrameTracker(
+        keyframe_interval=args.keyframe_interval, scene_threshold=args.scene_threshold, max_missed=args.max_missed
+    )
+    f1s, kcal_diff = [], []
+    flicker = {"baseline": 0, "tracking": 0}
+    last = {"baseline": None, "tracking": None}
+    track_ms = []
+    for frame in frames:
+        base = backend([frame])[0]
+        base_boxes, base_cls = food_only(class_index, base, args.conf)
+
+        t0 = time.perf_counter()
+        sig = frame_signature(frame)
+        keyframe = tracker.needs_keyframe(sig)
+        t_sig = time.perf_counter() - t0
+        if keyframe:
+            tracker.update(base, sig)  # 같은 프레임의 YOLO 결과를 그대로 씀 (호출 수만 셈)
+            track_ms.append(t_sig * 1000.0)
+        else:
+            t0 = time.perf_counter()
+            tracker.propagate(sig)
+            track_ms.append((t_sig + time.perf_counter() - t0) * 1000.0)
+        det, _ = tracker.current()
+        trk_boxes, trk_cls = food_only(class_index, det, args.conf)
+
+        f1s.append(match_f1(trk_boxes, trk_cls, base_boxes, base_cls))
+        totals = {"baseline": class_index.total_calories(base_cls), "tracking": class_index.total_calories(trk_cls)}
+        kcal_diff.append(abs(totals["tracking"] - totals["baseline"]))
+        for mode, total in totals.items():
+            if last[mode] is not None and total != last[mode]:
+                flicker[mode] += 1
+            last[mode] = total
+
+    return {
+        "frames": len(frames),
+        "detectorCalls": tracker.keyframes,
+        "f1": float(np.mean(f1s)),
+        "kcalDiff": float(np.mean(kcal_diff)),
+        "flicker": flicker,
+        "trackMs": float(np.mean(track_ms)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("clips", nargs="*", help="프레임 이미지 폴더 (없으면 샘플 사진으로 합성)")
+    parser.add_argument("--model", default="yolov8n.pt")
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--conf", type=float, default=0.35)
+    parser.add_argument("--keyframe-interval", type=int, default=10)
+    parser.add_argument("--scene-threshold", type=int, default=24)
+    parser.add_argument("--max-missed", type=int, default=2)
+    args = parser.parse_args()
+
+    backend = load_backend(args.backend, args.model)
+    class_index = build_food_state(
+        backend.names,
+        os.path.join(HERE, "data", "food_table.json"),
+        os.path.join(HERE, "data", "food_table.bin"),
+        aliases_path=os.path.join(HERE, "data", "food_aliases.json"),
+    ).class_index
+    backend.set_filter(classes=class_index.food_class_ids, conf=args.conf)
+
+    if args.clips:
+        clips = {os.path.basename(p.rstrip("/")): load_clip(p) for p in args.clips}
+    else:
+        from ultralytics.utils import ASSETS
+
+        samples = [np.asarray(Image.open(p).convert("RGB")) for p in sorted(glob.glob(os.path.join(str(ASSETS), "*.jpg")))]
+        clips = {"synthetic-pan": synthetic_clip(samples)}
+
+    print(f"{'clip':<16} {'frames':>6} {'yolo':>5} {'saved':>6} {'F1':>6} {'kcal diff':>9} {'flicker base/trk':>17} {'track ms':>9}")
+    for name, frames in clips.items():
+        r = run_clip(backend, class_index, frames, args)
+        saved = 1.0 - r["detectorCalls"] / max(1, r["frames"])
+        flicker = f"{r['flicker']['baseline']}/{r['flicker']['tracking']}"
+        print(
+            f"{name:<16} {r['frames']:>6} {r['detectorCalls']:>5} {saved * 100:>5.0f}% {r['f1']:>6.3f} "
+            f"{r['kcalDiff']:>9.1f} {flicker:>17} {r['trackMs']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
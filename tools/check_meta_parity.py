@@ -0,0 +1,122 @@
+"""
+점수 / 위험 / 추천 규칙 검증 (food_meta.FoodMeta vs JS buildMetaForFood 한 줄씩 옮긴 버전)
+
+    python -m tools.check_meta_parity
+
+  - 실제 테이블 전체 + 경계값 / 태그 조합으로 만든 합성 항목을 모두 비교
+  - 하나라도 다르면 차이를 출력하고 종료 코드 1
+"""
+import itertools
+import json
+import os
+import sys
+import tempfile
+
+from food_meta import FoodMeta
+from food_table import FoodTable, compile_food_table, read_source
+
+
+def build_meta_for_food(food: dict) -> dict:
+    """예전 main.py 의 JS buildMetaForFood 를 그대로 옮긴 기준 구현 (항목 하나씩)"""
+    kcal = food.get("calories") or 0
+    tags = food.get("tags") or []
+    category = food.get("category") or ""
+
+    if kcal <= 150:
+        health_score, score_label, risk_level, risk_label = 95, "초저칼로리", "LOW", "안심 메뉴"
+        summary, detail = "다이어트·간식용으로 아주 좋음", "배가 많이 고프지 않을 때 간단히 먹기 좋아요."
+    elif kcal <= 300:
+        health_score, score_label, risk_level, risk_label = 90, "가벼운 한 끼", "LOW", "부담 적음"
+        summary, detail = "자주 먹어도 큰 부담 없음", "샐러드·과일과 같이 먹으면 더 좋습니다."
+    elif kcal <= 500:
+        health_score, score_label, risk_level, risk_label = 75, "평균적인 한 끼", "MID", "적당한 칼로리"
+        summary, detail = "하루 1~2번 정도 무난", "야식보다는 점심·저녁 메인 메뉴로 추천."
+    elif kcal <= 800:
+        health_score, score_label, risk_level, risk_label = 60, "조금 높은 칼로리", "MID", "양·소스 주의"
+        summary, detail = "일주일에 2~3회 이내로", "국·소스·치즈 양을 줄이면 체감 칼로리를 줄일 수 있어요."
+    else:
+        health_score, score_label, risk_level, risk_label = 45, "고칼로리 폭탄", "HIGH", "체중·혈당 주의"
+        summary, detail = "가끔 특별한 날에만", "야채·샐러드와 같이 먹고, 다른 끼니는 가볍게 조절하는 것을 추천."
+
+    is_diet = (
+        "다이어트" in tags or "헬스" in tags or "저칼로리" in tags
+        or "샐러드" in category or "과일" in category
+    )
+    if is_diet:
+        health_score = min(100, health_score + 10)
+        if risk_level == "MID":
+            risk_level = "LOW"
+        score_label = "다이어트 친화 메뉴"
+        summary, detail = "다이어트·체중관리용으로 적합", "단백질·섬유질 위주 식단에 잘 어울립니다."
+
+    is_night_bomb = "야식폭탄" in tags or "위험한칼로리" in tags or "야식" in tags or "술안주" in tags
+    if is_night_bomb or category == "세트":
+        risk_level = "HIGH"
+        risk_label = "야식·고칼로리 주의"
+        health_score = min(health_score, 55)
+        if kcal >= 900:
+            summary, detail = "아주 가끔, 특별한 날에만", "취침 4시간 전에는 피하는 것을 강력 추천합니다."
+        else:
+            summary, detail = "주 1~2회 이하 권장", "가능하면 점심에 먹고, 저녁은 가볍게 맞춰 주세요."
+
+    if category == "과일" or "자연식" in tags:
+        risk_level = "LOW"
+        risk_label = "자연식 위주"
+        health_score = max(health_score, 85)
+        summary, detail = "간식·후식으로 좋음", "단, 당 조절이 필요하다면 하루 총 과일 양을 함께 관리해 주세요."
+
+    return {
+        "score": {"value": health_score, "label": score_label},
+        "risk": {"level": risk_level, "label": risk_label},
+        "recommend": {"summary": summary, "detail": detail},
+    }
+
+
+def synthetic_foods() -> list:
+    # 칼로리 구간 경계 × 카테고리 × 태그 조합
+    calories = [0, 1, 150, 151, 300, 301, 500, 501, 800, 801, 899, 900, 1500]
+    categories = ["밥", "샐러드", "과일", "과일샐러드", "세트", "디저트", ""]
+    tag_pool = ["다이어트", "헬스", "저칼로리", "야식폭탄", "위험한칼로리", "야식", "술안주", "자연식", "단백질"]
+    tag_sets = [[]] + [[t] for t in tag_pool] + [list(p) for p in itertools.combinations(tag_pool, 2)]
+
+    foods = []
+    for i, (kcal, cat, tags) in enumerate(itertools.product(calories, categories, tag_sets)):
+        foods.append(
+            {"key": f"syn_{i}", "foodName": "합성", "calories": kcal, "cuisine": "Test",
+             "category": cat, "portion": "1인분", "tags": tags}
+        )
+    return foods
+
+
+def main():
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    real = [{"key": k, **v} for k, v in read_source(os.path.join(here, "data", "food_table.json"))]
+    foods = {f["key"]: f for f in real + synthetic_foods()}  # 중복 key 는 뒤의 값 (테이블과 같은 규칙)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "foods.json")
+        with open(src, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "foods": list(foods.values())}, f, ensure_ascii=False)
+        out = os.path.join(tmp, "foods.bin")
+        compile_food_table(src, out)
+        table = FoodTable(out)
+        meta = FoodMeta(table)
+
+        mismatches = []
+        for row, key in enumerate(table):
+            got = meta.for_row(row)
+            want = build_meta_for_food(foods[key])
+            if got != want:
+                mismatches.append((key, foods[key], got, want))
+
+    print(f"checked {len(foods)} foods ({len({f['key'] for f in real})} from table, rest synthetic): {len(mismatches)} mismatches")
+    for key, food, got, want in mismatches[:10]:
+        print(f"  {key}: calories={food['calories']} category={food['category']!r} tags={food['tags']}")
+        print(f"    got : {got}")
+        print(f"    want: {want}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+PyTorch 가중치(.pt) → ONNX 변환
+
+    python -m tools.export_onnx yolov8n.pt            # → yolov8n.onnx (배치 크기 가변)
+    python -m tools.export_onnx yolov8n.pt --static   # 배치 1 고정
+
+서버에서 사용: SMARTCAL_BACKEND=onnx SMARTCAL_MODEL_PATH=yolov8n.onnx
+"""
+import argparse
+
+from backends import export_onnx
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("weights", nargs="?", default="yolov8n.pt")
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--static", action="store_true", help="배치 크기 1 로 고정해서 export")
+    args = parser.parse_args()
+
+    path = export_onnx(args.weights, imgsz=args.imgsz, dynamic=not args.static)
+    print(f"exported: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+INT8 정적 양자화 + 정확도 게이트
+
+    python -m tools.quantize yolov8n.pt --calib data/calib --holdout data/holdout
+    python -m tools.quantize yolov8n.onnx --calib data/calib --holdout data/holdout --min-map 0.92
+
+  1) .pt 면 먼저 float ONNX 로 export
+  2) calib 폴더의 음식 사진으로 activation 범위를 잡아서 INT8(QDQ) 양자화
+  3) holdout 폴더에서 float 모델 결과를 정답으로 두고 INT8 모델의 mAP@0.5 / 클래스 일치율 측정
+  4) mAP 가 --min-map 미만이거나, 비교할 정답 박스(float 결과 중 신뢰도 0.35 이상)가
+     --min-gt 개보다 적으면 승격 거부 (종료 코드 1, --out 파일을 만들지 않음)
+     통과하면 --out 에 모델을, <out>.report.json 에 측정 결과(promoted=true)와 모델 파일 해시를 저장
+     (서버는 해시가 다르면 로딩 거부 → 모델만 바꿔 끼워서 예전 승인을 재사용할 수 없음)
+
+서버에서 사용: SMARTCAL_BACKEND=onnx-int8 (기본 경로 yolov8n.int8.onnx)
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+from backends import OnnxBackend, box_iou, export_onnx, letterbox_batch, model_file_hash, quant_report_path
+from imaging import image_to_array, open_image_for_model
+
+IMAGE_PATTERNS = ("*.jpg", "*.jpeg", "*.png")
+
+
+def list_images(folder):
+    paths = []
+    for pattern in IMAGE_PATTERNS:
+        paths.extend(glob.glob(os.path.join(folder, "**", pattern), recursive=True))
+    return sorted(paths)
+
+
+def load_image(path, imgsz):
+    # 서버와 같은 디코딩 경로
+    with open(path, "rb") as f:
+        return image_to_array(open_image_for_model(f.read(), imgsz))
+
+
+class FolderCalibrationReader:
+    """onnxruntime CalibrationDataReader: 폴더 이미지를 한 장씩 letterbox 해서 넘겨줌"""
+
+    def __init__(self, paths, input_name, imgsz):
+        self._paths = iter(paths)
+        self._input_name = input_name
+        self._imgsz = imgsz
+
+    def get_next(self):
+        path = next(self._paths, None)
+        if path is None:
+            return None
+        batch, _ = letterbox_batch([load_image(path, self._imgsz)], self._imgsz)
+        return {self._input_name: batch}
+
+
+def quantize(float_path, out_path, calib_paths, imgsz, per_channel=True):
+    from onnxruntime.quantization import CalibrationMethod, QuantFormat, QuantType, quantize_static
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    input_name = OnnxBackend(float_path, imgsz=imgsz).input_name
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prep_path = os.path.join(tmp, "prep.onnx")
+        quant_pre_process(float_path, prep_path, skip_symbolic_shape=True)
+        quantize_static(
+            prep_path,
+            out_path,
+            FolderCalibrationReader(calib_paths, input_name, imgsz),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=per_channel,
+            calibrate_method=CalibrationMethod.MinMax,
+        )
+
+
+# -----------------------------
+# 정확도 측정: float 결과를 정답(GT)으로 두고 INT8 결과의 AP 계산
+# -----------------------------
+def average_precision(recall, precision):
+    # COCO 식 101 포인트 보간
+    mrec = np.concatenate(([0.0], recall, [1.0]))
+    mpre = np.concatenate(([1.0], precision, [0.0]))
+    mpre = np.flip(np.maximum.accumulate(np.flip(mpre)))
+    x = np.linspace(0, 1, 101)
+    trapezoid = getattr(np, "trapezoid", None) or np.trapz  # numpy 2.0 에서 이름 변경
+    return float(trapezoid(np.interp(x, mrec, mpre), x))
+
+
+def agreement_map(refs, tests, iou_thres=0.5, gt_conf=0.35):
+    """refs / tests: 이미지별 Detections 리스트 → (mAP, 클래스별 AP, 정답 박스 수)
+    정답 박스가 하나도 없으면 mAP 는 0.0 (측정 안 된 것을 통과로 보지 않음)"""
+    records = {}  # cls → [(conf, tp)]
+    n_gt = {}
+    for ref, test in zip(refs, tests):
+        gt_mask = ref.conf >= gt_conf
+        gt_boxes, gt_cls = ref.xyxy[gt_mask], ref.cls[gt_mask]
+        for c in gt_cls.tolist():
+            n_gt[c] = n_gt.get(c, 0) + 1
+
+        used = np.zeros(len(gt_cls), dtype=bool)
+        for i in np.argsort(-test.conf):
+            c = int(test.cls[i])
+            cand = (gt_cls == c) & ~used
+            tp = False
+            if cand.any():
+                ious = np.where(cand, box_iou(test.xyxy[i], gt_boxes), 0.0)
+                j = int(ious.argmax())
+                if ious[j] >= iou_thres:
+                    used[j] = True
+                    tp = True
+            records.setdefault(c, []).append((float(test.conf[i]), tp))
+
+    per_class = {}
+    for c, total in n_gt.items():
+        recs = sorted(records.get(c, []), key=lambda r: -r[0])
+        tp = np.array([r[1] for r in recs], dtype=np.float64)
+        if not len(tp):
+            per_class[c] = 0.0
+            continue
+        tpc = np.cumsum(tp)
+        fpc = np.cumsum(1.0 - tp)
+        per_class[c] = average_precision(tpc / total, tpc / (tpc + fpc))
+
+    mean_ap = float(np.mean(list(per_class.values()))) if per_class else 0.0
+    return mean_ap, per_class, sum(n_gt.values())
+
+
+def top_class_agreement(refs, tests, gt_conf=0.35):
+    """이미지별 '가장 확실한 클래스' 가 같은 비율 (비교한 이미지가 없으면 0.0)"""
+    same = total = 0
+    for ref, test in zip(refs, tests):
+        if not (ref.conf >= gt_conf).any():
+            continue
+        total += 1
+        if len(test.conf) and int(test.cls[test.conf.argmax()]) == int(ref.cls[ref.conf.argmax()]):
+            same += 1
+    return same / total if total else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("weights", nargs="?", default="yolov8n.pt", help=".pt 또는 float .onnx")
+    parser.add_argument("--calib", required=True, help="캘리브레이션용 음식 사진 폴더")
+    parser.add_argument("--holdout", required=True, help="정확도 측정용 사진 폴더 (calib 과 겹치지 않게)")
+    parser.add_argument("--out", default="yolov8n.int8.onnx")
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--calib-limit", type=int, default=200)
+    parser.add_argument("--min-map", type=float, default=float(os.getenv("SMARTCAL_QUANT_MIN_MAP", "0.9")))
+    parser.add_argument(
+        "--min-gt",
+        type=int,
+        default=int(os.getenv("SMARTCAL_QUANT_MIN_GT", "20")),
+        help="승격에 필요한 최소 정답 박스 수 (holdout 에서 float 모델이 신뢰도 0.35 이상으로 찾은 박스)",
+    )
+    parser.add_argument("--per-tensor", action="store_true", help="가중치를 채널별이 아닌 텐서 단위로 양자화")
+    args = parser.parse_args()
+
+    calib_paths = list_images(args.calib)[: args.calib_limit]
+    holdout_paths = list_images(args.holdout)
+    if not calib_paths or not holdout_paths:
+        sys.exit("calib / holdout 폴더에 이미지가 없습니다.")
+
+    float_path = args.weights
+    if float_path.endswith(".pt"):
+        float_path = export_onnx(float_path, imgsz=args.imgsz, dynamic=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        int8_tmp = os.path.join(tmp, "int8.onnx")
+        print(f"quantizing {float_path} with {len(calib_paths)} calibration images ...")
+        quantize(float_path, int8_tmp, calib_paths, args.imgsz, per_channel=not args.per_tensor)
+
+        float_backend = OnnxBackend(float_path, imgsz=args.imgsz, conf=0.001)
+        int8_backend = OnnxBackend(int8_tmp, imgsz=args.imgsz, conf=0.001)
+        refs, tests = [], []
+        for path in holdout_paths:
+            img = load_image(path, args.imgsz)
+            refs.append(float_backend([img])[0])
+            tests.append(int8_backend([img])[0])
+
+        map50, per_class, gt_boxes = agreement_map(refs, tests)
+        top1 = top_class_agreement(refs, tests)
+        promoted = gt_boxes >= max(1, args.min_gt) and map50 >= args.min_map
+
+        report = {
+            "source": os.path.abspath(float_path),
+            "calibImages": len(calib_paths),
+            "holdoutImages": len(holdout_paths),
+            "gtBoxes": gt_boxes,
+            "minGt": args.min_gt,
+            "map50": round(map50, 4),
+            "top1ClassAgreement": round(top1, 4),
+            "perClassAP50": {int(c): round(ap, 4) for c, ap in sorted(per_class.items())},
+            "minMap": args.min_map,
+            "promoted": promoted,
+        }
+        print(json.dumps({k: v for k, v in report.items() if k != "perClassAP50"}, indent=2))
+
+        if gt_boxes < max(1, args.min_gt):
+            print(
+                f"REFUSED: 정답 박스 {gt_boxes}개 < {args.min_gt} → 측정할 수 없음 "
+                f"(holdout 에 모델이 찾는 음식 사진을 더 넣어 주세요), {args.out} 를 만들지 않음"
+            )
+            sys.exit(1)
+        if not promoted:
+            print(f"REFUSED: mAP@0.5 {map50:.4f} < {args.min_map} → {args.out} 를 만들지 않음")
+            sys.exit(1)
+
+        shutil.move(int8_tmp, args.out)
+        report["modelSha256"] = model_file_hash(args.out)
+        with open(quant_report_path(args.out), "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"promoted: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+from collections import namedtuple
+
+import numpy as np
+from PIL import Image
+
+from backends import Detections
+from dedupe import iou_matrix
+from imaging import DHASH_BITS
+
+
+# -----------------------------
+# 카메라 프레임 추적 (모든 프레임에 YOLO 를 돌리지 않기)
+#   - 키프레임에만 YOLO 실행: N 프레임마다, 또는 장면이 바뀌었을 때
+#   - 키프레임 사이: 64x64 흑백 축소 이미지의 위상 상관(phase correlation)으로
+#     키프레임 대비 화면 전체 이동량 (dx, dy) 을 구해서 박스를 그만큼 옮김 (프레임당 1ms 미만)
+#       장면 변화 = 위상 상관 peak < min_peak (이동으로 설명이 안 됨)
+#                   또는 키프레임과 dHash 해밍 거리 > scene_threshold
+#       (dHash 는 카메라를 조금만 움직여도 10~20 비트씩 바뀌어서 보조 기준으로만 사용)
+#   - 키프레임에서 검출 ↔ 기존 트랙을 같은 클래스 + IoU 로 짝지음 (그리디)
+#       짝이 있으면 같은 트랙 ID 유지 (박스 / 신뢰도만 갱신)
+#       검출이 한두 번 빠져도 max_missed 키프레임까지는 트랙을 남겨 둠
+#       → 음식이 깜빡여도 칼로리가 빠졌다 다시 더해지지 않음
+#   - 장면이 바뀐 키프레임에서는 트랙을 모두 새로 시작
+# -----------------------------
+MOTION_SIZE = 64
+_WINDOW = np.outer(np.hanning(MOTION_SIZE), np.hanning(MOTION_SIZE)).astype(np.float32)
+
+# 프레임 하나에서 추적에 쓰는 정보: dHash, 움직임 추정용 축소 이미지, 원본 (높이, 너비)
+FrameSignature = namedtuple("FrameSignature", ["dhash", "thumb", "image_hw"])
+
+
+def frame_signature(arr: np.ndarray) -> FrameSignature:
+    """(H, W, 3) uint8 → FrameSignature (흑백 변환 / 축소 한 번에)"""
+    gray = Image.fromarray(arr).convert("L")
+    thumb_img = gray.resize((MOTION_SIZE, MOTION_SIZE), Image.BOX)
+    px = np.asarray(thumb_img.resize((9, 8), Image.BOX), dtype=np.int16)
+    dhash = int(DHASH_BITS[(px[:, 1:] > px[:, :-1]).ravel()].sum())
+
+    thumb = np.asarray(thumb_img, dtype=np.float32)
+    thumb = (thumb - thumb.mean()) * _WINDOW
+    return FrameSignature(dhash, thumb, arr.shape[:2])
+
+
+def estimate_shift(ref: np.ndarray, cur: np.ndarray):
+    """축소 이미지 ref → cur 이동량 (dx, dy, 신뢰도 peak). dx, dy 는 축소 이미지 픽셀 단위"""
+    cross = np.fft.rfft2(cur) * np.conj(np.fft.rfft2(ref))
+    cross /= np.abs(cross) + 1e-9
+    corr = np.fft.irfft2(cross, s=ref.shape)
+    peak = int(corr.argmax())
+    dy, dx = divmod(peak, corr.shape[1])
+    # 절반 넘게 움직인 것은 반대 방향으로 (FFT 는 순환)
+    if dy > corr.shape[0] // 2:
+        dy -= corr.shape[0]
+    if dx > corr.shape[1] // 2:
+        dx -= corr.shape[1]
+    return dx, dy, float(corr.flat[peak])
+
+
+class FrameTracker:
+    def __init__(
+        self, keyframe_interval: int = 10, scene_threshold: int = 24, iou_thres: float = 0.3,
+        max_missed: int = 2, min_peak: float = 0.2,
+    ):
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.scene_threshold = scene_threshold
+        self.iou_thres = iou_thres
+        self.max_missed = max_missed
+        self.min_peak = min_peak
+
+        # 트랙 (T개): 박스는 현재 프레임 좌표
+        self.boxes = np.zeros((0, 4), dtype=np.float32)
+        self.conf = np.zeros(0, dtype=np.float32)
+        self.cls = np.zeros(0, dtype=np.int64)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.missed = np.zeros(0, dtype=np.int64)
+        self._next_id = 1
+
+        self._key = None        # 마지막 키프레임의 FrameSignature
+        self._key_boxes = self.boxes  # 마지막 키프레임 좌표의 트랙 박스 (이동량은 항상 여기서부터)
+        self._since_key = 0
+        self._scene_changed = False
+        self._shift = None      # needs_keyframe 에서 구한 이번 프레임 이동량 (propagate 에서 사용)
+        self.frames = 0
+        self.keyframes = 0
+
+    # --- 키프레임 판단 ---
+    def needs_keyframe(self, sig: FrameSignature) -> bool:
+        if self._key is None:
+            return True
+        # 간격 때문에 키프레임이 되는 프레임도 장면 변화는 확인 (컷이 간격 프레임에 걸려도 트랙을 새로 시작)
+        dx, dy, peak = self._shift = estimate_shift(self._key.thumb, sig.thumb)
+        if peak < self.min_peak or (sig.dhash ^ self._key.dhash).bit_count() > self.scene_threshold:
+            self._scene_changed = True
+            return True
+        return self._since_key + 1 >= self.keyframe_interval
+
+    # --- 키프레임: 검출 결과로 트랙 갱신 ---
+    def update(self, detections: Detections, sig: FrameSignature):
+        if self._scene_changed:
+            self._reset_tracks()
+
+        det_boxes = np.asarray(detections.xyxy, dtype=np.float32).reshape(-1, 4)
+        det_cls = np.asarray(detections.cls, dtype=np.int64)
+        det_conf = np.asarray(detections.conf, dtype=np.float32)
+
+        # 같은 클래스끼리만 IoU 비교, 큰 IoU 부터 그리디로 짝짓기
+        ious = iou_matrix(self.boxes, det_boxes)
+        ious[self.cls[:, None] != det_cls[None, :]] = 0.0
+        track_matched = np.zeros(len(self.ids), dtype=bool)
+        det_matched = np.zeros(len(det_cls), dtype=bool)
+        if ious.size:
+            for flat in np.argsort(-ious, axis=None).tolist():
+                t, d = divmod(flat, ious.shape[1])
+                if ious[t, d] < self.iou_thres:
+                    break
+                if track_matched[t] or det_matched[d]:
+                    continue
+                track_matched[t] = det_matched[d] = True
+                self.boxes[t] = det_boxes[d]
+                self.conf[t] = det_conf[d]
+
+        # 짝 없는 트랙은 missed 증가 (max_missed 넘으면 제거), 짝 없는 검출은 새 트랙
+        self.missed = np.where(track_matched, 0, self.missed + 1)
+        alive = self.missed <= self.max_missed
+        new = ~det_matched
+        new_ids = np.arange(self._next_id, self._next_id + int(new.sum()), dtype=np.int64)
+        self._next_id += len(new_ids)
+
+        self.boxes = np.concatenate([self.boxes[alive], det_boxes[new]])
+        self.conf = np.concatenate([self.conf[alive], det_conf[new]])
+        self.cls = np.concatenate([self.cls[alive], det_cls[new]])
+        self.ids = np.concatenate([self.ids[alive], new_ids])
+        self.missed = np.concatenate([self.missed[alive], np.zeros(len(new_ids), dtype=np.int64)])
+
+        self._key = sig
+        self._key_boxes = self.boxes.copy()
+        self._since_key = 0
+        self._scene_changed = False
+        self.frames += 1
+        self.keyframes += 1
+
+    # --- 키프레임 사이: 화면 이동량만큼 박스 이동 ---
+    def propagate(self, sig: FrameSignature):
+        """needs_keyframe(sig) 가 False 였던 프레임에서 호출"""
+        self.frames += 1
+        self._since_key += 1
+        dx, dy, _ = self._shift
+        h, w = sig.image_hw
+        shift_x, shift_y = dx * w / MOTION_SIZE, dy * h / MOTION_SIZE
+        boxes = self._key_boxes + np.array([shift_x, shift_y, shift_x, shift_y], dtype=np.float32)
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, w)
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, h)
+        self.boxes = boxes
+
+    def current(self):
+        """지금 보이는 트랙 → (Detections, 트랙 ID 배열)"""
+        return Detections(self.boxes.copy(), self.conf.copy(), self.cls.copy()), self.ids.copy()
+
+    def _reset_tracks(self):
+        self.boxes = np.zeros((0, 4), dtype=np.float32)
+        self.conf = np.zeros(0, dtype=np.float32)
+        self.cls = np.zeros(0, dtype=np.int64)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.missed = np.zeros(0, dtype=np.int64)
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "keyframes": self.keyframes,
+            "tracks": len(self.ids),
+        }